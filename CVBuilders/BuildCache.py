@@ -0,0 +1,212 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Content-addressed cache of the built CV PDFs.
+# A cache entry is keyed by the hash of the rendered data files, the template sources and the make variables.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import fnmatch, hashlib, json, os, shutil, subprocess, tempfile, threading, time
+
+BUILD_CACHE_DEFAULT_MAX_SIZE_MB = 500
+BUILD_CACHE_DEFAULT_MAX_AGE_DAYS = 30
+BUILD_CACHE_MANIFEST_FILE = "manifest.json"
+BUILD_CACHE_PDFS_DIR = "pdfs"
+# Files which affect the built PDFs, LaTeX intermediates and outputs are left out
+TEMPLATE_SOURCE_PATTERNS = ["*.tex", "*.cls", "*.sty", "*.bib", "*.bst", "Makefile", "makefile", "GNUmakefile", "*.mk",
+                            "*.png", "*.jpg", "*.jpeg", "*.svg", "*.eps", "*.pdf"]
+
+def isTemplateSourceFile(relativePath: str) -> bool:
+    return any(fnmatch.fnmatch(os.path.basename(relativePath), pattern) for pattern in TEMPLATE_SOURCE_PATTERNS)
+
+def listTemplateFiles(cv_dir: str) -> list[str]:
+    """List the files of the CV Templates directory which are not ignored by git.
+    Without git all files are listed except the PDFs, which cannot be told apart from the previous build outputs.
+
+    Args:
+        cv_dir (str): path to the CV Templates directory
+
+    Returns:
+        list[str]: paths relative to cv_dir
+    """
+    try:
+        files = subprocess.check_output(["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                                        cwd=cv_dir, stderr=subprocess.DEVNULL, text=True)
+        return [os.path.normpath(file) for file in files.split("\0") if file]
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    relativePaths = []
+    for directory, directories, files in os.walk(cv_dir):
+        directories[:] = [d for d in directories if not d.startswith(".")]
+        relativePaths += [os.path.relpath(os.path.join(directory, file), cv_dir) for file in files if not file.endswith(".pdf")]
+    return relativePaths
+
+def computeTemplateDigest(cv_dir: str, excludedFiles: list[str] = ()) -> str:
+    """Hash the template sources of the CV Templates directory, see TEMPLATE_SOURCE_PATTERNS.
+
+    Args:
+        cv_dir (str): path to the CV Templates directory
+        excludedFiles (list[str], optional): paths relative to cv_dir to skip, e.g. the generated data files
+
+    Returns:
+        str: hex digest of the template sources
+    """
+    digest = hashlib.sha256()
+    excludedFiles = {os.path.normpath(file) for file in excludedFiles}
+    for relativePath in sorted(listTemplateFiles(cv_dir)):
+        path = os.path.join(cv_dir, relativePath)
+        if relativePath in excludedFiles or not isTemplateSourceFile(relativePath) or not os.path.isfile(path):
+            continue
+        digest.update(relativePath.encode() + b"\0")
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+class BuildCache:
+    """Content-addressed cache of built PDFs stored in a local directory.
+    Entries are evicted when older than the maximum age or, least recently used first, when the cache exceeds the maximum size.
+    """
+    def __init__(self, cacheDir: str, maxSizeMB: int = BUILD_CACHE_DEFAULT_MAX_SIZE_MB, maxAgeDays: int = BUILD_CACHE_DEFAULT_MAX_AGE_DAYS):
+        """Create a build cache.
+
+        Args:
+            cacheDir (str): path to the cache directory, created if needed
+            maxSizeMB (int, optional): maximum total size of cached PDFs. Defaults to BUILD_CACHE_DEFAULT_MAX_SIZE_MB.
+            maxAgeDays (int, optional): maximum age of an unused entry. Defaults to BUILD_CACHE_DEFAULT_MAX_AGE_DAYS.
+        """
+        self.cacheDir = cacheDir
+        self.maxSizeBytes = maxSizeMB * 1024 * 1024
+        self.maxAgeSeconds = maxAgeDays * 24 * 60 * 60
+        self.templateDigests = {}
+        self.lock = threading.Lock()
+        os.makedirs(self.cacheDir, exist_ok=True)
+
+    def getTemplateDigest(self, cv_dir: str, excludedFiles: list[str] = ()) -> str:
+        """Hash the template sources once per run.
+        """
+        key = (os.path.abspath(cv_dir), tuple(excludedFiles))
+        with self.lock:
+            if key not in self.templateDigests:
+                self.templateDigests[key] = computeTemplateDigest(cv_dir, excludedFiles)
+            return self.templateDigests[key]
+
+    def computeKey(self, templateDigest: str, dataFilesContent: list[str], makeVariables: dict) -> str:
+        """Compute the cache key of a build.
+
+        Args:
+            templateDigest (str): digest of the template sources
+            dataFilesContent (list[str]): content of the generated data files, e.g. 12_recipients.tex and 04_skills.tex
+            makeVariables (dict): make variables which affect the build, without the timestamp
+
+        Returns:
+            str: cache key
+        """
+        digest = hashlib.sha256(templateDigest.encode())
+        for content in dataFilesContent:
+            digest.update(b"\0" + hashlib.sha256(content.encode()).digest())
+        digest.update(json.dumps(makeVariables, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def entryDir(self, key: str) -> str:
+        return os.path.join(self.cacheDir, key[:2], key)
+
+    def restore(self, key: str, out_dir: str, timestamp: str) -> list[str]:
+        """Copy the cached PDFs to the output directory.
+        File names are updated to the current timestamp if the cached entry was built with another one.
+
+        Args:
+            key (str): cache key
+            out_dir (str): output directory, i.e. the CV Templates directory
+            timestamp (str): current build timestamp
+
+        Returns:
+            list[str]: paths of the restored PDFs, None on a cache miss
+        """
+        entryDir = self.entryDir(key)
+        manifestFile = os.path.join(entryDir, BUILD_CACHE_MANIFEST_FILE)
+        try:
+            with open(manifestFile, "r") as f:
+                manifest = json.load(f)
+            restoredPDFs = []
+            for pdf in manifest["files"]:
+                destination = os.path.join(out_dir, pdf.replace(manifest["timestamp"], timestamp))
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                shutil.copyfile(os.path.join(entryDir, BUILD_CACHE_PDFS_DIR, pdf), destination)
+                restoredPDFs.append(destination)
+        except (OSError, ValueError, KeyError):
+            return None
+        # Mark the entry as recently used
+        os.utime(manifestFile)
+        return restoredPDFs
+
+    def store(self, key: str, out_dir: str, pdfs: list[str], timestamp: str):
+        """Store the built PDFs in the cache and evict old entries.
+
+        Args:
+            key (str): cache key
+            out_dir (str): output directory the PDFs were built in
+            pdfs (list[str]): paths of the built PDFs
+            timestamp (str): build timestamp used in the PDF file names
+        """
+        if not pdfs:
+            return
+        entryDir = self.entryDir(key)
+        os.makedirs(os.path.dirname(entryDir), exist_ok=True)
+        # Populate a temporary directory first, so concurrent builds never see a partial entry
+        temporaryDir = tempfile.mkdtemp(prefix=f".{key}_", dir=os.path.dirname(entryDir))
+        files = []
+        for pdf in pdfs:
+            relativePath = os.path.relpath(pdf, out_dir)
+            destination = os.path.join(temporaryDir, BUILD_CACHE_PDFS_DIR, relativePath)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            shutil.copyfile(pdf, destination)
+            files.append(relativePath)
+        with open(os.path.join(temporaryDir, BUILD_CACHE_MANIFEST_FILE), "w") as f:
+            json.dump({"timestamp": timestamp, "files": files}, f)
+        try:
+            os.rename(temporaryDir, entryDir)
+        except OSError:
+            # Entry already stored by another build
+            shutil.rmtree(temporaryDir, ignore_errors=True)
+        self.evict()
+
+    def evict(self):
+        """Remove entries older than the maximum age, then the least recently used ones until the size limit is met.
+        """
+        with self.lock:
+            entries = []
+            for prefixDir in os.listdir(self.cacheDir):
+                prefixPath = os.path.join(self.cacheDir, prefixDir)
+                if not os.path.isdir(prefixPath):
+                    continue
+                for key in os.listdir(prefixPath):
+                    entryDir = os.path.join(prefixPath, key)
+                    manifestFile = os.path.join(entryDir, BUILD_CACHE_MANIFEST_FILE)
+                    if key.startswith(".") or not os.path.isfile(manifestFile):
+                        continue
+                    size = sum(os.path.getsize(os.path.join(directory, file))
+                                for directory, _, files in os.walk(entryDir) for file in files)
+                    entries.append((os.path.getmtime(manifestFile), size, entryDir))
+            entries.sort()
+            totalSize = sum(size for _, size, _ in entries)
+            now = time.time()
+            for lastUsed, size, entryDir in entries:
+                if now - lastUsed <= self.maxAgeSeconds and totalSize <= self.maxSizeBytes:
+                    break
+                shutil.rmtree(entryDir, ignore_errors=True)
+                totalSize -= size
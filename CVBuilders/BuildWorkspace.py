@@ -0,0 +1,140 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Isolated per-job copies of the CV Templates directory, used to build CVs in parallel.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import os, shutil, subprocess, tempfile
+
+# Files which are not copied into a workspace: VCS data and LaTeX intermediate files.
+# PDF files are copied, they may be assets of the template, e.g. a photo or a signature included with \includegraphics.
+WORKSPACE_IGNORED_PATTERNS = [".git", "*.aux", "*.log", "*.out", "*.toc", "*.fls", "*.fdb_latexmk", "*.synctex.gz"]
+WORKSPACE_PREFIX = "auto_cv_build_"
+
+def snapshotPDFs(directory: str) -> dict[str, int]:
+    """Find PDF files in the directory tree.
+
+    Args:
+        directory (str): directory to search in
+
+    Returns:
+        dict[str, int]: PDF paths relative to the directory mapped to their modification times in ns
+    """
+    pdfs = {}
+    for root, directories, files in os.walk(directory):
+        directories[:] = [d for d in directories if d != ".git"]
+        for file in files:
+            if file.lower().endswith(".pdf"):
+                path = os.path.join(root, file)
+                pdfs[os.path.relpath(path, directory)] = os.stat(path).st_mtime_ns
+    return pdfs
+
+def findBuiltPDFs(directory: str, snapshotBefore: dict[str, int]) -> list[str]:
+    """Find PDF files created or modified since the snapshot.
+
+    Args:
+        directory (str): directory to search in
+        snapshotBefore (dict[str, int]): snapshotPDFs() result taken before the build
+
+    Returns:
+        list[str]: paths of the built PDF files
+    """
+    return [os.path.join(directory, pdf) for pdf, modificationTime in sorted(snapshotPDFs(directory).items())
+            if snapshotBefore.get(pdf) != modificationTime]
+
+def findIgnoredPDFs(cv_dir: str) -> set[str]:
+    """Find the PDF files ignored by git in the CV Templates directory, i.e. the CVs built before, not the template assets.
+
+    Args:
+        cv_dir (str): path to the CV Templates directory
+
+    Returns:
+        set[str]: absolute paths of the ignored PDF files, empty if cv_dir is not a git work tree
+    """
+    try:
+        ignoredFiles = subprocess.check_output(["git", "ls-files", "-z", "--others", "--ignored", "--exclude-standard", "--", "*.pdf"],
+                                                cwd=cv_dir, stderr=subprocess.DEVNULL, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return set()
+    return {os.path.abspath(os.path.join(cv_dir, path)) for path in ignoredFiles.split("\0") if path}
+
+class BuildWorkspace:
+    """Temporary copy of the CV Templates directory. Use as a context manager, the copy is removed on exit.
+    """
+    def __init__(self, cv_dir: str, workspaceRoot: str = None):
+        """Create a build workspace.
+
+        Args:
+            cv_dir (str): path to the CV Templates directory, used as a read-only template
+            workspaceRoot (str, optional): directory to create workspaces in. Defaults to the system temporary directory.
+        """
+        self.cv_dir = cv_dir
+        self.workspaceRoot = workspaceRoot
+        self.root = None
+        self.templatePDFs = {}
+
+    def __enter__(self):
+        self.root = tempfile.mkdtemp(prefix=WORKSPACE_PREFIX, dir=self.workspaceRoot)
+        # copytree() requires a non-existing destination
+        templateCopy = os.path.join(self.root, "cv")
+        ignoredPatterns = shutil.ignore_patterns(*WORKSPACE_IGNORED_PATTERNS)
+        builtPDFs = findIgnoredPDFs(self.cv_dir)
+
+        def ignoreFiles(directory: str, files: list[str]) -> set[str]:
+            return ignoredPatterns(directory, files) | {file for file in files if os.path.abspath(os.path.join(directory, file)) in builtPDFs}
+
+        shutil.copytree(self.cv_dir, templateCopy, symlinks=True, ignore=ignoreFiles)
+        self.root = templateCopy
+        # PDF assets copied with the template are not collected as built PDFs
+        self.templatePDFs = snapshotPDFs(self.root)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        shutil.rmtree(os.path.dirname(self.root), ignore_errors=True)
+        return False
+
+    def path(self, *relativePath: str) -> str:
+        return os.path.join(self.root, *relativePath)
+
+    def findPDFs(self) -> list[str]:
+        """Find PDF files built in the workspace, the PDF files copied with the template are skipped unless rebuilt.
+
+        Returns:
+            list[str]: PDF paths relative to the workspace root
+        """
+        return [os.path.relpath(pdf, self.root) for pdf in findBuiltPDFs(self.root, self.templatePDFs)]
+
+    def collectPDFs(self, out_dir: str = None) -> list[str]:
+        """Copy the built PDF files to the same relative paths in the output directory.
+
+        Args:
+            out_dir (str, optional): output directory. Defaults to the CV Templates directory.
+
+        Returns:
+            list[str]: paths of the collected PDF files
+        """
+        if out_dir is None:
+            out_dir = self.cv_dir
+        collectedPDFs = []
+        for pdf in self.findPDFs():
+            destination = os.path.join(out_dir, pdf)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            shutil.copy2(self.path(pdf), destination)
+            collectedPDFs.append(destination)
+        return collectedPDFs
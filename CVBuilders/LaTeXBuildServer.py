@@ -0,0 +1,429 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Warm LaTeX build server. The shared CV preamble is precompiled once per template revision into a format file
+# with mylatexformat, resident worker processes keep their own workspace and build the CVs of the jobs sent over a queue.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import hashlib, multiprocessing, os, queue, re, shutil, signal, subprocess, sys, threading, time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from .BuildWorkspace import BuildWorkspace, snapshotPDFs, findBuiltPDFs
+from .BuildCache import computeTemplateDigest
+from Utils.Logging.LogHandler import getLogger
+from Utils.Metrics.Instrumentation import instrumentation, STAGE_PREAMBLE_FORMAT
+
+logger = getLogger(__name__)
+
+BUILD_SERVER_DEFAULT_FORMATS_DIR = os.path.join(".cache", "formats")
+LATEX_ENGINE = "pdflatex"
+FORMAT_NAME_PREFIX = "autocv_"
+FORMAT_BUILD_TIMEOUT = 300
+# mylatexformat dumps the preamble up to \begin{document} or \endofdump, the rest of the preamble is read on every run
+LATEX_BEGIN_DOCUMENT = "\\begin{document}"
+LATEX_END_OF_DUMP = "\\endofdump"
+LATEX_DOCUMENT_CLASS_PATTERN = re.compile(r"^\s*\\documentclass", re.MULTILINE)
+LATEX_FORMAT_LINE_PATTERN = re.compile(r"\A%&\S*\n")
+# Maximum time in seconds of the gmake run building the CV of one job
+BUILD_SERVER_DEFAULT_TIMEOUT = 600
+# Time in seconds a worker gets past the build timeout before it is terminated and respawned, and to stop on shutdown
+BUILD_SERVER_TERMINATE_GRACE = 10
+# Interval in seconds of the worker liveness checks
+BUILD_SERVER_POLL_INTERVAL = 1
+# Workers respawned at most that many times per server, e.g. a worker failing to set up its workspace is not respawned forever
+BUILD_SERVER_MAX_RESPAWNS = 10
+# Exit code reported for a gmake run killed on timeout
+BUILD_TIMED_OUT_EXIT_CODE = -9
+# Queue item stopping a worker
+BUILD_SERVER_STOP = None
+# First item of the result queue message sent by a worker when it starts a task
+BUILD_SERVER_TASK_STARTED = "started"
+
+def findMainTexFiles(cv_dir: str) -> list[str]:
+    """Find the LaTeX documents in the top directory of the CV Templates.
+
+    Returns:
+        list[str]: names of the .tex files with a \\documentclass
+    """
+    mainFiles = []
+    for file in sorted(os.listdir(cv_dir)):
+        if file.endswith(".tex") and os.path.isfile(os.path.join(cv_dir, file)):
+            with open(os.path.join(cv_dir, file), "r") as f:
+                if LATEX_DOCUMENT_CLASS_PATTERN.search(f.read()):
+                    mainFiles.append(file)
+    return mainFiles
+
+def getFormatName(mainFile: str) -> str:
+    return FORMAT_NAME_PREFIX + re.sub(r"\W", "_", os.path.splitext(mainFile)[0])
+
+def insertEndOfDump(texContent: str, dataFiles: list[str]) -> str:
+    """Stop the preamble dump before the first per-job data file is loaded, so the data files are never baked into the format.
+
+    Args:
+        texContent (str): main LaTeX document
+        dataFiles (list[str]): paths of the per-job data files relative to the CV Templates directory
+
+    Returns:
+        str: document with \\endofdump inserted, None if the document has no \\begin{document}
+    """
+    beginDocument = texContent.find(LATEX_BEGIN_DOCUMENT)
+    if beginDocument < 0:
+        return None
+    if LATEX_END_OF_DUMP in texContent[:beginDocument]:
+        return texContent
+    dataFileNames = [os.path.splitext(os.path.basename(file))[0] for file in dataFiles]
+    endOfDump = beginDocument
+    for match in re.finditer(r"^.*(" + "|".join(map(re.escape, dataFileNames)) + r").*$", texContent[:beginDocument], re.MULTILINE):
+        if not match[0].lstrip().startswith("%"):
+            endOfDump = match.start()
+            break
+    return texContent[:endOfDump] + LATEX_END_OF_DUMP + "\n" + texContent[endOfDump:]
+
+def setFormatLine(texContent: str, formatName: str) -> str:
+    """Make pdflatex load the precompiled format through the %& first line.
+    """
+    return f"%&{formatName}\n" + LATEX_FORMAT_LINE_PATTERN.sub("", texContent, count=1)
+
+def getFormatsEnvironment(formatDir: str) -> dict:
+    # The trailing separator keeps the default format search path
+    environment = dict(os.environ)
+    environment["TEXFORMATS"] = formatDir + os.pathsep + environment.get("TEXFORMATS", "")
+    return environment
+
+def prepareWorkspace(workspaceDir: str, mainFiles: list[str], dataFiles: list[str], formatDir: str = None) -> list[str]:
+    """Insert \\endofdump into the main documents of a workspace. If formatDir is given, only the documents with a precompiled
+    format are modified and set to load it, \\endofdump is defined by mylatexformat only.
+
+    Returns:
+        list[str]: modified main documents
+    """
+    preparedFiles = []
+    for mainFile in mainFiles:
+        if formatDir is not None and not os.path.isfile(os.path.join(formatDir, getFormatName(mainFile) + ".fmt")):
+            continue
+        path = os.path.join(workspaceDir, mainFile)
+        with open(path, "r") as f:
+            texContent = insertEndOfDump(f.read(), dataFiles)
+        if texContent is None:
+            continue
+        if formatDir is not None:
+            texContent = setFormatLine(texContent, getFormatName(mainFile))
+        with open(path, "w") as f:
+            f.write(texContent)
+        preparedFiles.append(mainFile)
+    return preparedFiles
+
+def getEngineVersion() -> str:
+    try:
+        return subprocess.run([LATEX_ENGINE, "--version"], capture_output=True, text=True).stdout.split("\n", 1)[0]
+    except OSError:
+        return None
+
+def buildPreambleFormats(cv_dir: str, dataFiles: list[str], formatsDir: str) -> str:
+    """Precompile the preambles of the main documents, once per template revision and engine version.
+
+    Args:
+        cv_dir (str): path to the CV Templates directory
+        dataFiles (list[str]): per-job data files relative to cv_dir, excluded from the template revision
+        formatsDir (str): directory of the precompiled formats
+
+    Returns:
+        str: directory with the format files of the current template revision, None if the formats cannot be built
+    """
+    engineVersion = getEngineVersion()
+    if engineVersion is None:
+        logger.warning(f"{LATEX_ENGINE} not found, building without a precompiled preamble.")
+        return None
+    revision = hashlib.sha256((computeTemplateDigest(cv_dir, dataFiles) + engineVersion).encode()).hexdigest()[:16]
+    formatDir = os.path.abspath(os.path.join(formatsDir, revision))
+    mainFiles = findMainTexFiles(cv_dir)
+    if os.path.isdir(formatDir):
+        logger.info(f"Reusing the precompiled preamble of the template revision {revision}.")
+        return formatDir
+    temporaryFormatDir = formatDir + ".tmp"
+    os.makedirs(temporaryFormatDir, exist_ok=True)
+    with instrumentation.timer(STAGE_PREAMBLE_FORMAT), BuildWorkspace(cv_dir) as workspace:
+        for mainFile in prepareWorkspace(workspace.root, mainFiles, dataFiles):
+            logger.info(f"Precompiling the preamble of {mainFile}...")
+            cmd = [LATEX_ENGINE, "-ini", "-interaction=nonstopmode", f"-jobname={getFormatName(mainFile)}",
+                   f"-output-directory={temporaryFormatDir}", f"&{LATEX_ENGINE}", "mylatexformat.ltx", mainFile]
+            try:
+                result = subprocess.run(cmd, cwd=workspace.root, capture_output=True, text=True, timeout=FORMAT_BUILD_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                result = None
+            if result is None or result.returncode != 0:
+                logger.warning(f"Failed to precompile the preamble of {mainFile}, it is built without a precompiled preamble."
+                               + (f"\n{result.stdout[-2000:]}" if result is not None else ""))
+                formatFile = os.path.join(temporaryFormatDir, getFormatName(mainFile) + ".fmt")
+                if os.path.exists(formatFile):
+                    os.remove(formatFile)
+    shutil.rmtree(formatDir, ignore_errors=True)
+    os.replace(temporaryFormatDir, formatDir)
+    return formatDir
+
+def runBuildWorker(cv_dir: str, dataFiles: list[str], formatDir: str, tasks, results, buildTimeout: float = BUILD_SERVER_DEFAULT_TIMEOUT):
+    """Resident build worker. Builds the CVs of the received jobs in its own workspace, kept warm between the jobs.
+
+    Args:
+        cv_dir (str): path to the CV Templates directory
+        dataFiles (list[str]): per-job data files relative to cv_dir
+        formatDir (str): directory of the precompiled formats, None to build without them
+        tasks (multiprocessing.Queue): (task id, data files content, make variables, output directory) tuples
+        results (multiprocessing.Queue): (task id, built PDFs, exit code, output) tuples,
+                                        and (BUILD_SERVER_TASK_STARTED, task id, worker pid) tuples
+        buildTimeout (float, optional): maximum time in seconds of a gmake run. Defaults to BUILD_SERVER_DEFAULT_TIMEOUT.
+    """
+    runningBuild = None
+
+    def stopWorker(signalNumber, frame):
+        # Terminated by the server, kill the running gmake with the pdflatex it started and remove the workspace
+        if runningBuild is not None and runningBuild.poll() is None:
+            os.killpg(runningBuild.pid, signal.SIGKILL)
+        sys.exit(1)
+
+    signal.signal(signal.SIGTERM, stopWorker)
+    with BuildWorkspace(cv_dir) as workspace:
+        environment = None
+        if formatDir is not None and prepareWorkspace(workspace.root, findMainTexFiles(workspace.root), dataFiles, formatDir):
+            environment = getFormatsEnvironment(formatDir)
+        while True:
+            task = tasks.get()
+            if task is BUILD_SERVER_STOP:
+                return
+            taskId, dataFilesContent, makeVariables, out_dir = task
+            results.put((BUILD_SERVER_TASK_STARTED, taskId, os.getpid()))
+            try:
+                for dataFile, content in dataFilesContent.items():
+                    with open(workspace.path(dataFile), "w") as f:
+                        f.write(content)
+                pdfsBefore = snapshotPDFs(workspace.root)
+                cmd = ["gmake", "all"] + [f"{name}={value}" for name, value in makeVariables.items()]
+                # gmake runs in its own process group, so a hung pdflatex is killed with it
+                runningBuild = subprocess.Popen(cmd, cwd=workspace.root, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                                env=environment, start_new_session=True)
+                try:
+                    stdout, stderr = runningBuild.communicate(timeout=buildTimeout)
+                    returnCode = runningBuild.returncode
+                except subprocess.TimeoutExpired:
+                    os.killpg(runningBuild.pid, signal.SIGKILL)
+                    stdout, stderr = runningBuild.communicate()
+                    returnCode = BUILD_TIMED_OUT_EXIT_CODE
+                    stderr += f"\ngmake timed out after {buildTimeout} s."
+                finally:
+                    runningBuild = None
+                collectedPDFs = []
+                # PDFs left behind by a failed build may be partial, they are not copied
+                for pdf in findBuiltPDFs(workspace.root, pdfsBefore) if returnCode == 0 else []:
+                    destination = os.path.join(out_dir, os.path.relpath(pdf, workspace.root))
+                    os.makedirs(os.path.dirname(destination), exist_ok=True)
+                    shutil.copy2(pdf, destination)
+                    collectedPDFs.append(destination)
+                results.put((taskId, collectedPDFs, returnCode, stdout[-2000:] + stderr[-2000:]))
+            except Exception as e:
+                results.put((taskId, [], -1, f"{type(e).__name__}: {e}"))
+
+class LaTeXBuildServer:
+    """Pool of resident build workers sharing the precompiled preamble formats. Use as a context manager.
+    Jobs are built with the same gmake make variables as rebuildCVs(), the data files are sent as payloads.
+    """
+    def __init__(self, cv_dir: str, dataFiles: list[str], workers: int = 1, formatsDir: str = BUILD_SERVER_DEFAULT_FORMATS_DIR,
+                    usePreambleFormat: bool = True, buildTimeout: float = BUILD_SERVER_DEFAULT_TIMEOUT):
+        """Create a build server.
+
+        Args:
+            cv_dir (str): path to the CV Templates directory
+            dataFiles (list[str]): per-job data files relative to cv_dir, e.g. data/12_recipients.tex
+            workers (int, optional): number of resident worker processes. Defaults to 1.
+            formatsDir (str, optional): directory of the precompiled formats. Defaults to BUILD_SERVER_DEFAULT_FORMATS_DIR.
+            usePreambleFormat (bool, optional): precompile the preambles. Defaults to True.
+            buildTimeout (float, optional): maximum time in seconds of the build of one job. Defaults to BUILD_SERVER_DEFAULT_TIMEOUT.
+        """
+        self.cv_dir = cv_dir
+        self.dataFiles = dataFiles
+        self.workersCount = max(1, workers)
+        self.formatsDir = formatsDir
+        self.usePreambleFormat = usePreambleFormat
+        self.buildTimeout = buildTimeout
+        self.formatDir = None
+        self.context = multiprocessing.get_context("spawn")
+        self.tasks = None
+        self.results = None
+        self.workers = []
+        self.futures = {}
+        # Worker pid -> (id of the task it is building, task start time)
+        self.runningTasks = {}
+        self.retiredWorkers = set()
+        self.respawns = 0
+        self.isStopping = False
+        self.nextTaskId = 0
+        self.lock = threading.Lock()
+        self.resultsThread = None
+
+    def __enter__(self):
+        if self.usePreambleFormat:
+            self.formatDir = buildPreambleFormats(self.cv_dir, self.dataFiles, self.formatsDir)
+        self.tasks = self.context.Queue()
+        self.results = self.context.Queue()
+        self.workers = [self.startWorker(i) for i in range(self.workersCount)]
+        self.resultsThread = threading.Thread(target=self.dispatchResults, name="latex-build-results", daemon=True)
+        self.resultsThread.start()
+        logger.info(f"Started {self.workersCount} LaTeX build worker(s)"
+                    + (" with precompiled preambles." if self.formatDir else "."))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self.lock:
+            self.isStopping = True
+            workers = list(self.workers)
+        for _ in workers:
+            self.tasks.put(BUILD_SERVER_STOP)
+        # Workers still building when the grace time is over are terminated
+        deadline = time.monotonic() + BUILD_SERVER_TERMINATE_GRACE
+        for worker in workers:
+            worker.join(max(0, deadline - time.monotonic()))
+            if worker.is_alive():
+                logger.warning(f"LaTeX build worker {worker.name} did not stop in time, terminating it.")
+                self.terminateWorker(worker)
+        self.results.put(BUILD_SERVER_STOP)
+        self.resultsThread.join()
+        with self.lock:
+            for future in self.futures.values():
+                if not future.done():
+                    future.set_exception(RuntimeError("LaTeX build server stopped."))
+            self.futures.clear()
+        return False
+
+    def startWorker(self, index: int):
+        worker = self.context.Process(target=runBuildWorker, name=f"latex-build-worker-{index}", daemon=True,
+                                        args=(self.cv_dir, self.dataFiles, self.formatDir, self.tasks, self.results, self.buildTimeout))
+        worker.start()
+        return worker
+
+    @staticmethod
+    def terminateWorker(worker):
+        worker.terminate()
+        worker.join(BUILD_SERVER_TERMINATE_GRACE)
+        if worker.is_alive():
+            worker.kill()
+            worker.join()
+
+    def dispatchResults(self):
+        lastCheckTime = time.monotonic()
+        while True:
+            try:
+                result = self.results.get(timeout=BUILD_SERVER_POLL_INTERVAL)
+            except queue.Empty:
+                result = queue.Empty
+            # Results of busy workers do not delay the checks of the others
+            if time.monotonic() - lastCheckTime >= BUILD_SERVER_POLL_INTERVAL:
+                self.checkWorkers()
+                lastCheckTime = time.monotonic()
+            if result is queue.Empty:
+                continue
+            if result is BUILD_SERVER_STOP:
+                return
+            if result[0] == BUILD_SERVER_TASK_STARTED:
+                _, taskId, pid = result
+                with self.lock:
+                    self.runningTasks[pid] = (taskId, time.monotonic())
+                continue
+            taskId, builtPDFs, returnCode, output = result
+            with self.lock:
+                self.runningTasks = {pid: task for pid, task in self.runningTasks.items() if task[0] != taskId}
+                future = self.futures.pop(taskId, None)
+            if returnCode != 0:
+                logger.error(f"gmake failed with the exit code {returnCode}:\n{output}")
+            # The future of a build which is no longer waited for is already cancelled
+            if future is not None and not future.done():
+                future.set_result(builtPDFs if returnCode == 0 else [])
+
+    def checkWorkers(self):
+        """Respawn the workers which died, e.g. killed by the OOM killer, or hang past the build timeout, and fail their tasks.
+        All tasks fail once no worker is left and the respawns are exhausted.
+        """
+        failedFutures = []
+        with self.lock:
+            if self.isStopping:
+                return
+            for i, worker in enumerate(self.workers):
+                if worker.pid in self.retiredWorkers:
+                    continue
+                task = self.runningTasks.pop(worker.pid, None)
+                if worker.is_alive():
+                    if task is None or time.monotonic() - task[1] <= self.buildTimeout + BUILD_SERVER_TERMINATE_GRACE:
+                        if task is not None:
+                            self.runningTasks[worker.pid] = task
+                        continue
+                    logger.error(f"LaTeX build worker {worker.name} is hung past the build timeout, terminating it.")
+                    self.terminateWorker(worker)
+                else:
+                    logger.error(f"LaTeX build worker {worker.name} died with the exit code {worker.exitcode}.")
+                self.retiredWorkers.add(worker.pid)
+                if task is not None and task[0] in self.futures:
+                    failedFutures.append(self.futures.pop(task[0]))
+                if self.respawns < BUILD_SERVER_MAX_RESPAWNS:
+                    self.respawns += 1
+                    self.workers[i] = self.startWorker(i)
+                    logger.info(f"Respawned LaTeX build worker {worker.name}.")
+            if not any(worker.is_alive() for worker in self.workers):
+                failedFutures.extend(self.futures.values())
+                self.futures.clear()
+        for future in failedFutures:
+            if not future.done():
+                future.set_exception(RuntimeError("LaTeX build worker died."))
+
+    def submit(self, dataFilesContent: dict[str, str], makeVariables: dict[str, str], out_dir: str = None) -> Future:
+        """Queue a CV build.
+
+        Args:
+            dataFilesContent (dict[str, str]): data file relative path -> rendered content
+            makeVariables (dict[str, str]): gmake variables, e.g. company, location, job and timestamp
+            out_dir (str, optional): directory the built PDFs are copied to. Defaults to the CV Templates directory.
+
+        Returns:
+            Future: paths of the built PDF files
+        """
+        future = Future()
+        with self.lock:
+            taskId = self.nextTaskId
+            self.nextTaskId += 1
+            self.futures[taskId] = future
+        self.tasks.put((taskId, dataFilesContent, makeVariables, os.path.abspath(out_dir or self.cv_dir)))
+        return future
+
+    def build(self, dataFilesContent: dict[str, str], makeVariables: dict[str, str], out_dir: str = None,
+                timeout: float = None) -> list[str]:
+        """Build a CV and wait for it, see submit().
+
+        Args:
+            timeout (float, optional): maximum time in seconds to wait for the build, including the time spent in the queue.
+                                        Defaults to None, the build itself is bounded by the build timeout of the server.
+
+        Returns:
+            list[str]: paths of the built PDF files, empty if the build failed, timed out or its worker died
+        """
+        future = self.submit(dataFilesContent, makeVariables, out_dir)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            logger.error(f"LaTeX build of {makeVariables.get('company')} {makeVariables.get('job')} timed out after {timeout} s.")
+        except RuntimeError as e:
+            logger.error(f"LaTeX build of {makeVariables.get('company')} {makeVariables.get('job')} failed: {e}")
+        return []
@@ -0,0 +1,193 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Authenticated WebDriver session kept warm between the syncs of the sync daemon.
+# The session is health-checked and recycled when the browser dies, refreshed cookies are persisted back to the cookies file.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import json, threading, time
+from typing import Callable
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.safari.service import Service
+
+from .IJobsFetcherService import WebDriver, WEBDRIVER_SAFARI_PATH, WEBDRIVER_SETUP_TIMEOUT
+from .WebDriverWaits import ReadinessWaiter, isDocumentReady
+from Utils.Files.FileHandler import writeFileAtomic
+from Utils.Logging.LogHandler import getLogger
+from Utils.Metrics.Instrumentation import instrumentation, STAGE_WEBDRIVER_SETUP
+
+logger = getLogger(__name__)
+
+def createWebDriver(webDriver: WebDriver, headless: bool = False):
+    """Start a WebDriver.
+
+    Args:
+        webDriver (WebDriver): browser to drive
+        headless (bool, optional): run the browser without a window, e.g. on a Linux server. Not supported by Safari. Defaults to False.
+
+    Returns:
+        Selenium WebDriver instance
+    """
+    if webDriver == WebDriver.WEBDRIVER_SAFARI:
+        if headless:
+            logger.warning("Safari does not support the headless mode, starting it with a window.")
+        return webdriver.Safari(service=Service(executable_path=WEBDRIVER_SAFARI_PATH))
+    if webDriver == WebDriver.WEBDRIVER_CHROME:
+        options = webdriver.ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+        return webdriver.Chrome(options=options)
+    if webDriver == WebDriver.WEBDRIVER_FIREFOX:
+        options = webdriver.FirefoxOptions()
+        if headless:
+            options.add_argument("-headless")
+        return webdriver.Firefox(options=options)
+    raise ValueError(f"WebDriver {webDriver} not supported yet.")
+
+def isBrowserAlive(browser) -> bool:
+    try:
+        browser.execute_script("return document.readyState")
+        return True
+    except WebDriverException:
+        return False
+
+class BrowserSession:
+    """WebDriver with the authentication cookies loaded, started on the first use and kept until closed.
+    """
+    def __init__(self, cookiesFile: str, webDriver: WebDriver = WebDriver.WEBDRIVER_SAFARI, headless: bool = False,
+                    cookiesUrl: str = None, driverFactory: Callable = createWebDriver):
+        """Create a browser session.
+
+        Args:
+            cookiesFile (str): path to the cookies JSON file, refreshed cookies are written back to it
+            webDriver (WebDriver, optional): browser to drive. Defaults to WebDriver.WEBDRIVER_SAFARI.
+            headless (bool, optional): run the browser without a window. Defaults to False.
+            cookiesUrl (str, optional): page opened before the cookies are added, WebDriver accepts only the cookies of the current domain. Defaults to None.
+            driverFactory (Callable, optional): function starting the WebDriver. Defaults to createWebDriver.
+        """
+        self.cookiesFile = cookiesFile
+        self.webDriver = webDriver
+        self.headless = headless
+        self.cookiesUrl = cookiesUrl
+        self.driverFactory = driverFactory
+        self.browser = None
+        # The daemon health checks run between the syncs
+        self.lock = threading.RLock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def acquire(self):
+        """Get the warm browser, started or recycled if needed.
+
+        Returns:
+            Selenium WebDriver instance with the cookies loaded
+        """
+        with self.lock:
+            if self.browser is not None:
+                if isBrowserAlive(self.browser):
+                    logger.info("Reusing the warm webdriver session.")
+                    instrumentation.count("webdriver_reused")
+                    return self.browser
+                self.recycle()
+            else:
+                self.start()
+            return self.browser
+
+    def start(self):
+        logger.info("Initializing webdriver...")
+        setupStart = time.perf_counter()
+        browser = self.driverFactory(self.webDriver, self.headless)
+        waiter = ReadinessWaiter(browser)
+        waiter.waitFor("webdriver setup", isDocumentReady, WEBDRIVER_SETUP_TIMEOUT)
+        if self.cookiesUrl is not None:
+            browser.get(self.cookiesUrl)
+        logger.info("Loading cookies...")
+        with open(self.cookiesFile, "r") as f:
+            for cookie in json.load(fp=f):
+                browser.add_cookie(cookie_dict=cookie)
+                logger.debug(f"Added cookie \"{cookie['name']}\".")
+        waiter.waitFor("cookies setup", isDocumentReady, WEBDRIVER_SETUP_TIMEOUT)
+        instrumentation.record(STAGE_WEBDRIVER_SETUP, time.perf_counter() - setupStart)
+        self.browser = browser
+
+    def recycle(self):
+        logger.warning("The webdriver session is not responding, starting a new one.")
+        instrumentation.count("webdriver_recycled")
+        self.quit()
+        self.start()
+
+    def checkHealth(self) -> bool:
+        """Recycle the session if the browser has died. A session not started yet is left as is.
+
+        Returns:
+            bool: True if the session is ready
+        """
+        with self.lock:
+            if self.browser is None or isBrowserAlive(self.browser):
+                return True
+            try:
+                self.recycle()
+            except Exception as e:
+                logger.exception(f"Failed to recycle the webdriver session: {e}")
+                self.browser = None
+                return False
+            return True
+
+    def getCookies(self) -> list[dict]:
+        """Get the current cookies of the browser, e.g. for the HTTP sessions fetching the job details.
+        """
+        with self.lock:
+            return self.browser.get_cookies() if self.browser is not None else []
+
+    def persistCookies(self):
+        """Write the cookies refreshed by the site back to the cookies file, only call it after an authenticated sync.
+        """
+        with self.lock:
+            if self.browser is None:
+                return
+            try:
+                cookies = self.browser.get_cookies()
+            except WebDriverException as e:
+                logger.warning(f"Failed to read the webdriver cookies: {e}")
+                return
+            # Cookies are not available on the pages of other domains, e.g. right after a restart
+            if cookies:
+                writeFileAtomic(self.cookiesFile, json.dumps(cookies, indent=4))
+                logger.debug(f"Persisted {len(cookies)} cookie(s) to {self.cookiesFile}.")
+
+    def quit(self):
+        with self.lock:
+            if self.browser is None:
+                return
+            try:
+                self.browser.quit()
+            except WebDriverException:
+                pass
+            self.browser = None
+
+    def close(self):
+        """Quit the browser. The cookies are not persisted, a session which failed to sign in would overwrite the valid ones.
+        """
+        self.quit()
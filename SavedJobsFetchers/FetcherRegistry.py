@@ -0,0 +1,77 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Registry of the job portal fetchers. Implementations and their dependencies, e.g. selenium and bs4,
+# are imported only when a portal is selected, keeping the startup of single job runs fast.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import importlib
+
+from .IJobsFetcherService import IJobsFetcherService
+
+FETCH_DEFAULT_TIMEOUT_SECONDS = 30 * 60
+
+# Portal name -> "module:class" of the IJobsFetcherService implementation
+FETCHERS_REGISTRY = {
+    "LinkedIn": "SavedJobsFetchers.LinkedInFetcherService:LinkedInFetcherService",
+    # TODO Add other services if needed like Indeed, pracuj.pl, etc.
+}
+FETCHERS_DEFAULT = ["LinkedIn"]
+
+def registerFetcher(name: str, target: str):
+    """Register a job portal fetcher.
+
+    Args:
+        name (str): portal name, as selected by the -fp argument
+        target (str): "module:class" of the IJobsFetcherService implementation
+    """
+    FETCHERS_REGISTRY[name] = target
+
+def getFetcherNames() -> list[str]:
+    return list(FETCHERS_REGISTRY)
+
+def getFetcherClass(name: str) -> type[IJobsFetcherService]:
+    """Import the fetcher implementation of a portal.
+
+    Args:
+        name (str): portal name
+
+    Raises:
+        KeyError: portal is not registered
+
+    Returns:
+        type[IJobsFetcherService]: fetcher class
+    """
+    if name not in FETCHERS_REGISTRY:
+        raise KeyError(f"Job portal {name} is not registered, available portals: {', '.join(FETCHERS_REGISTRY)}.")
+    moduleName, className = FETCHERS_REGISTRY[name].split(":")
+    return getattr(importlib.import_module(moduleName), className)
+
+def createFetcher(name: str, args, jobsStore=None) -> IJobsFetcherService:
+    """Import and create the fetcher of a portal configured by the command line arguments.
+
+    Args:
+        name (str): portal name
+        args: parsed command line arguments
+        jobsStore (JobsStore, optional): store of the fetched jobs. Defaults to None.
+
+    Returns:
+        IJobsFetcherService: fetcher
+    """
+    return getFetcherClass(name).fromArguments(args, jobsStore)
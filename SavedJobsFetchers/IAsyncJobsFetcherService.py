@@ -0,0 +1,119 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Asynchronous jobs fetcher interface and an adapter running the synchronous fetchers in a worker thread.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import asyncio, threading
+from abc import abstractmethod, ABCMeta
+from typing import Iterator
+
+from .IJobsFetcherService import IJobsFetcherService, Job
+
+class IAsyncJobsFetcherService(metaclass=ABCMeta):
+    """An asynchronous interface to fetch jobs through various job portals.
+    Fetchers implementing this interface are run concurrently by fetchAllSavedJobs.
+
+    Args:
+        ABC (ABCMeta): Standard Python Abstract Base Class.
+    """
+    # Portal name used in logs and reports
+    name: str = None
+    # Maximum time in seconds to wait for the saved jobs of this portal, None uses the default timeout
+    timeout: float = None
+
+    @abstractmethod
+    async def getSavedJobs(self) -> list[Job]:
+        """Abstract coroutine to fetch list of jobs.
+
+        Returns:
+            list[Job]: saved job list
+        """
+        pass
+
+    def iterSavedJobs(self) -> Iterator[Job]:
+        """Yield the saved jobs from a thread without a running event loop, used by the streaming pipeline.
+
+        Yields:
+            Job: saved job
+        """
+        yield from asyncio.run(self.getSavedJobs())
+
+    def checkHealth(self) -> bool:
+        """Check the resources kept between the syncs and recycle the broken ones.
+
+        Returns:
+            bool: True if the fetcher is ready for the next sync
+        """
+        return True
+
+    def close(self):
+        """Release the resources kept between the syncs.
+        """
+        pass
+
+class SyncJobsFetcherAdapter(IAsyncJobsFetcherService):
+    """Runs a synchronous IJobsFetcherService in a worker thread, so WebDriver based fetchers do not block the event loop.
+    The worker thread cannot be cancelled, so it is a daemon thread which neither asyncio.run nor the interpreter exit waits for.
+    A fetcher which timed out is closed to make its worker thread fail fast.
+    """
+    def __init__(self, fetcherService: IJobsFetcherService, name: str = None, timeout: float = None):
+        """Wrap a synchronous fetcher.
+
+        Args:
+            fetcherService (IJobsFetcherService): synchronous fetcher
+            name (str, optional): portal name. Defaults to the fetcher class name.
+            timeout (float, optional): portal timeout in seconds. Defaults to None.
+        """
+        self.fetcherService = fetcherService
+        self.name = name if name is not None else type(fetcherService).__name__
+        self.timeout = timeout
+
+    async def getSavedJobs(self) -> list[Job]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        threading.Thread(target=self.fetchSavedJobs, args=(loop, future), name=f"{self.name}Fetcher", daemon=True).start()
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # Timed out, release the browser of the abandoned worker thread
+            self.fetcherService.close()
+            raise
+
+    def fetchSavedJobs(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future):
+        try:
+            savedJobs = self.fetcherService.getSavedJobs()
+        except BaseException as e:
+            settle = lambda: future.cancelled() or future.set_exception(e)
+        else:
+            settle = lambda: future.cancelled() or future.set_result(savedJobs)
+        try:
+            loop.call_soon_threadsafe(settle)
+        except RuntimeError:
+            # The event loop was closed while the timed out fetcher was running
+            pass
+
+    def iterSavedJobs(self) -> Iterator[Job]:
+        return self.fetcherService.iterSavedJobs()
+
+    def checkHealth(self) -> bool:
+        return self.fetcherService.checkHealth()
+
+    def close(self):
+        self.fetcherService.close()
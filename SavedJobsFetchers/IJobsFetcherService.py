@@ -21,19 +21,35 @@
 
 from abc import abstractmethod, ABCMeta
 from enum import Enum
+from typing import Callable, Iterator
+import sys
 
 # WebDriver configurations
 WEBDRIVER_SAFARI_PATH = "/usr/bin/safaridriver"
-WEBDRIVER_SETUP_SLEEP_TIME = 10
-WEBDRIVER_PAGE_LOAD_SLEEP_TIME = 5
-#TODO Add support for other webdrivers
+# Maximum times to wait for a page condition, in seconds
+WEBDRIVER_SETUP_TIMEOUT = 10
+WEBDRIVER_PAGE_LOAD_TIMEOUT = 15
+WEBDRIVER_POLL_FREQUENCY = 0.2
+# Age in hours after which the job details kept by the JobsStore are fetched again
+JOBS_STORE_DEFAULT_MAX_AGE_HOURS = 7 * 24
+
+def internString(text: str) -> str:
+    return sys.intern(text) if isinstance(text, str) else text
 
 class WebDriver(Enum):
     WEBDRIVER_SAFARI = 1
+    WEBDRIVER_CHROME = 2
+    WEBDRIVER_FIREFOX = 3
+
+# WebDriver names used by the command line arguments
+WEBDRIVER_NAMES = {"safari": WebDriver.WEBDRIVER_SAFARI, "chrome": WebDriver.WEBDRIVER_CHROME, "firefox": WebDriver.WEBDRIVER_FIREFOX}
 
 class Job:
-    """Job class.
+    """Job class. A compact record, the company and location strings are interned and the details
+    can be loaded on demand from a jobs store instead of being kept in memory.
     """
+    __slots__ = ("company", "job", "location", "url", "letterAddress", "letterRecipient", "isVisaRequired", "_details", "detailsLoader")
+
     def __init__(self, company: str, job: str, location: str, url: str, 
                     details: str = None, letterAddress: str = None, letterRecipient: str = None, isVisaRequired: str = None):
         """Job class constructor.
@@ -48,15 +64,44 @@ class Job:
             letterRecipient (str, optional): cover letter recipient name. Defaults to None.
             isVisaRequired (str, optional): determines if job visa required ("1"). Defaults to None.
         """
-        self.company = company
+        self.company = internString(company)
         self.job = job
-        self.location = location
+        self.location = internString(location)
         self.url = url
-        self.details = details
+        self._details = details
+        self.detailsLoader = None
         self.letterAddress = letterAddress
         self.letterRecipient = letterRecipient
         self.isVisaRequired = isVisaRequired
 
+    @property
+    def details(self) -> str:
+        """Job description, loaded by the details loader if the details are not kept in memory.
+        """
+        if self._details is None and self.detailsLoader is not None:
+            return self.detailsLoader(self)
+        return self._details
+
+    @details.setter
+    def details(self, details: str):
+        self._details = details
+        self.detailsLoader = None
+
+    def offloadDetails(self, detailsLoader: Callable[["Job"], str]):
+        """Drop the details from memory, they are loaded by the given loader on every access.
+
+        Args:
+            detailsLoader (Callable[[Job], str]): function returning the job details, e.g. JobsStore.getDetails
+        """
+        self._details = None
+        self.detailsLoader = detailsLoader
+
+    @property
+    def label(self) -> str:
+        """Human readable job identifier used in logs and reports.
+        """
+        return f"{self.company} / {self.job} / {self.location}"
+
 class IJobsFetcherService(metaclass=ABCMeta):
     """An interface to fetch jobs through various job portals.
     Implement this interface in your class while adding support to other job portals.
@@ -65,6 +110,20 @@ class IJobsFetcherService(metaclass=ABCMeta):
         ABC (ABCMeta): Standard Python Abstract Base Class.
     """
 
+    @classmethod
+    def fromArguments(cls, args, jobsStore=None) -> "IJobsFetcherService":
+        """Create the fetcher configured by the command line arguments and the environment.
+        Override if the fetcher needs e.g. credentials.
+
+        Args:
+            args: parsed command line arguments
+            jobsStore (JobsStore, optional): store of the fetched jobs. Defaults to None.
+
+        Returns:
+            IJobsFetcherService: fetcher
+        """
+        return cls()
+
     @abstractmethod
     def getSavedJobs(self) -> list[Job]:
         """Abstract method to fetch list of jobs.
@@ -72,4 +131,26 @@ class IJobsFetcherService(metaclass=ABCMeta):
         Returns:
             list[Job]: saved job list
         """
-        pass
\ No newline at end of file
+        pass
+
+    def iterSavedJobs(self) -> Iterator[Job]:
+        """Yield the saved jobs. Override to yield every job as soon as its details are fetched.
+
+        Yields:
+            Job: saved job
+        """
+        yield from self.getSavedJobs()
+
+    def checkHealth(self) -> bool:
+        """Check the resources kept between the syncs, e.g. a browser session, and recycle the broken ones.
+        Override if the fetcher keeps such resources.
+
+        Returns:
+            bool: True if the fetcher is ready for the next sync
+        """
+        return True
+
+    def close(self):
+        """Release the resources kept between the syncs.
+        """
+        pass
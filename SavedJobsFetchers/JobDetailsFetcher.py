@@ -0,0 +1,104 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Concurrent, rate-limited job details fetching over plain HTTP sessions sharing the portal cookies.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import threading, time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+from Utils.Logging.LogHandler import getLogger
+
+logger = getLogger(__name__)
+
+DETAILS_FETCH_DEFAULT_REQUESTS_PER_SECOND = 2.0
+DETAILS_FETCH_TIMEOUT = 15
+DETAILS_FETCH_USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
+                            "(KHTML, like Gecko) Version/18.2 Safari/605.1.15")
+
+class RateLimiter:
+    """Thread-safe limiter spacing consecutive requests by at least 1 / requestsPerSecond seconds.
+    """
+    def __init__(self, requestsPerSecond: float):
+        self.interval = 1.0 / requestsPerSecond if requestsPerSecond else 0.0
+        self.nextRequestTime = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            waitTime = self.nextRequestTime - now
+            self.nextRequestTime = max(now, self.nextRequestTime) + self.interval
+        if waitTime > 0:
+            time.sleep(waitTime)
+
+class HttpJobDetailsFetcher:
+    """Fetches job pages over HTTP, one requests.Session per worker thread, all sharing the loaded cookies.
+    """
+    def __init__(self, cookies: list[dict], timeout: float = DETAILS_FETCH_TIMEOUT):
+        """Create an HTTP job details fetcher.
+
+        Args:
+            cookies (list[dict]): cookies in the WebDriver format, e.g. loaded from the cookies JSON file
+            timeout (float, optional): request timeout in seconds. Defaults to DETAILS_FETCH_TIMEOUT.
+        """
+        self.cookies = cookies
+        self.timeout = timeout
+        self.sessions = threading.local()
+
+    def getSession(self) -> requests.Session:
+        session = getattr(self.sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = DETAILS_FETCH_USER_AGENT
+            for cookie in self.cookies:
+                session.cookies.set(cookie["name"], cookie["value"],
+                                    domain=cookie.get("domain", "").lstrip("."), path=cookie.get("path", "/"))
+            self.sessions.session = session
+        return session
+
+    def fetch(self, url: str) -> str:
+        response = self.getSession().get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+def fetchConcurrently(urls: list[str], fetch, maxWorkers: int, rateLimiter: RateLimiter = None) -> list[str]:
+    """Fetch pages with a bounded pool of workers.
+
+    Args:
+        urls (list[str]): page URLs
+        fetch: callable returning the page source for a URL
+        maxWorkers (int): maximum number of concurrent requests
+        rateLimiter (RateLimiter, optional): limiter applied before every request. Defaults to None.
+
+    Returns:
+        list[str]: page sources in the order of the URLs, None for pages which failed to load
+    """
+    def fetchPage(url: str) -> str:
+        if rateLimiter is not None:
+            rateLimiter.acquire()
+        try:
+            return fetch(url)
+        except Exception as e:
+            logger.warning(f"Failed to fetch {url}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+        return list(executor.map(fetchPage, urls))
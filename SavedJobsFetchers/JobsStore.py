@@ -0,0 +1,159 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Persistent on-disk store of fetched jobs, used to fetch job details only for new, changed or stale postings.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import hashlib, os, re, sqlite3, threading, time
+from urllib.parse import urlsplit
+
+from .IJobsFetcherService import Job, JOBS_STORE_DEFAULT_MAX_AGE_HOURS
+
+# Job ID in job portal URLs, e.g. https://www.linkedin.com/jobs/view/1234567890/?trk=...
+JOB_ID_IN_URL_PATTERN = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)")
+
+JOBS_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    url TEXT,
+    company TEXT,
+    job TEXT,
+    location TEXT,
+    details TEXT,
+    details_hash TEXT,
+    fetched_at REAL
+)
+"""
+
+def getJobKey(url: str) -> str:
+    """Get a stable job key from the job URL, ignoring tracking query parameters.
+
+    Args:
+        url (str): job URL
+
+    Returns:
+        str: job key
+    """
+    match = JOB_ID_IN_URL_PATTERN.search(url)
+    if match:
+        return f"{urlsplit(url).netloc}/jobs/{match[1]}"
+    urlParts = urlsplit(url)
+    return urlParts.netloc + urlParts.path.rstrip("/")
+
+def hashJobDetails(details: str) -> str:
+    return hashlib.sha256((details or "").encode()).hexdigest()
+
+class JobsStore:
+    """SQLite store of fetched jobs keyed by the job URL.
+    """
+    def __init__(self, path: str):
+        """Open or create a jobs store.
+
+        Args:
+            path (str): path to the SQLite database file
+        """
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Details of the offloaded jobs are loaded from the fetcher and the build threads
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute(JOBS_STORE_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def get(self, job: Job) -> sqlite3.Row:
+        with self.lock:
+            return self.connection.execute("SELECT * FROM jobs WHERE key = ?", (getJobKey(job.url),)).fetchone()
+
+    def getDetails(self, job: Job) -> str:
+        with self.lock:
+            storedDetails = self.connection.execute("SELECT details FROM jobs WHERE key = ?", (getJobKey(job.url),)).fetchone()
+        return storedDetails[0] if storedDetails is not None else None
+
+    def needsDetails(self, job: Job, maxAgeHours: float = JOBS_STORE_DEFAULT_MAX_AGE_HOURS) -> bool:
+        """Check if the job details shall be fetched.
+
+        Args:
+            job (Job): job from the saved jobs list
+            maxAgeHours (float, optional): age after which the stored details are stale. Defaults to JOBS_STORE_DEFAULT_MAX_AGE_HOURS.
+
+        Returns:
+            bool: True if the job was not seen yet, its stored entry is stale or its list fields have changed
+        """
+        storedJob = self.get(job)
+        if storedJob is None or storedJob["details"] is None:
+            return True
+        if time.time() - storedJob["fetched_at"] > maxAgeHours * 3600:
+            return True
+        return (storedJob["company"], storedJob["job"], storedJob["location"]) != (job.company, job.job, job.location)
+
+    def loadDetails(self, job: Job) -> bool:
+        """Set the job details from the store. The details are not kept in memory, they are read from the store on access.
+
+        Returns:
+            bool: True if the details were found
+        """
+        with self.lock:
+            isStored = self.connection.execute("SELECT 1 FROM jobs WHERE key = ? AND details IS NOT NULL",
+                                                (getJobKey(job.url),)).fetchone() is not None
+        if isStored:
+            job.offloadDetails(self.getDetails)
+        return isStored
+
+    def put(self, job: Job) -> bool:
+        """Store the fetched job.
+
+        Args:
+            job (Job): job with fetched details
+
+        Returns:
+            bool: True if the job details differ from the previously stored ones
+        """
+        details = job.details
+        detailsHash = hashJobDetails(details)
+        with self.lock:
+            storedJob = self.get(job)
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO jobs (key, url, company, job, location, details, details_hash, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (getJobKey(job.url), job.url, job.company, job.job, job.location, details, detailsHash, time.time()))
+        return storedJob is None or storedJob["details_hash"] != detailsHash
+
+    def offloadDetails(self, job: Job) -> bool:
+        """Store the job and drop its details from memory, keeping memory flat for large saved jobs sets.
+
+        Returns:
+            bool: True if the job details differ from the previously stored ones
+        """
+        isChanged = self.put(job)
+        job.offloadDetails(self.getDetails)
+        return isChanged
@@ -22,14 +22,24 @@
 #
 
 from .IJobsFetcherService import *
-from bs4 import BeautifulSoup
-from selenium import webdriver
+from .JobsStore import JobsStore, JOBS_STORE_DEFAULT_MAX_AGE_HOURS
+from .WebDriverWaits import ReadinessWaiter
+from .BrowserSession import BrowserSession
+from .JobDetailsFetcher import HttpJobDetailsFetcher, RateLimiter, fetchConcurrently, DETAILS_FETCH_DEFAULT_REQUESTS_PER_SECOND
+from Utils.Logging.LogHandler import getLogger
+from Utils.Metrics.Instrumentation import *
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium.webdriver.common.by import By
-from selenium.webdriver.safari.service import Service
-from selenium.common.exceptions import NoSuchElementException
-import json, os, time, re
+from selenium.webdriver.support import expected_conditions
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from enum import Enum
+from typing import Iterator
+import importlib.util, os, re
+
+logger = getLogger(__name__)
 
 # LinkedIn HTML & CSS fields
+LINKEDIN_HOME_PAGE = "https://www.linkedin.com/"
 LINKEDIN_MY_SAVED_JOBS_PAGE = "https://www.linkedin.com/my-items/saved-jobs/?cardType=SAVED&start=<PAGE>0"
 LINKEDIN_SIGNIN_BUTTON_CSS_SELECTOR = ".btn__primary--large"
 LINKEDIN_SIGNIN_USERNAME_ID = "username"
@@ -40,6 +50,26 @@ LINKEDIN_SAVEDJOBS_LIST_CSS = ".ilpSrejhJlrdxFOYbBAZVTWFlYDOyjAUKPGVo"
 LINKEDIN_SAVEDJOBS_COMPANY_CSS = "t-14 t-black t-normal"
 LINKEDIN_SAVEDJOBS_LOCATION_CSS = "t-14 t-normal"
 LINKEDIN_JOB_DETAILS_ID = "job-details"
+LINKEDIN_SAVEDJOBS_LIST_READY_CSS = "ul[role=list]"
+LINKEDIN_NO_JOB_DETAILS = "No details provided."
+
+# Precompiled selectors
+LINKEDIN_SAVEDJOBS_COMPANY_CSS_PATTERN = re.compile(LINKEDIN_SAVEDJOBS_COMPANY_CSS)
+LINKEDIN_SAVEDJOBS_LOCATION_CSS_PATTERN = re.compile(LINKEDIN_SAVEDJOBS_LOCATION_CSS)
+# Restrict parsing to the saved jobs list and the job details subtrees
+LINKEDIN_SAVEDJOBS_LIST_STRAINER = SoupStrainer(name="ul", attrs={"role": "list"})
+LINKEDIN_JOB_DETAILS_STRAINER = SoupStrainer(name="div", attrs={"id": LINKEDIN_JOB_DETAILS_ID})
+
+class HtmlParserBackend(Enum):
+    """BeautifulSoup tree builders.
+    """
+    HTML_PARSER = "html.parser"
+    LXML = "lxml"
+
+def getDefaultHtmlParserBackend() -> HtmlParserBackend:
+    """Use lxml if it is installed, the Python built-in parser otherwise.
+    """
+    return HtmlParserBackend.LXML if importlib.util.find_spec("lxml") is not None else HtmlParserBackend.HTML_PARSER
 
 class LinkedInFetcherService(IJobsFetcherService):
     """LinkedIn Fetching Service class. Implements the IJobsFetcherService interface.
@@ -48,76 +78,172 @@ class LinkedInFetcherService(IJobsFetcherService):
         IJobsFetcherService (_type_): interface
     """
 
-    def __init__(self, username: str=None, password: str=None, cookiesFileDir: str=None, webDriver: WebDriver=WebDriver.WEBDRIVER_SAFARI):
+    def __init__(self, username: str=None, password: str=None, cookiesFileDir: str=None, webDriver: WebDriver=WebDriver.WEBDRIVER_SAFARI,
+                    jobsStore: JobsStore=None, jobsStoreMaxAgeHours: float=JOBS_STORE_DEFAULT_MAX_AGE_HOURS,
+                    detailsFetchConcurrency: int=1, detailsRequestsPerSecond: float=DETAILS_FETCH_DEFAULT_REQUESTS_PER_SECOND,
+                    htmlParser: HtmlParserBackend=None, useSoupStrainer: bool=True, headless: bool=False, keepSessionAlive: bool=False):
         """Create a LinkedIn Fetching service.
 
         Args:
             username (str): LinkedIn username. Defaults to None.
             password (str): LinkedIn password. Defaults to None.
             cookiesFileDir (str): Path to the cookies JSON file containing LinkedIn authentication cookies.
+            jobsStore (JobsStore, optional): Store of previously fetched jobs, details are fetched only for new, changed or stale jobs. Defaults to None.
+            jobsStoreMaxAgeHours (float, optional): Age after which the stored job details are fetched again. Defaults to JOBS_STORE_DEFAULT_MAX_AGE_HOURS.
+            detailsFetchConcurrency (int, optional): Number of concurrent HTTP sessions fetching job details, 1 uses only the WebDriver. Defaults to 1.
+            detailsRequestsPerSecond (float, optional): Rate limit of the concurrent job details requests. Defaults to DETAILS_FETCH_DEFAULT_REQUESTS_PER_SECOND.
+            htmlParser (HtmlParserBackend, optional): HTML parser used by BeautifulSoup. Defaults to lxml if installed, html.parser otherwise.
+            useSoupStrainer (bool, optional): Parse only the saved jobs list and the job details subtrees. Defaults to True.
+            headless (bool, optional): Run the browser without a window, not supported by Safari. Defaults to False.
+            keepSessionAlive (bool, optional): Keep the authenticated browser session between the syncs until close(). Defaults to False.
         """
         self.username = username if username is not None else input("Enter LinkedIn username: ")
         self.password = password if password is not None else input("Enter LinkedIn password: ")
         self.cookiesFileDir = cookiesFileDir if cookiesFileDir is not None else input("Enter path to the LinkedIn cookies file: ")
         self.webDriver = webDriver
+        self.jobsStore = jobsStore
+        self.jobsStoreMaxAgeHours = jobsStoreMaxAgeHours
+        self.detailsFetchConcurrency = detailsFetchConcurrency
+        self.detailsRequestsPerSecond = detailsRequestsPerSecond
+        self.htmlParser = htmlParser if htmlParser is not None else getDefaultHtmlParserBackend()
+        self.useSoupStrainer = useSoupStrainer
+        self.headless = headless
+        self.keepSessionAlive = keepSessionAlive
+        self.browserSession = None
+
+    @classmethod
+    def fromArguments(cls, args, jobsStore: JobsStore=None) -> "LinkedInFetcherService":
+        return cls(
+            username=os.getenv("LIN_LOGIN"),
+            password=os.getenv("LIN_KEY"),
+            cookiesFileDir=args.linkedin_cookies,
+            jobsStore=jobsStore,
+            jobsStoreMaxAgeHours=args.jobs_store_max_age,
+            detailsFetchConcurrency=args.fetch_concurrency,
+            webDriver=WEBDRIVER_NAMES[args.webdriver],
+            headless=args.headless,
+            keepSessionAlive=args.daemon)
+
+    def parseHtml(self, htmlPage: str, strainer: SoupStrainer) -> BeautifulSoup:
+        return BeautifulSoup(htmlPage, self.htmlParser.value, parse_only=strainer if self.useSoupStrainer else None)
 
     def parsePageForSavedJobs(self, savedJobsList: list, htmlPage: str):
-        mySavedJobsSoup = BeautifulSoup(htmlPage, "html.parser") #lxml?
-        # Get list of My Saved Jobs on LinkedIn
-        htmlListOfJobs = mySavedJobsSoup.find_all(name="ul", attrs={"role": "list"})[0].find_all(name="li")
-        # Iterate over list elements
-        for row in htmlListOfJobs:
-            # Retrieve job title and link
-            htmlJobTitleAndLink = row.find_all(name="a", attrs={"data-test-app-aware-link": ""})[1] # Skip [0] - company image
-            # Retrieve job company
-            htmlJobCompany = row.find_all(class_=re.compile(LINKEDIN_SAVEDJOBS_COMPANY_CSS))[0]
-            # Retrieve job location
-            htmlJobLocation = row.find_all(class_=re.compile(LINKEDIN_SAVEDJOBS_LOCATION_CSS))[0]
-            newJob = Job(
-                job=htmlJobTitleAndLink.text.replace(", Verified", "").strip(),
-                url=htmlJobTitleAndLink.attrs["href"].strip(),
-                company=htmlJobCompany.text.strip(),
-                location=htmlJobLocation.text.replace("(Hybrid)","").replace("(Remote)","").replace("(On-site)","").strip()
-            )
-            savedJobsList.append(newJob)
+        with instrumentation.timer(STAGE_PARSE_SAVED_JOBS), instrumentation.profiled():
+            mySavedJobsSoup = self.parseHtml(htmlPage, LINKEDIN_SAVEDJOBS_LIST_STRAINER)
+            # Get list of My Saved Jobs on LinkedIn
+            htmlListOfJobs = mySavedJobsSoup.find_all(name="ul", attrs={"role": "list"})[0].find_all(name="li")
+            # Iterate over list elements
+            for row in htmlListOfJobs:
+                # Retrieve job title and link
+                htmlJobTitleAndLink = row.find_all(name="a", attrs={"data-test-app-aware-link": ""})[1] # Skip [0] - company image
+                # Retrieve job company
+                htmlJobCompany = row.find_all(class_=LINKEDIN_SAVEDJOBS_COMPANY_CSS_PATTERN)[0]
+                # Retrieve job location
+                htmlJobLocation = row.find_all(class_=LINKEDIN_SAVEDJOBS_LOCATION_CSS_PATTERN)[0]
+                newJob = Job(
+                    job=htmlJobTitleAndLink.text.replace(", Verified", "").strip(),
+                    url=htmlJobTitleAndLink.attrs["href"].strip(),
+                    company=htmlJobCompany.text.strip(),
+                    location=htmlJobLocation.text.replace("(Hybrid)","").replace("(Remote)","").replace("(On-site)","").strip()
+                )
+                savedJobsList.append(newJob)
 
     def parseJobPageDetails(self, htmlPage: str) -> str:
-        jobPageDetailsSoup = BeautifulSoup(htmlPage, "html.parser")
-        htmlJobDetails = jobPageDetailsSoup.find(name="div", attrs={"id": LINKEDIN_JOB_DETAILS_ID})
-        if htmlJobDetails:
-            jobDetailsStrings = htmlJobDetails.strings
-        else:
-            jobDetailsStrings = ["No details provided."]
-        return "\n".join(jobDetailsStrings)
+        with instrumentation.timer(STAGE_PARSE_JOB_DETAILS), instrumentation.profiled():
+            jobPageDetailsSoup = self.parseHtml(htmlPage, LINKEDIN_JOB_DETAILS_STRAINER)
+            htmlJobDetails = jobPageDetailsSoup.find(name="div", attrs={"id": LINKEDIN_JOB_DETAILS_ID})
+            if htmlJobDetails:
+                jobDetailsStrings = htmlJobDetails.strings
+            else:
+                jobDetailsStrings = [LINKEDIN_NO_JOB_DETAILS]
+            return "\n".join(jobDetailsStrings)
+
+    def fetchJobDetails(self, savedJobs: list[Job], browser, waiter: ReadinessWaiter, cookies: list[dict]):
+        """Fetch details of the saved jobs which are not available in the jobs store.
+        With detailsFetchConcurrency > 1 pages are fetched over concurrent HTTP sessions sharing the cookies,
+        pages without job details, e.g. rendered by JavaScript only, are fetched again by the WebDriver.
+
+        Args:
+            savedJobs (list[Job]): saved jobs
+            browser: Selenium WebDriver instance
+            waiter (ReadinessWaiter): readiness waiter of the browser
+            cookies (list[dict]): LinkedIn authentication cookies
+        """
+        for _ in self.iterJobDetails(savedJobs, browser, waiter, cookies):
+            pass
+
+    def iterJobDetails(self, savedJobs: list[Job], browser, waiter: ReadinessWaiter, cookies: list[dict]) -> Iterator[Job]:
+        """Fetch details of the saved jobs, see fetchJobDetails, yielding every job as soon as its details are available.
+        Jobs with details reused from the jobs store are yielded first.
+        """
+        jobsToFetch = []
+        for job in savedJobs:
+            if self.jobsStore is not None and not self.jobsStore.needsDetails(job, self.jobsStoreMaxAgeHours) \
+                    and self.jobsStore.loadDetails(job):
+                logger.debug(f"Reusing stored details of {job.job} at {job.company}.")
+                instrumentation.count("details_reused")
+                yield job
+            else:
+                jobsToFetch.append(job)
+
+        if self.detailsFetchConcurrency > 1 and jobsToFetch:
+            logger.info(f"Fetching details of {len(jobsToFetch)} jobs with {self.detailsFetchConcurrency} HTTP sessions...")
+            httpFetcher = HttpJobDetailsFetcher(cookies)
+            with instrumentation.timer(STAGE_DETAILS_FETCH):
+                pages = fetchConcurrently([job.url for job in jobsToFetch], httpFetcher.fetch,
+                                            self.detailsFetchConcurrency, RateLimiter(self.detailsRequestsPerSecond))
+            instrumentation.count("details_fetched_http", sum(page is not None for page in pages))
+            for job, page in zip(jobsToFetch, pages):
+                details = self.parseJobPageDetails(page) if page else LINKEDIN_NO_JOB_DETAILS
+                if details != LINKEDIN_NO_JOB_DETAILS:
+                    job.details = details
+
+        for job in jobsToFetch:
+            if job.details is None:
+                try:
+                    with instrumentation.timer(STAGE_DETAILS_FETCH, job.label):
+                        browser.get(job.url)
+                        # Fall back to the current page source if the details are not rendered in time
+                        waiter.waitFor(f"job details of {job.job}", expected_conditions.presence_of_element_located(
+                                        (By.ID, LINKEDIN_JOB_DETAILS_ID)), WEBDRIVER_PAGE_LOAD_TIMEOUT)
+                    pageSource = browser.page_source
+                except WebDriverException as e:
+                    # A single broken job page does not end the sync, the job is built without its details
+                    logger.error(f"Failed to fetch details of {job.job} at {job.company} from {job.url}: {e.msg}")
+                    instrumentation.count("details_fetch_failed")
+                    yield job
+                    continue
+                instrumentation.count("details_fetched_webdriver")
+                job.details = self.parseJobPageDetails(pageSource)
+            # The placeholder of a page without details is never stored, so the next sync fetches the details again
+            if self.jobsStore is not None and job.details != LINKEDIN_NO_JOB_DETAILS and self.jobsStore.offloadDetails(job):
+                logger.debug(f"Stored new or changed details of {job.job} at {job.company}.")
+            yield job
 
     def getSavedJobs(self) -> list[Job]:
+        return list(self.iterSavedJobs())
+
+    def iterSavedJobs(self) -> Iterator[Job]:
+        """Fetch the saved jobs list, then yield every saved job as soon as its details are parsed.
+        The WebDriver is closed when the iteration ends or the generator is closed.
+        """
         savedJobs = []
-        print("Initializing webdriver...")
-        if self.webDriver == WebDriver.WEBDRIVER_SAFARI:
-            browser = webdriver.Safari(service=Service(executable_path=WEBDRIVER_SAFARI_PATH))
-        else:
-            print("WebDriver not supported yet.")
-            return
-
-        time.sleep(WEBDRIVER_SETUP_SLEEP_TIME)
-        # Load cookies
-        print("Loading cookies...")
-        with open(self.cookiesFileDir, "r") as f:
-            cookies = json.load(fp=f)
-            for cookie in cookies:
-                browser.add_cookie(cookie_dict=cookie)
-                print(f"Added cookie \"{cookie['name']}\":\"{cookie['value']}\"")
-
-        time.sleep(WEBDRIVER_SETUP_SLEEP_TIME)
+        if self.browserSession is None:
+            self.browserSession = BrowserSession(self.cookiesFileDir, self.webDriver, self.headless, cookiesUrl=LINKEDIN_HOME_PAGE)
+        browser = self.browserSession.acquire()
+        waiter = ReadinessWaiter(browser)
+        savedJobsListPresent = expected_conditions.presence_of_element_located((By.CSS_SELECTOR, LINKEDIN_SAVEDJOBS_LIST_READY_CSS))
+        signInFormPresent = expected_conditions.presence_of_element_located((By.ID, LINKEDIN_SIGNIN_USERNAME_ID))
         page = 0
         # Check all My Saved Jobs pages but no more than 10 of them.
         while page < 10:
             linkedInMySavedJobsUrl = LINKEDIN_MY_SAVED_JOBS_PAGE.replace("<PAGE>", str(page))
-            print(f"Opening {linkedInMySavedJobsUrl}...")
-            browser.get(linkedInMySavedJobsUrl)
-            # wait for page to load
-            time.sleep(WEBDRIVER_PAGE_LOAD_SLEEP_TIME)
-            # Wait for page opening
+            logger.info(f"Opening {linkedInMySavedJobsUrl}...")
+            with instrumentation.timer(STAGE_LIST_PAGE_LOAD):
+                browser.get(linkedInMySavedJobsUrl)
+                # Wait for either the saved jobs list or the sign in form
+                waiter.waitFor(f"saved jobs page {page}", expected_conditions.any_of(savedJobsListPresent, signInFormPresent),
+                                WEBDRIVER_PAGE_LOAD_TIMEOUT)
             try:
                 # Try to sign in if needed
                 usernameInput = browser.find_element(By.ID, LINKEDIN_SIGNIN_USERNAME_ID)
@@ -126,33 +252,47 @@ class LinkedInFetcherService(IJobsFetcherService):
                 passwordInput.send_keys(self.password)
                 signInButton  = browser.find_element(By.CSS_SELECTOR, LINKEDIN_SIGNIN_BUTTON_CSS_SELECTOR)
                 signInButton.click()
-                time.sleep(WEBDRIVER_PAGE_LOAD_SLEEP_TIME)
+                waiter.waitFor("sign in", savedJobsListPresent, WEBDRIVER_PAGE_LOAD_TIMEOUT)
             except NoSuchElementException as e:
-                print("Failed to sign in. The user might be already signed in.")
+                logger.info("Failed to sign in. The user might be already signed in.")
             
             linkedInMySavedJobsPage = browser.page_source
             try:
                 self.parsePageForSavedJobs(savedJobs, linkedInMySavedJobsPage)
             except NoSuchElementException as e:
-                print("No element: {}\nStack trace: \n{}".format(e.msg, e.stacktrace))
+                logger.error("No element: {}\nStack trace: \n{}".format(e.msg, e.stacktrace))
                 break
             except IndexError as e:
-                print("Index out of range, no element found. No more pages to check.")
+                logger.info("Index out of range, no element found. No more pages to check.")
                 break
             page += 1
 
-        # Get job details
-        for job in savedJobs:
-            browser.get(job.url)
-            time.sleep(WEBDRIVER_PAGE_LOAD_SLEEP_TIME)
-            job.details = self.parseJobPageDetails(browser.page_source)
-            job.letterRecipient = job.company # TODO - to update for more data
-            job.letterAddress = job.location # TODO - to update for more data
-            job.isVisaRequired = "0" # TODO - to update for more data
-
-        browser.close()
-        browser.quit()
-        return savedJobs
+        # The sign in form is still shown if the sign in failed
+        isSignedIn = not browser.find_elements(By.ID, LINKEDIN_SIGNIN_USERNAME_ID)
+        isSynced = False
+        # Get job details, the HTTP sessions use the cookies refreshed by the sign in
+        try:
+            for job in self.iterJobDetails(savedJobs, browser, waiter, self.browserSession.getCookies()):
+                job.letterRecipient = job.company # TODO - to update for more data
+                job.letterAddress = job.location # TODO - to update for more data
+                job.isVisaRequired = "0" # TODO - to update for more data
+                yield job
+            isSynced = True
+        finally:
+            waiter.report()
+            if not self.keepSessionAlive:
+                self.close()
+            elif isSynced and isSignedIn:
+                # Only the cookies of an authenticated session which completed the sync replace the stored ones
+                self.browserSession.persistCookies()
+
+    def checkHealth(self) -> bool:
+        return self.browserSession.checkHealth() if self.browserSession is not None else True
+
+    def close(self):
+        if self.browserSession is not None:
+            self.browserSession.close()
+            self.browserSession = None
 
 def main():
     fetcherService = LinkedInFetcherService()
@@ -0,0 +1,117 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Concurrent fetching of the saved jobs from all configured job portals, with per-portal timeouts and merging of the results.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import asyncio, re, time
+
+from .IJobsFetcherService import Job
+from .IAsyncJobsFetcherService import IAsyncJobsFetcherService
+from .FetcherRegistry import FETCH_DEFAULT_TIMEOUT_SECONDS
+from Utils.Logging.LogHandler import getLogger, logEvent
+
+logger = getLogger(__name__)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+def normalizeJobField(text: str) -> str:
+    return WHITESPACE_PATTERN.sub(" ", text or "").strip().casefold()
+
+def getJobIdentity(job: Job) -> tuple[str, str, str]:
+    """Get the portal independent identity of a job, used to find the same posting reported by several portals.
+
+    Args:
+        job (Job): job
+
+    Returns:
+        tuple[str, str, str]: normalized company, job and location
+    """
+    return normalizeJobField(job.company), normalizeJobField(job.job), normalizeJobField(job.location)
+
+def mergeSavedJobs(jobLists: list[list[Job]]) -> list[Job]:
+    """Merge the saved jobs of all portals, keeping the first occurrence of jobs reported by several portals.
+    Missing details of the kept job are taken from its duplicates. Jobs of the same portal are never merged here,
+    the near-duplicates within a portal are collapsed by the JobsDeduplicator.
+
+    Args:
+        jobLists (list[list[Job]]): saved jobs of each portal, in the portal priority order
+
+    Returns:
+        list[Job]: merged saved jobs
+    """
+    mergedJobs = []
+    keptJobs = {}
+    for jobs in jobLists:
+        portalJobs = {}
+        for job in jobs:
+            identity = getJobIdentity(job)
+            keptJob = keptJobs.get(identity)
+            if keptJob is None:
+                mergedJobs.append(job)
+                portalJobs.setdefault(identity, job)
+            else:
+                logger.debug(f"Skipping duplicate of {job.job} at {job.company} from {job.url}.")
+                if not keptJob.details and job.details:
+                    keptJob.details = job.details
+        # Jobs of the next portals are merged into the first job of this portal with the same identity
+        for identity, job in portalJobs.items():
+            keptJobs.setdefault(identity, job)
+    return mergedJobs
+
+async def fetchPortalSavedJobs(fetcher: IAsyncJobsFetcherService, timeout: float, failedPortals: list[str] = None) -> list[Job]:
+    """Fetch the saved jobs of one portal, a failed or timed out portal does not fail the others.
+
+    Args:
+        fetcher (IAsyncJobsFetcherService): portal fetcher
+        timeout (float): portal timeout in seconds
+        failedPortals (list[str], optional): the portal name is appended to it on failure. Defaults to None.
+
+    Returns:
+        list[Job]: saved jobs, empty on failure
+    """
+    startTime = time.perf_counter()
+    try:
+        savedJobs = await asyncio.wait_for(fetcher.getSavedJobs(), timeout) or []
+    except asyncio.TimeoutError:
+        logger.error(f"Fetching saved jobs from {fetcher.name} timed out after {timeout} s.")
+    except Exception as e:
+        logger.exception(f"Fetching saved jobs from {fetcher.name} failed: {e}")
+    else:
+        logEvent(logger, "portal_fetched", portal=fetcher.name, jobs=len(savedJobs), durationSeconds=round(time.perf_counter() - startTime, 3))
+        return savedJobs
+    if failedPortals is not None:
+        failedPortals.append(fetcher.name)
+    return []
+
+async def fetchAllSavedJobs(fetchers: list[IAsyncJobsFetcherService], timeout: float = FETCH_DEFAULT_TIMEOUT_SECONDS,
+                            failedPortals: list[str] = None) -> list[Job]:
+    """Fetch the saved jobs of all portals concurrently and merge them.
+
+    Args:
+        fetchers (list[IAsyncJobsFetcherService]): portal fetchers, in the priority order used to resolve duplicates
+        timeout (float, optional): default portal timeout in seconds, overridden by the fetcher timeout. Defaults to FETCH_DEFAULT_TIMEOUT_SECONDS.
+        failedPortals (list[str], optional): names of the failed or timed out portals are appended to it. Defaults to None.
+
+    Returns:
+        list[Job]: merged saved jobs
+    """
+    jobLists = await asyncio.gather(*[fetchPortalSavedJobs(fetcher, fetcher.timeout if fetcher.timeout is not None else timeout, failedPortals)
+                                        for fetcher in fetchers])
+    return mergeSavedJobs(jobLists)
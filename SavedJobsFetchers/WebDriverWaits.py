@@ -0,0 +1,82 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Event-driven WebDriver readiness waits replacing fixed sleeps.
+# Each step waits for a concrete page condition with its own timeout and records the real wait time.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .IJobsFetcherService import WEBDRIVER_POLL_FREQUENCY
+from Utils.Logging.LogHandler import getLogger
+
+logger = getLogger(__name__)
+
+def isDocumentReady(browser) -> bool:
+    return browser.execute_script("return document.readyState") == "complete"
+
+class ReadinessWaiter:
+    """Waits for page conditions and records how long each step has actually waited.
+    """
+    def __init__(self, browser, pollFrequency: float = WEBDRIVER_POLL_FREQUENCY):
+        """Create a readiness waiter.
+
+        Args:
+            browser: Selenium WebDriver instance
+            pollFrequency (float, optional): condition polling period in seconds. Defaults to WEBDRIVER_POLL_FREQUENCY.
+        """
+        self.browser = browser
+        self.pollFrequency = pollFrequency
+        self.waitTimes = []
+
+    def waitFor(self, step: str, condition, timeout: float) -> bool:
+        """Wait until the condition is met or the timeout expires.
+        On timeout the caller falls back to the current page state, no exception is raised.
+
+        Args:
+            step (str): step name used in the report
+            condition: callable taking the WebDriver, e.g. one of selenium.webdriver.support.expected_conditions
+            timeout (float): step timeout in seconds
+
+        Returns:
+            bool: True if the condition was met, False on timeout
+        """
+        start = time.perf_counter()
+        try:
+            WebDriverWait(self.browser, timeout, poll_frequency=self.pollFrequency).until(condition)
+            isReady = True
+        except TimeoutException:
+            isReady = False
+        waitTime = time.perf_counter() - start
+        self.waitTimes.append((step, waitTime, isReady))
+        if isReady:
+            logger.debug(f"Waited {waitTime:.2f} s for {step}.")
+        else:
+            logger.warning(f"Waited {waitTime:.2f} s for {step}, timed out after {timeout} s.")
+        return isReady
+
+    def report(self):
+        """Log the total wait time and the number of timeouts.
+        """
+        totalWaitTime = sum(waitTime for _, waitTime, _ in self.waitTimes)
+        timeouts = [step for step, _, isReady in self.waitTimes if not isReady]
+        logger.info(f"WebDriver waits: {len(self.waitTimes)} steps, {totalWaitTime:.2f} s in total, {len(timeouts)} timed out"
+                + (f" ({', '.join(timeouts)})." if timeouts else "."))
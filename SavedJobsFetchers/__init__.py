@@ -1 +0,0 @@
-print("Importing content of the SavedJobsFetchers package.")
@@ -0,0 +1,278 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Local skills scoring service. Keeps the compiled skills index in memory and scores job descriptions over HTTP
+# on a TCP port or a Unix socket, returning the ranked skills and the rendered skills LaTeX block without touching any file.
+#
+# Usage:
+#   python -m Services.ScoringService [-sj=User/skills.json] [--port=8765] [--socket=.cache/scoring.sock]
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import argparse, json, os, socket, socketserver, threading, time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from Utils.Skills.SkillsDatabase import SkillsDatabase, getSkillsDatabase, SkillsSchemaError
+from Utils.Skills.SkillsRenderer import rankSectionSkills, renderSkillsLatex
+from Utils.Metrics.Instrumentation import percentile
+from Utils.Logging.LogHandler import getLogger, setupLogging
+
+logger = getLogger(__name__)
+
+SCORING_DEFAULT_HOST = "127.0.0.1"
+SCORING_DEFAULT_PORT = 8765
+SCORING_DEFAULT_SKILLS_FILE = os.path.join("User", "skills.json")
+# Number of the latest requests used for the latency percentiles
+SCORING_LATENCY_WINDOW = 1000
+SCORING_MAX_REQUEST_SIZE = 16 * 1024 * 1024
+SCORING_CONNECT_TIMEOUT = 1.0
+SCORING_PATH_SCORE = "/score"
+SCORING_PATH_HEALTH = "/health"
+SCORING_PATH_STATS = "/stats"
+
+class ScoringRequestError(ValueError):
+    """Raised on a malformed scoring request.
+    """
+    pass
+
+class ScoringService:
+    """Scores job descriptions against the skills JSON file. The compiled skills index is reloaded when the file changes.
+    Transport independent, requests are passed to handleRequest() by the HTTP handler.
+    """
+    def __init__(self, skillsFile: str = SCORING_DEFAULT_SKILLS_FILE, maxSkillsPerSection: int = None):
+        """Create a scoring service.
+
+        Args:
+            skillsFile (str, optional): path to the skills JSON file. Defaults to SCORING_DEFAULT_SKILLS_FILE.
+            maxSkillsPerSection (int, optional): default maximum number of skills in a section. Defaults to None (all skills).
+        """
+        self.skillsFile = skillsFile
+        self.maxSkillsPerSection = maxSkillsPerSection
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=SCORING_LATENCY_WINDOW)
+        self.requests = 0
+        self.failedRequests = 0
+
+    def getDatabase(self) -> SkillsDatabase:
+        database = getSkillsDatabase(self.skillsFile)
+        if database is None:
+            raise FileNotFoundError(f"Skills file {self.skillsFile} not found.")
+        return database
+
+    def scoreDescriptions(self, descriptions: list[str], maxSkillsPerSection: int = None, withLatex: bool = True,
+                            database: SkillsDatabase = None) -> list[dict]:
+        """Score a batch of job descriptions.
+
+        Args:
+            descriptions (list[str]): job descriptions
+            maxSkillsPerSection (int, optional): maximum number of skills in a section. Defaults to the service default.
+            withLatex (bool, optional): render the skills LaTeX block of every description. Defaults to True.
+            database (SkillsDatabase, optional): skills database of the request, so a reload cannot change it mid-request. Defaults to getDatabase().
+
+        Returns:
+            list[dict]: per description the skill section name mapped to the ranked skills and scores, and the LaTeX block
+        """
+        maxSkillsPerSection = maxSkillsPerSection if maxSkillsPerSection is not None else self.maxSkillsPerSection
+        matcher = (database or self.getDatabase()).matcher
+        results = []
+        for skillScores in matcher.scoreJobs(descriptions):
+            sections = {}
+            for skillSection, sectionScores in matcher.splitScores(skillScores).items():
+                sectionSkills = [compiledSkill.skill for compiledSkill in matcher.sections[skillSection]]
+                sections[skillSection] = [{"skill": skill["skill"], "score": score}
+                                            for skill, score in rankSectionSkills(sectionSkills, sectionScores, maxSkillsPerSection)]
+            result = {"sections": sections, "highlightedSkills": sum(score > 0 for score in skillScores)}
+            if withLatex:
+                result["latex"] = renderSkillsLatex(matcher, skillScores, maxSkillsPerSection)
+            results.append(result)
+        return results
+
+    def getStats(self) -> dict:
+        with self.lock:
+            latencies = list(self.latencies)
+            requests, failedRequests = self.requests, self.failedRequests
+        return {"requests": requests, "failedRequests": failedRequests,
+                "latencyMs": {"p50": percentile(latencies, 50), "p95": percentile(latencies, 95), "p99": percentile(latencies, 99),
+                              "max": max(latencies) if latencies else None}}
+
+    def parseScoreRequest(self, body: bytes) -> tuple[list[str], int, bool]:
+        try:
+            request = json.loads(body or b"{}")
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ScoringRequestError(f"Invalid JSON: {e}")
+        if not isinstance(request, dict):
+            raise ScoringRequestError("Request shall be a JSON object.")
+        if "description" in request:
+            descriptions = [request["description"]]
+        else:
+            descriptions = request.get("descriptions")
+        if not isinstance(descriptions, list) or not all(isinstance(description, str) for description in descriptions):
+            raise ScoringRequestError("Request shall contain a \"description\" string or a \"descriptions\" list of strings.")
+        maxSkillsPerSection = request.get("maxSkillsPerSection")
+        if maxSkillsPerSection is not None and (not isinstance(maxSkillsPerSection, int) or maxSkillsPerSection < 0):
+            raise ScoringRequestError("\"maxSkillsPerSection\" shall be a non-negative integer.")
+        withLatex = request.get("latex", True)
+        if not isinstance(withLatex, bool):
+            raise ScoringRequestError("\"latex\" shall be a boolean.")
+        return descriptions, maxSkillsPerSection, withLatex
+
+    def handleRequest(self, method: str, path: str, body: bytes = b"") -> tuple[int, dict]:
+        """Handle a service request.
+
+        Args:
+            method (str): HTTP method
+            path (str): request path, e.g. SCORING_PATH_SCORE
+            body (bytes, optional): JSON request body. Defaults to b"".
+
+        Returns:
+            tuple[int, dict]: HTTP status code and the JSON response
+        """
+        startTime = time.perf_counter()
+        try:
+            if method == "POST" and path == SCORING_PATH_SCORE:
+                descriptions, maxSkillsPerSection, withLatex = self.parseScoreRequest(body)
+                # The results and the skills hash come from the same database, even if the skills file changes meanwhile
+                database = self.getDatabase()
+                status, response = 200, {"results": self.scoreDescriptions(descriptions, maxSkillsPerSection, withLatex, database),
+                                            "skillsHash": database.sourceHash}
+            elif method == "GET" and path == SCORING_PATH_HEALTH:
+                database = self.getDatabase()
+                status, response = 200, {"status": "ok", "skillsFile": self.skillsFile, "skillsHash": database.sourceHash,
+                                            "skills": database.matcher.skillsCount}
+            elif method == "GET" and path == SCORING_PATH_STATS:
+                # Not counted in the latency statistics
+                return 200, self.getStats()
+            else:
+                status, response = 404, {"error": f"Unknown endpoint {method} {path}."}
+        except ScoringRequestError as e:
+            status, response = 400, {"error": str(e)}
+        except (OSError, SkillsSchemaError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to load the skills file {self.skillsFile}: {e}")
+            status, response = 500, {"error": f"Failed to load the skills file: {e}"}
+        except Exception as e:
+            # An unexpected error fails the request only, it is counted like any other failed request
+            logger.exception(f"Failed to handle {method} {path}: {e}")
+            status, response = 500, {"error": f"Internal error: {e}"}
+        latency = (time.perf_counter() - startTime) * 1000
+        with self.lock:
+            self.requests += 1
+            self.failedRequests += status != 200
+            self.latencies.append(latency)
+        response["latencyMs"] = round(latency, 3)
+        return status, response
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    # Keep-alive connections avoid a TCP handshake per request
+    protocol_version = "HTTP/1.1"
+
+    def handleServiceRequest(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > SCORING_MAX_REQUEST_SIZE:
+            status, response = 413, {"error": "Request too large."}
+            self.close_connection = True
+        else:
+            status, response = self.server.scoringService.handleRequest(self.command, self.path.split("?", 1)[0], self.rfile.read(length))
+        content = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = handleServiceRequest
+    do_POST = handleServiceRequest
+
+    def address_string(self) -> str:
+        # Unix socket clients have no address
+        return self.client_address[0] if isinstance(self.client_address, tuple) and self.client_address else "unix"
+
+    def log_message(self, format: str, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+class UnixScoringServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+def removeStaleSocket(socketPath: str):
+    """Remove the Unix socket left behind by a stopped service.
+
+    Raises:
+        RuntimeError: if a service is still listening on the socket
+    """
+    if not os.path.exists(socketPath):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(SCORING_CONNECT_TIMEOUT)
+        try:
+            client.connect(socketPath)
+        except OSError:
+            os.remove(socketPath)
+            return
+    raise RuntimeError(f"A scoring service is already listening on {socketPath}.")
+
+def createScoringServer(scoringService: ScoringService, host: str = SCORING_DEFAULT_HOST, port: int = SCORING_DEFAULT_PORT,
+                        socketPath: str = None) -> socketserver.BaseServer:
+    """Create the HTTP server of the scoring service, call serve_forever() to run it.
+
+    Args:
+        scoringService (ScoringService): scoring service
+        host (str, optional): TCP host, local only by default. Defaults to SCORING_DEFAULT_HOST.
+        port (int, optional): TCP port, 0 selects a free port. Defaults to SCORING_DEFAULT_PORT.
+        socketPath (str, optional): Unix socket path, used instead of the TCP port if given. Defaults to None.
+
+    Returns:
+        socketserver.BaseServer: HTTP server
+    """
+    if socketPath is not None:
+        removeStaleSocket(socketPath)
+        # Only the user running the service can connect, also between bind and chmod
+        previousUmask = os.umask(0o177)
+        try:
+            server = UnixScoringServer(socketPath, ScoringRequestHandler)
+        finally:
+            os.umask(previousUmask)
+        os.chmod(socketPath, 0o600)
+    else:
+        server = ThreadingHTTPServer((host, port), ScoringRequestHandler)
+    server.scoringService = scoringService
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Local skills scoring service.")
+    parser.add_argument("-sj",  "--skills_json", help="Specify the path to the JSON skills file.", required=False, default=SCORING_DEFAULT_SKILLS_FILE)
+    parser.add_argument("-sps", "--skills_per_section", help="Specify the default maximum number of skills in a skills section.", required=False, type=int, default=None)
+    parser.add_argument("--host", help="Specify the TCP host to listen on.", required=False, default=SCORING_DEFAULT_HOST)
+    parser.add_argument("--port", help="Specify the TCP port to listen on.", required=False, type=int, default=SCORING_DEFAULT_PORT)
+    parser.add_argument("--socket", help="Specify the Unix socket to listen on instead of the TCP port.", required=False, default=None)
+    args = parser.parse_args()
+    setupLogging()
+    scoringService = ScoringService(args.skills_json, args.skills_per_section)
+    # Compile the skills index before the first request
+    scoringService.getDatabase()
+    with createScoringServer(scoringService, args.host, args.port, args.socket) as server:
+        logger.info(f"Scoring service listening on {args.socket or f'http://{args.host}:{server.server_address[1]}'}.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Scoring service stopped.")
+        finally:
+            if args.socket is not None and os.path.exists(args.socket):
+                os.remove(args.socket)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Sync daemon. Keeps the fetchers with their warm, authenticated browser sessions, the jobs store and the skills index
+# between the syncs, which are triggered over a Unix socket, e.g. by cronjob.sh.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import json, os, socket, socketserver, threading, time
+from typing import Callable
+
+from Utils.Logging.LogHandler import getLogger, logEvent
+
+logger = getLogger(__name__)
+
+DAEMON_DEFAULT_SOCKET = os.path.join(".cache", "updatecv.sock")
+DAEMON_DEFAULT_HEALTH_CHECK_INTERVAL = 300
+DAEMON_CONNECT_TIMEOUT = 1.0
+DAEMON_MAX_REQUEST_SIZE = 64 * 1024
+# Requests, one JSON line each: {"command": ..., "resume": bool}
+DAEMON_COMMAND_SYNC = "sync"
+DAEMON_COMMAND_STATUS = "status"
+DAEMON_COMMAND_STOP = "stop"
+# Response statuses
+DAEMON_STATUS_COMPLETED = "completed"
+DAEMON_STATUS_INCOMPLETE = "incomplete"
+DAEMON_STATUS_FAILED = "failed"
+DAEMON_STATUS_BUSY = "busy"
+DAEMON_STATUS_IDLE = "idle"
+DAEMON_STATUS_STOPPING = "stopping"
+DAEMON_STATUS_ERROR = "error"
+
+def sendDaemonRequest(socketPath: str, request: dict, timeout: float = None) -> dict:
+    """Send a request to the sync daemon and wait for its response.
+
+    Args:
+        socketPath (str): path to the daemon Unix socket
+        request (dict): request, e.g. {"command": DAEMON_COMMAND_SYNC}
+        timeout (float, optional): response timeout in seconds. Defaults to None (wait until the sync ends).
+
+    Raises:
+        OSError: if no daemon is listening on the socket
+
+    Returns:
+        dict: daemon response
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(DAEMON_CONNECT_TIMEOUT)
+        client.connect(socketPath)
+        client.settimeout(timeout)
+        client.sendall((json.dumps(request) + "\n").encode())
+        with client.makefile("rb") as responseFile:
+            response = responseFile.readline()
+    if not response:
+        raise ConnectionError(f"The sync daemon at {socketPath} closed the connection.")
+    return json.loads(response)
+
+class SyncDaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline(DAEMON_MAX_REQUEST_SIZE))
+            response = self.server.syncDaemon.handleRequest(request) if isinstance(request, dict) else \
+                {"status": DAEMON_STATUS_ERROR, "error": "Request shall be a JSON object."}
+        except json.JSONDecodeError as e:
+            response = {"status": DAEMON_STATUS_ERROR, "error": f"Invalid request: {e}"}
+        self.wfile.write((json.dumps(response) + "\n").encode())
+
+class SyncDaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class SyncDaemon:
+    """Resident service running the syncs requested over a Unix socket, one at a time.
+    The fetchers are health-checked between the syncs, so a dead browser session is recycled before the next sync.
+    """
+    def __init__(self, socketPath: str, runSync: Callable[[bool], bool], fetchers: list = (),
+                    healthCheckInterval: float = DAEMON_DEFAULT_HEALTH_CHECK_INTERVAL):
+        """Create a sync daemon.
+
+        Args:
+            socketPath (str): path to the Unix socket to listen on
+            runSync (Callable[[bool], bool]): runs one sync, resuming the last one if the argument is True, returns True if completed
+            fetchers (list, optional): fetchers kept between the syncs, health-checked and closed with the daemon. Defaults to ().
+            healthCheckInterval (float, optional): time in seconds between the health checks. Defaults to DAEMON_DEFAULT_HEALTH_CHECK_INTERVAL.
+        """
+        self.socketPath = socketPath
+        self.runSync = runSync
+        self.fetchers = list(fetchers)
+        self.healthCheckInterval = healthCheckInterval
+        self.syncLock = threading.Lock()
+        self.stopEvent = threading.Event()
+        self.server = None
+        self.startTime = None
+        self.syncs = 0
+        self.lastSync = None
+
+    def handleRequest(self, request: dict) -> dict:
+        command = request.get("command")
+        if command == DAEMON_COMMAND_SYNC:
+            return self.sync(bool(request.get("resume")))
+        if command == DAEMON_COMMAND_STATUS:
+            return {"status": DAEMON_STATUS_BUSY if self.syncLock.locked() else DAEMON_STATUS_IDLE, "syncs": self.syncs,
+                    "lastSync": self.lastSync, "uptimeSeconds": round(time.monotonic() - self.startTime, 3)}
+        if command == DAEMON_COMMAND_STOP:
+            # shutdown() waits for serve_forever() to return, it cannot be called from the serving thread
+            threading.Thread(target=self.server.shutdown, name="sync-daemon-shutdown").start()
+            return {"status": DAEMON_STATUS_STOPPING}
+        return {"status": DAEMON_STATUS_ERROR, "error": f"Unknown command {command}."}
+
+    def sync(self, resume: bool = False) -> dict:
+        if not self.syncLock.acquire(blocking=False):
+            logger.warning("Sync requested while the previous sync is still running.")
+            return {"status": DAEMON_STATUS_BUSY}
+        startTime = time.perf_counter()
+        try:
+            logger.info(f"Starting the {'resumed ' if resume else ''}sync requested over {self.socketPath}...")
+            status = DAEMON_STATUS_COMPLETED if self.runSync(resume) else DAEMON_STATUS_INCOMPLETE
+            response = {"status": status}
+        except Exception as e:
+            logger.exception(f"Sync failed: {e}")
+            response = {"status": DAEMON_STATUS_FAILED, "error": str(e)}
+        finally:
+            self.syncLock.release()
+        response["durationSeconds"] = round(time.perf_counter() - startTime, 3)
+        self.syncs += 1
+        self.lastSync = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), **response}
+        logEvent(logger, "daemon_sync", resume=resume, **response)
+        return response
+
+    def checkHealth(self):
+        """Health-check the fetchers, skipped while a sync is running.
+        """
+        if not self.syncLock.acquire(blocking=False):
+            return
+        try:
+            for fetcher in self.fetchers:
+                try:
+                    if not fetcher.checkHealth():
+                        logger.warning(f"Fetcher {getattr(fetcher, 'name', type(fetcher).__name__)} is not ready for the next sync.")
+                except Exception as e:
+                    logger.exception(f"Health check failed: {e}")
+        finally:
+            self.syncLock.release()
+
+    def runHealthChecks(self):
+        while not self.stopEvent.wait(self.healthCheckInterval):
+            self.checkHealth()
+
+    def removeStaleSocket(self):
+        if not os.path.exists(self.socketPath):
+            return
+        try:
+            sendDaemonRequest(self.socketPath, {"command": DAEMON_COMMAND_STATUS}, DAEMON_CONNECT_TIMEOUT)
+        except OSError:
+            os.remove(self.socketPath)
+            return
+        raise RuntimeError(f"A sync daemon is already listening on {self.socketPath}.")
+
+    def serve(self):
+        """Serve the requests until the stop command or KeyboardInterrupt, then close the fetchers.
+        """
+        if os.path.dirname(self.socketPath):
+            os.makedirs(os.path.dirname(self.socketPath), exist_ok=True)
+        self.removeStaleSocket()
+        self.startTime = time.monotonic()
+        healthCheckThread = threading.Thread(target=self.runHealthChecks, name="sync-daemon-health", daemon=True)
+        try:
+            # Only the user running the daemon can trigger syncs, also between bind and chmod
+            previousUmask = os.umask(0o177)
+            try:
+                server = SyncDaemonServer(self.socketPath, SyncDaemonRequestHandler)
+            finally:
+                os.umask(previousUmask)
+            with server:
+                self.server = server
+                server.syncDaemon = self
+                os.chmod(self.socketPath, 0o600)
+                healthCheckThread.start()
+                logger.info(f"Sync daemon listening on {self.socketPath}.")
+                try:
+                    server.serve_forever()
+                except KeyboardInterrupt:
+                    logger.info("Sync daemon interrupted.")
+        finally:
+            self.stopEvent.set()
+            if healthCheckThread.is_alive():
+                healthCheckThread.join()
+            for fetcher in self.fetchers:
+                try:
+                    fetcher.close()
+                except Exception as e:
+                    logger.exception(f"Failed to close the fetcher: {e}")
+            if os.path.exists(self.socketPath):
+                os.remove(self.socketPath)
+            logger.info("Sync daemon stopped.")
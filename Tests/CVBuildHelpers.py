@@ -0,0 +1,44 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Helpers shared by the CV build tests: the recipients template and a stand-in for gmake.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import os, subprocess
+
+RECIPIENTS_TEMPLATE = "\n".join([
+    r"\newcommand\positionCompany{Company}",
+    r"\newcommand\positionName{Job}",
+    r"\newcommand\positionLocation{Location}",
+    r"\newcommand\positionVisa{0}",
+    r"\newcommand\recipient{Recipient}",
+    r"\newcommand\recipientAddress{Address}",
+    ""])
+
+RUN = subprocess.run
+
+# Stand-in for subprocess.run of gmake, writes a PDF with the rendered skills. Other commands, e.g. git, are run.
+def fakeGmake(args, cwd=None, **kwargs):
+    if args[0] != "gmake":
+        return RUN(args, cwd=cwd, **kwargs)
+    variables = dict(arg.split("=", 1) for arg in args[2:])
+    os.makedirs(os.path.join(cwd, "out"), exist_ok=True)
+    with open(os.path.join(cwd, "out", f"cv_{variables['company']}_{variables['job']}.pdf"), "w") as file:
+        file.write(open(os.path.join(cwd, "data", "04_skills.tex")).read())
+    return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
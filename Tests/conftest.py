@@ -0,0 +1,35 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Fixtures shared by the CV build tests.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import pytest
+
+from Tests.CVBuildHelpers import RECIPIENTS_TEMPLATE
+
+@pytest.fixture
+def cvDir(tmp_path):
+    cvDir = tmp_path / "CV-Templates"
+    (cvDir / "data").mkdir(parents=True)
+    (cvDir / ".git").mkdir()
+    (cvDir / "data" / "12_recipients.tex").write_text(RECIPIENTS_TEMPLATE)
+    (cvDir / "data" / "04_skills.tex").write_text("")
+    (cvDir / "old_cv.pdf").write_text("old")
+    return str(cvDir)
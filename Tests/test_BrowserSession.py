@@ -0,0 +1,83 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the BrowserSession.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import json
+from selenium.common.exceptions import WebDriverException
+
+from SavedJobsFetchers.BrowserSession import BrowserSession
+from SavedJobsFetchers.IJobsFetcherService import WebDriver
+
+class FakeBrowser:
+    """WebDriver stub keeping the added cookies, dead browsers raise WebDriverException like a lost session.
+    """
+    def __init__(self):
+        self.isAlive = True
+        self.cookies = []
+        self.visitedUrls = []
+        self.isQuit = False
+
+    def execute_script(self, script: str):
+        if not self.isAlive:
+            raise WebDriverException("invalid session id")
+        return "complete"
+
+    def get(self, url: str):
+        self.visitedUrls.append(url)
+
+    def add_cookie(self, cookie_dict: dict):
+        self.cookies.append(cookie_dict)
+
+    def get_cookies(self) -> list[dict]:
+        return [{**cookie, "value": cookie["value"] + "-refreshed"} for cookie in self.cookies]
+
+    def quit(self):
+        self.isQuit = True
+
+def test_SessionReusedRecycledAndCookiesPersisted(tmp_path):
+    cookiesFile = tmp_path / "cookies.json"
+    cookiesFile.write_text(json.dumps([{"name": "li_at", "value": "token", "domain": ".linkedin.com"}]))
+    browsers = []
+    def driverFactory(webDriver, headless):
+        assert (webDriver, headless) == (WebDriver.WEBDRIVER_FIREFOX, True)
+        browsers.append(FakeBrowser())
+        return browsers[-1]
+
+    with BrowserSession(str(cookiesFile), WebDriver.WEBDRIVER_FIREFOX, headless=True, cookiesUrl="https://www.linkedin.com/",
+                        driverFactory=driverFactory) as session:
+        assert session.checkHealth() and browsers == []
+        browser = session.acquire()
+        assert session.acquire() is browser and len(browsers) == 1
+        assert browser.visitedUrls == ["https://www.linkedin.com/"] and browser.cookies[0]["value"] == "token"
+
+        # A dead session is recycled by the health check
+        browser.isAlive = False
+        assert session.checkHealth()
+        assert len(browsers) == 2 and browser.isQuit and session.acquire() is browsers[1]
+        session.persistCookies()
+    assert browsers[1].isQuit
+    assert json.loads(cookiesFile.read_text())[0]["value"] == "token-refreshed"
+
+    # Closing a session does not overwrite the cookies file
+    with BrowserSession(str(cookiesFile), WebDriver.WEBDRIVER_FIREFOX, headless=True, driverFactory=driverFactory) as session:
+        session.acquire()
+    assert browsers[2].isQuit
+    assert json.loads(cookiesFile.read_text())[0]["value"] == "token-refreshed"
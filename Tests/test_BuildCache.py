@@ -0,0 +1,116 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the BuildCache.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import os, subprocess, time
+
+import updatecv
+from CVBuilders.BuildCache import BuildCache, computeTemplateDigest
+from SavedJobsFetchers.IJobsFetcherService import Job
+from Utils.Metrics.Instrumentation import instrumentation
+from Tests.CVBuildHelpers import fakeGmake
+
+def test_TemplateDigestIgnoresOutputsAndExcludedFiles(cvDir):
+    digest = computeTemplateDigest(cvDir, [os.path.join("data", "12_recipients.tex")])
+    with open(os.path.join(cvDir, "new_cv.pdf"), "w") as f:
+        f.write("pdf")
+    with open(os.path.join(cvDir, "data", "12_recipients.tex"), "w") as f:
+        f.write("changed")
+    assert computeTemplateDigest(cvDir, [os.path.join("data", "12_recipients.tex")]) == digest
+    with open(os.path.join(cvDir, "main.tex"), "w") as f:
+        f.write("\\documentclass{article}")
+    assert computeTemplateDigest(cvDir, [os.path.join("data", "12_recipients.tex")]) != digest
+
+def test_TemplateDigestHashesOnlySources(tmp_path):
+    cvDir = tmp_path / "CV-Templates"
+    cvDir.mkdir()
+    subprocess.run(["git", "init", "-q", str(cvDir)], check=True)
+    (cvDir / ".gitignore").write_text("out/\n")
+    (cvDir / "main.tex").write_text("\\documentclass{article}")
+    (cvDir / "signature.pdf").write_text("asset")
+    digest = computeTemplateDigest(str(cvDir))
+    (cvDir / "out").mkdir()
+    (cvDir / "out" / "cv.pdf").write_text("pdf")
+    for intermediate in ["main.bbl", "main.bcf", "main.blg", "main.run.xml", "main.xdv", "main.toc"]:
+        (cvDir / intermediate).write_text("intermediate")
+    assert computeTemplateDigest(str(cvDir)) == digest
+    (cvDir / "signature.pdf").write_text("new asset")
+    assert computeTemplateDigest(str(cvDir)) != digest
+
+def test_RestoreRenamesTimestamp(tmp_path):
+    buildCache = BuildCache(str(tmp_path / "cache"))
+    outDir = tmp_path / "out"
+    outDir.mkdir()
+    (outDir / "cv_company_20250101.pdf").write_text("pdf")
+    buildCache.store("abcd", str(outDir), [str(outDir / "cv_company_20250101.pdf")], "20250101")
+    assert buildCache.restore("ffff", str(outDir), "20250102") is None
+    assert buildCache.restore("abcd", str(outDir), "20250102") == [str(outDir / "cv_company_20250102.pdf")]
+    assert (outDir / "cv_company_20250102.pdf").read_text() == "pdf"
+
+def test_EvictOldAndOversizedEntries(tmp_path):
+    buildCache = BuildCache(str(tmp_path / "cache"), maxSizeMB=1, maxAgeDays=1)
+    outDir = tmp_path / "out"
+    outDir.mkdir()
+    (outDir / "cv.pdf").write_bytes(b"0" * 400 * 1024)
+    for key in ["aa01", "bb02", "cc03"]:
+        buildCache.store(key, str(outDir), [str(outDir / "cv.pdf")], "20250101")
+        manifest = os.path.join(buildCache.entryDir(key), "manifest.json")
+        lastUsed = time.time() - (3 * 24 * 3600 if key == "aa01" else 0)
+        os.utime(manifest, (lastUsed, lastUsed))
+    buildCache.store("dd04", str(outDir), [str(outDir / "cv.pdf")], "20250101")
+    assert [os.path.isdir(buildCache.entryDir(key)) for key in ["aa01", "bb02", "cc03", "dd04"]] == [False, False, True, True]
+
+def test_RebuildCVsReusesCachedPDFs(cvDir, tmp_path, monkeypatch):
+    gmakeCalls = []
+    def countingGmake(args, cwd, **kwargs):
+        if args[0] == "gmake":
+            gmakeCalls.append(args)
+        return fakeGmake(args, cwd, **kwargs)
+    monkeypatch.setattr(updatecv.subprocess, "run", countingGmake)
+    buildCache = BuildCache(str(tmp_path / "cache"))
+    recipientsFile = os.path.join(cvDir, "data", "12_recipients.tex")
+    skillsFile = os.path.join(cvDir, "data", "04_skills.tex")
+    builtPDFs = updatecv.rebuildCVs(cvDir, recipientsFile, skillsFile, buildCache)
+    os.remove(builtPDFs[0])
+    assert updatecv.rebuildCVs(cvDir, recipientsFile, skillsFile, buildCache) == builtPDFs
+    assert os.path.isfile(builtPDFs[0]) and len(gmakeCalls) == 1
+    updatecv.rebuildCVs(cvDir, recipientsFile, skillsFile, buildCache, forceRebuild=True)
+    assert len(gmakeCalls) == 2
+
+def test_RebuildCVsDoesNotCacheFailedBuilds(cvDir, tmp_path, monkeypatch):
+    def failingGmake(args, cwd, **kwargs):
+        fakeGmake(args, cwd, **kwargs)
+        return subprocess.CompletedProcess(args, 2, stdout="", stderr="! LaTeX Error")
+    monkeypatch.setattr(updatecv.subprocess, "run", failingGmake)
+    buildCache = BuildCache(str(tmp_path / "cache"))
+    recipientsFile = os.path.join(cvDir, "data", "12_recipients.tex")
+    skillsFile = os.path.join(cvDir, "data", "04_skills.tex")
+    assert updatecv.rebuildCVs(cvDir, recipientsFile, skillsFile, buildCache) == []
+    assert os.listdir(buildCache.cacheDir) == []
+
+def test_BuildStagesReportedUnderTheJobLabel(cvDir, monkeypatch):
+    monkeypatch.setattr(updatecv.subprocess, "run", fakeGmake)
+    instrumentation.reset()
+    job = Job(company="R&D Audio", job="DSP Engineer", location="Boston, MA", url="https://portal/jobs/view/1/", details="Tasting")
+    updatecv.rebuildCV(job, None, cvDir, os.path.join(cvDir, "data", "12_recipients.tex"), os.path.join(cvDir, "data", "04_skills.tex"),
+                        os.path.join("User", "skills.json"))
+    # The LaTeX escaped fields would split the job into a second entry
+    assert list(instrumentation.buildReport()["jobs"]) == [job.label]
@@ -0,0 +1,61 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the BuildWorkspace and parallel CV builds.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import os, subprocess
+
+import updatecv
+from CVBuilders.BuildWorkspace import BuildWorkspace
+from SavedJobsFetchers.IJobsFetcherService import Job
+from Tests.CVBuildHelpers import RECIPIENTS_TEMPLATE, fakeGmake
+
+def test_WorkspaceCopiesTemplateWithoutOutputs(cvDir):
+    with BuildWorkspace(cvDir) as workspace:
+        assert os.path.isfile(workspace.path("data", "12_recipients.tex"))
+        assert not os.path.exists(workspace.path(".git"))
+        assert workspace.findPDFs() == []
+        workspaceRoot = workspace.root
+    assert not os.path.exists(workspaceRoot)
+
+def test_WorkspaceCopiesPDFAssetsButNotBuiltCVs(tmp_path):
+    cvDir = tmp_path / "CV-Templates"
+    (cvDir / "out").mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", str(cvDir)], check=True)
+    (cvDir / ".gitignore").write_text("out/\n")
+    (cvDir / "signature.pdf").write_text("asset")
+    (cvDir / "out" / "cv_old.pdf").write_text("old")
+    with BuildWorkspace(str(cvDir)) as workspace:
+        assert os.path.isfile(workspace.path("signature.pdf"))
+        assert not os.path.exists(workspace.path("out", "cv_old.pdf"))
+        assert workspace.findPDFs() == []
+        with open(workspace.path("out", "cv_new.pdf"), "w") as f:
+            f.write("new")
+        assert workspace.findPDFs() == [os.path.join("out", "cv_new.pdf")]
+
+def test_RebuildCVsInParallelLeavesSharedFilesUntouched(cvDir, monkeypatch):
+    monkeypatch.setattr(updatecv.subprocess, "run", fakeGmake)
+    jobs = [Job(company=f"Company {i}", job="DSP Engineer", location="Boston, MA", url="", details="Tasting") for i in range(4)]
+    skillScoreMatrix = updatecv.scoreSavedJobs(jobs, os.path.join("User", "skills.json"))
+    builtPDFs = updatecv.rebuildCVsInParallel(jobs, skillScoreMatrix, cvDir, "12_recipients.tex", "04_skills.tex",
+                                                os.path.join("User", "skills.json"), buildJobs=2)
+    assert [os.path.basename(pdfs[0]) for pdfs in builtPDFs] == [f"cv_company_{i}_dsp_engineer.pdf" for i in range(4)]
+    assert all(os.path.isfile(pdfs[0]) and "{Tasting/1}" in open(pdfs[0]).read() for pdfs in builtPDFs)
+    assert open(os.path.join(cvDir, "data", "12_recipients.tex")).read() == RECIPIENTS_TEMPLATE
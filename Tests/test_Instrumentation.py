@@ -0,0 +1,95 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the Instrumentation.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import json, pstats, threading
+
+from Utils.Metrics.Instrumentation import Instrumentation, percentile, STAGE_GMAKE, STAGE_SCORING
+from updatecv import scoreSavedJobs
+from SavedJobsFetchers.IJobsFetcherService import Job
+
+def test_Percentile():
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) is None
+
+def test_TimerReport(tmp_path):
+    instrumentation = Instrumentation()
+    for _ in range(3):
+        with instrumentation.timer(STAGE_GMAKE, "Company / Job / Location"):
+            pass
+    instrumentation.record(STAGE_SCORING, 0.5)
+    instrumentation.count("gmake_runs", 3)
+
+    reportFile = str(tmp_path / "report.json")
+    instrumentation.writeReport(reportFile)
+    with open(reportFile) as f:
+        report = json.load(f)
+    assert report["stages"][STAGE_GMAKE]["count"] == 3
+    assert report["stages"][STAGE_SCORING]["p95Seconds"] == 0.5
+    assert report["counters"] == {"gmake_runs": 3}
+    assert list(report["jobs"]["Company / Job / Location"]) == [STAGE_GMAKE]
+
+def test_ProfiledOnlyWhenEnabled(tmp_path):
+    instrumentation = Instrumentation()
+    with instrumentation.profiled():
+        pass
+    assert instrumentation.profilers is None
+
+    instrumentation.enableProfiling()
+    with instrumentation.profiled():
+        # Nested sections are merged into the outer one
+        with instrumentation.profiled():
+            sorted(range(1000), reverse=True)
+    # A new run report keeps profiling
+    instrumentation.reset()
+    with instrumentation.profiled():
+        sorted(range(1000))
+    profileFile = str(tmp_path / "updatecv.prof")
+    instrumentation.dumpProfile(profileFile)
+    assert [stats[1] for function, stats in pstats.Stats(profileFile).stats.items()
+            if function[2] == "<built-in method builtins.sorted>"] == [2]
+
+def test_ProfiledMergesThreads(tmp_path):
+    instrumentation = Instrumentation()
+    instrumentation.enableProfiling()
+    def profiledSort():
+        with instrumentation.profiled():
+            sorted(range(1000))
+    threads = [threading.Thread(target=profiledSort) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    profileFile = str(tmp_path / "updatecv.prof")
+    instrumentation.dumpProfile(profileFile)
+    assert [stats[1] for function, stats in pstats.Stats(profileFile).stats.items()
+            if function[2] == "<built-in method builtins.sorted>"] == [4]
+
+def test_ScoringStageRecorded():
+    from Utils.Metrics.Instrumentation import instrumentation
+    instrumentation.reset()
+    skillsFile = "User/skills.json"
+    scoreSavedJobs([Job("Company", "Job", "Location", "https://example.com/jobs/view/1/", details="Python and C++")], skillsFile)
+    assert instrumentation.buildReport()["stages"][STAGE_SCORING]["count"] == 1
@@ -0,0 +1,125 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the concurrent job details fetching, using a local HTTP stand-in serving recorded LinkedIn pages.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import os, threading, time, pytest
+from selenium.common.exceptions import TimeoutException
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from SavedJobsFetchers.IJobsFetcherService import Job
+from SavedJobsFetchers.JobDetailsFetcher import HttpJobDetailsFetcher, RateLimiter, fetchConcurrently
+from SavedJobsFetchers.JobsStore import JobsStore
+from SavedJobsFetchers.LinkedInFetcherService import LinkedInFetcherService, LINKEDIN_NO_JOB_DETAILS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "Fixtures")
+JOB_WITHOUT_DETAILS_ID = "999"
+
+class LinkedInStandInHandler(BaseHTTPRequestHandler):
+    """Serves the recorded job details page for /jobs/view/<id>/, except a JavaScript-only page for JOB_WITHOUT_DETAILS_ID.
+    """
+    requests = []
+
+    def do_GET(self):
+        LinkedInStandInHandler.requests.append((self.path, self.headers.get("Cookie"), time.monotonic()))
+        if not self.path.startswith("/jobs/view/"):
+            self.send_error(404)
+            return
+        if self.path.startswith(f"/jobs/view/{JOB_WITHOUT_DETAILS_ID}/"):
+            page = "<html><body><div id=\"app\"></div><script src=\"app.js\"></script></body></html>"
+        else:
+            with open(os.path.join(FIXTURES_DIR, "linkedin_job_details.html"), "r") as f:
+                page = f.read().replace("DSP Senior Engineer", f"Job {self.path.split('/')[3]}")
+        body = page.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def linkedInStandIn():
+    LinkedInStandInHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LinkedInStandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+class FakeBrowser:
+    def __init__(self, renderedPage: str = "<html><body><div id=\"job-details\">Rendered by the browser</div></body></html>"):
+        self.visitedUrls = []
+        self.renderedPage = renderedPage
+        self.page_source = ""
+
+    def get(self, url):
+        self.visitedUrls.append(url)
+        if "/broken/" in url:
+            raise TimeoutException("Timed out receiving message from renderer")
+        self.page_source = self.renderedPage
+
+class FakeWaiter:
+    def waitFor(self, step, condition, timeout):
+        return True
+
+def test_FetchConcurrentlyKeepsOrderAndSendsCookies(linkedInStandIn):
+    urls = [f"{linkedInStandIn}/jobs/view/{jobId}/" for jobId in range(8)] + [f"{linkedInStandIn}/missing"]
+    httpFetcher = HttpJobDetailsFetcher([{"name": "li_at", "value": "token", "path": "/"}])
+    pages = fetchConcurrently(urls, httpFetcher.fetch, maxWorkers=4)
+    assert [f"Job {jobId}" in page for jobId, page in zip(range(8), pages)] == [True] * 8
+    assert pages[-1] is None
+    assert all(cookie == "li_at=token" for _, cookie, _ in LinkedInStandInHandler.requests)
+
+def test_RateLimiterSpacesRequests(linkedInStandIn):
+    urls = [f"{linkedInStandIn}/jobs/view/{jobId}/" for jobId in range(5)]
+    fetchConcurrently(urls, HttpJobDetailsFetcher([]).fetch, maxWorkers=5, rateLimiter=RateLimiter(requestsPerSecond=20))
+    requestTimes = sorted(requestTime for _, _, requestTime in LinkedInStandInHandler.requests)
+    assert requestTimes[-1] - requestTimes[0] >= 4 * 0.05 * 0.9
+
+def test_FetchJobDetailsFallsBackToBrowser(linkedInStandIn):
+    fetcherService = LinkedInFetcherService(username="aaa", password="bbb", cookiesFileDir="cookies.json",
+                                            detailsFetchConcurrency=4, detailsRequestsPerSecond=0)
+    jobs = [Job(company="Honey Audio", job=f"Job {jobId}", location="Boston, MA", url=f"{linkedInStandIn}/jobs/view/{jobId}/")
+            for jobId in ["1", JOB_WITHOUT_DETAILS_ID, "2"]]
+    browser = FakeBrowser()
+    fetcherService.fetchJobDetails(jobs, browser, FakeWaiter(), cookies=[])
+    assert "Job 1" in jobs[0].details and "real-time signal processing" in jobs[2].details
+    assert jobs[1].details == "Rendered by the browser"
+    assert browser.visitedUrls == [jobs[1].url]
+
+def test_MissingDetailsAreNotStored(tmp_path):
+    with JobsStore(str(tmp_path / "jobs.sqlite3")) as jobsStore:
+        fetcherService = LinkedInFetcherService(username="aaa", password="bbb", cookiesFileDir="cookies.json", jobsStore=jobsStore)
+        job = Job(company="Honey Audio", job="DSP Engineer", location="Boston, MA", url="https://www.linkedin.com/jobs/view/1/")
+        fetcherService.fetchJobDetails([job], FakeBrowser("<html><body></body></html>"), FakeWaiter(), cookies=[])
+        assert job.details == LINKEDIN_NO_JOB_DETAILS
+        assert jobsStore.get(job) is None and jobsStore.needsDetails(job)
+
+def test_BrokenJobPageDoesNotEndTheSync():
+    fetcherService = LinkedInFetcherService(username="aaa", password="bbb", cookiesFileDir="cookies.json")
+    jobs = [Job(company="Honey Audio", job=f"Job {jobId}", location="Boston, MA", url=f"https://www.linkedin.com/jobs/{jobId}/1/")
+            for jobId in ["view", "broken", "view"]]
+    fetchedJobs = list(fetcherService.iterJobDetails(jobs, FakeBrowser(), FakeWaiter(), cookies=[]))
+    assert fetchedJobs == jobs
+    assert [job.details for job in fetchedJobs] == ["Rendered by the browser", None, "Rendered by the browser"]
@@ -0,0 +1,87 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the JobsDeduplicator.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import pytest
+
+from SavedJobsFetchers.IJobsFetcherService import Job
+from Utils.Metrics.Instrumentation import instrumentation
+from Utils.Pipeline.JobsDeduplicator import computeSimHash, deduplicateJobs, getJobOutputKey, JobsDeduplicator
+from updatecv import reportCollapsedJobs
+
+DETAILS = ("We are looking for a Senior DSP Engineer to join our audio team in Boston. You will design and implement "
+           "real-time signal processing algorithms in C++ and Python, port them to embedded ARM and DSP targets, "
+           "and work closely with the hardware and firmware teams on the next generation of our wireless earbuds. "
+           "Requirements: 5+ years of experience in embedded C/C++, solid background in digital filters, FFT and "
+           "adaptive algorithms, experience with MATLAB, Git and Linux. Nice to have: experience with noise "
+           "cancellation, beamforming, Bluetooth audio codecs and automotive audio. We offer a hybrid work model, "
+           "equity, a yearly learning budget and a friendly team of audio enthusiasts.")
+REPOSTED_DETAILS = DETAILS.replace("a friendly team", "an amazing team") + " Apply today!"
+OTHER_DETAILS = ("Join our cloud platform team as a Backend Developer. You will build scalable REST APIs in Go and "
+                 "Kubernetes operators, own the CI/CD pipelines and on-call rotations, and mentor junior engineers. "
+                 "Requirements: 3+ years of Go or Java, PostgreSQL, Terraform and AWS.")
+
+def makeJob(company: str, job: str, location: str, details: str, jobId: int) -> Job:
+    return Job(company=company, job=job, location=location, url=f"https://portal/jobs/view/{jobId}/", details=details)
+
+def test_SimHashDistance():
+    assert (computeSimHash(DETAILS) ^ computeSimHash(REPOSTED_DETAILS)).bit_count() <= 3
+    assert (computeSimHash(DETAILS) ^ computeSimHash(OTHER_DETAILS)).bit_count() > 10
+
+def test_ExactDuplicatesByOutputName():
+    assert getJobOutputKey(makeJob("ACME, Inc.", "DSP Engineer", "Boston, MA", None, 1)) == ("acme__inc_", "dsp_engineer", "boston__ma")
+    jobs = [makeJob("ACME, Inc.", "DSP Engineer", "Boston, MA", DETAILS, 1),
+            makeJob("acme, inc.", "DSP engineer", "Boston, MA", OTHER_DETAILS, 2)]
+    uniqueJobs, collapsedJobs = deduplicateJobs(jobs, maxDistance=-1)
+    assert uniqueJobs == jobs[:1]
+    assert collapsedJobs == [(jobs[1], jobs[0], "exact")]
+
+def test_NearDuplicatesAtTheSameCompany():
+    jobs = [makeJob("ACME", "Senior DSP Engineer", "Boston, MA", DETAILS, 1),
+            makeJob("ACME", "Sr. DSP Engineer", "Boston, MA (Hybrid)", REPOSTED_DETAILS, 2),
+            makeJob("Other", "Senior DSP Engineer", "Boston, MA", REPOSTED_DETAILS, 3),
+            makeJob("ACME", "Backend Developer", "Boston, MA", OTHER_DETAILS, 4)]
+    uniqueJobs, collapsedJobs = deduplicateJobs(jobs)
+    assert uniqueJobs == [jobs[0], jobs[2], jobs[3]]
+    assert collapsedJobs == [(jobs[1], jobs[0], "near")]
+    # Near-duplicate detection disabled
+    assert deduplicateJobs(jobs, maxDistance=-1)[0] == jobs
+
+def test_ShortDetailsMatchedOnExactKeyOnly():
+    jobs = [makeJob("ACME", "DSP Engineer", "Boston, MA", "No details provided.", 1),
+            makeJob("ACME", "Firmware Engineer", "Warsaw, Poland", "No details provided.", 2)]
+    uniqueJobs, collapsedJobs = deduplicateJobs(jobs)
+    assert uniqueJobs == jobs and collapsedJobs == []
+
+def test_MaxDistanceValidated():
+    with pytest.raises(ValueError):
+        JobsDeduplicator(maxDistance=8)
+
+def test_CollapsedJobsReported():
+    instrumentation.reset()
+    jobs = [makeJob("ACME", "DSP Engineer", "Boston, MA", DETAILS, 1), makeJob("ACME", "DSP Engineer", "Boston, MA", DETAILS, 2)]
+    uniqueJobs, collapsedJobs = deduplicateJobs(jobs)
+    reportCollapsedJobs(collapsedJobs, [(uniqueJobs[0], ["/cv/cv_acme_dsp_engineer.pdf"])])
+    report = instrumentation.buildReport()
+    assert report["collapsedJobs"] == [{"job": "ACME / DSP Engineer / Boston, MA", "url": "https://portal/jobs/view/2/",
+                                        "duplicateOf": "ACME / DSP Engineer / Boston, MA", "duplicateOfUrl": "https://portal/jobs/view/1/",
+                                        "reason": "exact", "pdfs": ["cv_acme_dsp_engineer.pdf"]}]
+    assert report["counters"]["jobs_collapsed"] == 1
@@ -0,0 +1,67 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the JobsExporter.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import csv, os, pytest
+
+from SavedJobsFetchers.IJobsFetcherService import Job
+from Utils.Files.JobsExporter import JobsCsvWriter, JOBS_CSV_COLUMNS
+from Utils.Skills.SkillsMatcher import SkillsMatcher
+
+SKILLS = {
+    "languages": [{"skill": "Python", "latex": "Python", "area": ["programming"], "alias": [], "is_case_sensitive": True},
+                  {"skill": "C++", "latex": "C++", "area": ["programming"], "alias": ["cpp"], "is_case_sensitive": True}],
+    "tools": [{"skill": "Git", "latex": "Git", "area": ["generic"], "alias": [], "is_case_sensitive": False}]
+}
+
+def test_ExportJobsAndSkillScores(tmp_path):
+    matcher = SkillsMatcher(SKILLS)
+    jobs = [Job(company="R&D, Inc.", job="DSP Engineer", location="Boston, MA", url="https://www.linkedin.com/jobs/view/1/",
+                details="Python and C++ programming", isVisaRequired="0"),
+            Job(company="Other", job="Engineer", location="Remote", url="https://www.linkedin.com/jobs/view/2/")]
+    csvFile = str(tmp_path / "jobs.csv")
+    with JobsCsvWriter(csvFile, matcher) as writer:
+        writer.writeJob(jobs[0], matcher.scoreJob(jobs[0].details))
+        writer.writeJob(jobs[1])
+        # Rows are written to a temporary file until the writer is closed
+        assert not os.path.exists(csvFile)
+    with open(csvFile, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == JOBS_CSV_COLUMNS + ["languages/Python", "languages/C++", "tools/Git"]
+    assert rows[0]["company"] == "R&D, Inc."
+    assert rows[0]["key"] == "www.linkedin.com/jobs/1"
+    assert rows[0]["details_length"] == str(len(jobs[0].details))
+    assert [rows[0]["languages/Python"], rows[0]["languages/C++"], rows[0]["tools/Git"]] == ["6", "6", "1"]
+    assert rows[0]["highlighted_skills"] == "3"
+    assert rows[1]["total_score"] == "0"
+    assert rows[1]["languages/Python"] == ""
+
+def test_FailedExportKeepsPreviousFile(tmp_path):
+    csvFile = str(tmp_path / "jobs.csv")
+    with open(csvFile, "w") as f:
+        f.write("previous")
+    with pytest.raises(RuntimeError):
+        with JobsCsvWriter(csvFile) as writer:
+            writer.writeJob(Job(company="Company", job="Engineer", location="Remote", url=""))
+            raise RuntimeError("Build failed")
+    with open(csvFile) as f:
+        assert f.read() == "previous"
+    assert os.listdir(tmp_path) == ["jobs.csv"]
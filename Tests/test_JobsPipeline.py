@@ -0,0 +1,150 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the JobsPipeline and the streaming of the saved jobs.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import argparse, threading, time
+
+import updatecv
+from SavedJobsFetchers.IJobsFetcherService import IJobsFetcherService, Job
+from SavedJobsFetchers.IAsyncJobsFetcherService import SyncJobsFetcherAdapter
+from Utils.Pipeline.JobsPipeline import JobsPipeline
+
+def makeJob(index: int, company: str = "Company") -> Job:
+    return Job(company=company, job=f"Job {index}", location="Boston, MA", url=f"https://portal/jobs/view/{index}/",
+                details=f"Job {index} requires Python")
+
+def slowJobs(count: int, delay: float, events: list):
+    for index in range(count):
+        time.sleep(delay)
+        events.append(("fetched", index))
+        yield makeJob(index)
+
+def test_ProcessingOverlapsFetching():
+    events = []
+    pipeline = JobsPipeline(lambda job: events.append(("processed", job.job)), consumers=1)
+    results = pipeline.run({"portal": slowJobs(3, 0.05, events)})
+    assert len(results) == 3
+    # The first job is processed before the last one is fetched
+    assert events.index(("processed", "Job 0")) < events.index(("fetched", 2))
+
+def test_Backpressure():
+    fetchedCount = 0
+    release = threading.Event()
+
+    def jobs():
+        nonlocal fetchedCount
+        for index in range(10):
+            fetchedCount += 1
+            yield makeJob(index)
+
+    def processJob(job: Job):
+        release.wait()
+
+    pipeline = JobsPipeline(processJob, consumers=1, queueSize=2)
+    runner = threading.Thread(target=pipeline.run, args=({"portal": jobs()},))
+    runner.start()
+    time.sleep(0.2)
+    # One job in processing, two queued and one blocked in put()
+    fetchedCountWhileBlocked = fetchedCount
+    release.set()
+    runner.join(timeout=5)
+    assert fetchedCountWhileBlocked == 4
+    assert len(pipeline.results) == 10
+
+def test_FailuresIsolated():
+    def failingProducer():
+        yield makeJob(100, company="Other")
+        raise RuntimeError("Portal is down")
+
+    def processJob(job: Job) -> str:
+        if job.job == "Job 1":
+            raise ValueError("LaTeX error")
+        return job.job
+
+    pipeline = JobsPipeline(processJob, consumers=2)
+    results = pipeline.run({"ok": (makeJob(index) for index in range(3)), "broken": failingProducer()})
+    assert sorted(result for _, result in results) == ["Job 0", "Job 100", "Job 2"]
+    assert [job.job for job in pipeline.failedJobs] == ["Job 1"]
+
+def test_StalledProducerTimesOut():
+    release = threading.Event()
+
+    def stallingProducer():
+        yield makeJob(100, company="Other")
+        release.wait()
+        yield makeJob(101, company="Other")
+
+    pipeline = JobsPipeline(lambda job: job.job, consumers=1)
+    start = time.monotonic()
+    results = pipeline.run({"ok": (makeJob(index) for index in range(2)), "stalled": stallingProducer()}, {"ok": 5, "stalled": 0.2})
+    assert time.monotonic() - start < 2
+    assert sorted(result for _, result in results) == ["Job 0", "Job 1", "Job 100"]
+    assert pipeline.failedProducers == ["stalled"]
+    # Jobs fetched after the timeout are dropped
+    release.set()
+    time.sleep(0.1)
+    assert pipeline.jobsQueue.empty()
+
+def test_DuplicatesSkipped():
+    repost = makeJob(2)
+    repost.details = makeJob(1).details.replace("requires", "needs")
+    pipeline = JobsPipeline(lambda job: job.url, consumers=2, dedupMaxDistance=-1)
+    results = pipeline.run({"LinkedIn": [makeJob(1), repost], "Indeed": [makeJob(1)]})
+    assert len(results) == 2
+    assert [reason for _, _, reason in pipeline.collapsedJobs] == ["exact"]
+
+class FakeStreamingFetcher(IJobsFetcherService):
+    def __init__(self, jobs: list[Job]):
+        self.jobs = jobs
+
+    def getSavedJobs(self) -> list[Job]:
+        return self.jobs
+
+def test_StreamMySavedJobs(monkeypatch):
+    builtJobs = []
+    monkeypatch.setattr(updatecv, "rebuildCV", lambda job, skillScores, *args: builtJobs.append((job.job, skillScores)) or [f"{job.job}.pdf"])
+    args = argparse.Namespace(jobs_store="", fetch_timeout=5, build_jobs=1, dedup_max_distance=3, skills_json="User/skills.json", recipient_file="12_recipients.tex",
+                                skills_file="04_skills.tex", force_rebuild=False, skills_per_section=None)
+    results = updatecv.streamMySavedJobs(args, "CV-Templates", fetchers=[SyncJobsFetcherAdapter(FakeStreamingFetcher([makeJob(1), makeJob(2)]))])
+    assert [pdfs for _, pdfs in results] == [["Job 1.pdf"], ["Job 2.pdf"]]
+    assert all(skillScores for _, skillScores in builtJobs)
+
+class StallingFetcher(FakeStreamingFetcher):
+    def __init__(self, jobs: list[Job], release: threading.Event):
+        super().__init__(jobs)
+        self.release = release
+
+    def iterSavedJobs(self):
+        yield self.jobs[0]
+        self.release.wait()
+        yield from self.jobs[1:]
+
+def test_StreamMySavedJobsTimesOutStalledFetcher(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(updatecv, "rebuildCV", lambda job, skillScores, *args: [f"{job.job}.pdf"])
+    args = argparse.Namespace(jobs_store="", fetch_timeout=0.2, build_jobs=1, dedup_max_distance=3, skills_json="User/skills.json",
+                                recipient_file="12_recipients.tex", skills_file="04_skills.tex", force_rebuild=False, skills_per_section=None)
+    fetcher = SyncJobsFetcherAdapter(StallingFetcher([makeJob(1), makeJob(2)], release), name="Stalled")
+    try:
+        results = updatecv.streamMySavedJobs(args, "CV-Templates", fetchers=[fetcher])
+    finally:
+        release.set()
+    assert [pdfs for _, pdfs in results] == [["Job 1.pdf"]]
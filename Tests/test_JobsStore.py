@@ -0,0 +1,79 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the JobsStore.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import sys, time, tracemalloc
+
+from SavedJobsFetchers.IJobsFetcherService import Job
+from SavedJobsFetchers.JobsStore import JobsStore, getJobKey
+
+JOB_URL = "https://www.linkedin.com/jobs/view/4123456789/?refId=abc&trk=flagship3_saved_jobs"
+
+def test_GetJobKeyIgnoresTrackingParameters():
+    assert getJobKey(JOB_URL) == getJobKey("https://www.linkedin.com/jobs/view/4123456789/?trk=other")
+    assert getJobKey(JOB_URL) != getJobKey("https://www.linkedin.com/jobs/view/4123456780/")
+    assert getJobKey("https://example.com/offer/42?utm=1") == "example.com/offer/42"
+
+def test_NeedsDetailsOnlyForNewChangedOrStaleJobs(tmp_path):
+    with JobsStore(str(tmp_path / "jobs.sqlite3")) as jobsStore:
+        job = Job(company="Company", job="DSP Engineer", location="Boston, MA", url=JOB_URL)
+        assert jobsStore.needsDetails(job)
+        job.details = "Details"
+        assert jobsStore.put(job)
+        assert not jobsStore.put(job)
+        assert not jobsStore.needsDetails(Job(company="Company", job="DSP Engineer", location="Boston, MA", url=JOB_URL + "&x=1"))
+        assert jobsStore.needsDetails(Job(company="Company", job="Senior DSP Engineer", location="Boston, MA", url=JOB_URL))
+        time.sleep(0.01)
+        assert jobsStore.needsDetails(job, maxAgeHours=0)
+
+def test_LoadDetailsFromPersistedStore(tmp_path):
+    with JobsStore(str(tmp_path / "jobs.sqlite3")) as jobsStore:
+        jobsStore.put(Job(company="Company", job="DSP Engineer", location="Boston, MA", url=JOB_URL, details="Details"))
+    with JobsStore(str(tmp_path / "jobs.sqlite3")) as jobsStore:
+        job = Job(company="Company", job="DSP Engineer", location="Boston, MA", url=JOB_URL)
+        assert jobsStore.loadDetails(job)
+        assert job.details == "Details"
+
+def test_JobIsCompact():
+    job = Job(company="".join(["Com", "pany"]), job="DSP Engineer", location="".join(["Boston", ", MA"]), url=JOB_URL)
+    assert not hasattr(job, "__dict__")
+    assert job.company is sys.intern("Company")
+    assert job.location is sys.intern("Boston, MA")
+
+def test_OffloadedDetailsKeepMemoryFlat(tmp_path):
+    details = "Embedded DSP engineer with C++ and Python experience. " * 400
+    with JobsStore(str(tmp_path / "jobs.sqlite3")) as jobsStore:
+        tracemalloc.start()
+        jobs = []
+        for index in range(1000):
+            job = Job(company="Company", job=f"DSP Engineer {index}", location="Boston, MA",
+                        url=f"https://www.linkedin.com/jobs/view/{index}/", details=details + str(index))
+            jobsStore.offloadDetails(job)
+            jobs.append(job)
+        memoryUsed, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # Resident details would take more than 20 MB
+        assert memoryUsed < 2 * 1024 * 1024
+        assert jobs[42].details == details + "42"
+        # Setting the details keeps them in memory again
+        jobs[42].details = "New details"
+        assert jobs[42].details == "New details"
+
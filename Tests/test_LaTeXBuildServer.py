@@ -0,0 +1,155 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the warm LaTeX build server.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import os, stat, sys, time, pytest
+
+import updatecv
+from CVBuilders.LaTeXBuildServer import LaTeXBuildServer, insertEndOfDump, setFormatLine, findMainTexFiles, getFormatName
+from CVBuilders.BuildCache import BuildCache
+from SavedJobsFetchers.IJobsFetcherService import Job
+from Tests.CVBuildHelpers import RECIPIENTS_TEMPLATE
+
+DATA_FILES = [os.path.join("data", "12_recipients.tex"), os.path.join("data", "04_skills.tex")]
+MAIN_TEX = "\n".join([
+    r"\documentclass{article}",
+    r"\usepackage{xcolor}",
+    r"\input{data/12_recipients}",
+    r"\begin{document}",
+    r"\input{data/04_skills}",
+    r"\end{document}",
+    ""])
+
+# Fake pdflatex writing the format file and fake gmake writing a PDF with the data files, the main file and the format path.
+# The fake gmake fails for the "broken" company, hangs for the "slow" one and kills its build worker for the "crash" one.
+FAKE_PDFLATEX = """
+import os, sys
+if "--version" in sys.argv:
+    print("pdfTeX 3.141592653 (fake)")
+    sys.exit(0)
+options = dict(arg[1:].split("=", 1) for arg in sys.argv[1:] if arg.startswith("-") and "=" in arg)
+with open(os.path.join(options["output-directory"], options["jobname"] + ".fmt"), "w") as file:
+    file.write(open(sys.argv[-1]).read())
+"""
+FAKE_GMAKE = """
+import os, signal, sys, time
+variables = dict(arg.split("=", 1) for arg in sys.argv[2:])
+if variables["company"] == "crash":
+    os.kill(os.getppid(), signal.SIGKILL)
+if variables["company"] == "slow":
+    time.sleep(3)
+os.makedirs("out", exist_ok=True)
+with open(os.path.join("out", f"cv_{variables['company']}_{variables['job']}_{variables['timestamp']}.pdf"), "w") as file:
+    for path in ["main.tex", os.path.join("data", "12_recipients.tex"), os.path.join("data", "04_skills.tex")]:
+        file.write(open(path).read())
+    file.write("TEXFORMATS=" + os.getenv("TEXFORMATS", ""))
+sys.exit(2 if variables["company"] == "broken" else 0)
+"""
+
+def writeExecutable(path, source: str):
+    path.write_text(f"#!{sys.executable}\n{source}")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+
+@pytest.fixture
+def cvDir(tmp_path, monkeypatch):
+    binDir = tmp_path / "bin"
+    binDir.mkdir()
+    writeExecutable(binDir / "pdflatex", FAKE_PDFLATEX)
+    writeExecutable(binDir / "gmake", FAKE_GMAKE)
+    # Spawned workers inherit the environment
+    monkeypatch.setenv("PATH", str(binDir) + os.pathsep + os.environ["PATH"])
+    cvDir = tmp_path / "CV-Templates"
+    (cvDir / "data").mkdir(parents=True)
+    (cvDir / "main.tex").write_text(MAIN_TEX)
+    (cvDir / "data" / "12_recipients.tex").write_text(RECIPIENTS_TEMPLATE)
+    (cvDir / "data" / "04_skills.tex").write_text("")
+    return str(cvDir)
+
+def test_PreambleHelpers(tmp_path):
+    content = insertEndOfDump(MAIN_TEX, DATA_FILES)
+    assert content.index(r"\endofdump") < content.index(r"\input{data/12_recipients}") < content.index(r"\begin{document}")
+    assert insertEndOfDump(content, DATA_FILES) == content
+    assert insertEndOfDump(r"\input{data/04_skills}", DATA_FILES) is None
+    assert setFormatLine(setFormatLine(MAIN_TEX, "autocv_old"), "autocv_main") == "%&autocv_main\n" + MAIN_TEX
+    (tmp_path / "main.tex").write_text(MAIN_TEX)
+    (tmp_path / "style.tex").write_text(r"\usepackage{xcolor}")
+    assert findMainTexFiles(str(tmp_path)) == ["main.tex"]
+
+def test_BuildServerUsesPrecompiledPreamble(cvDir, tmp_path):
+    formatsDir = str(tmp_path / "formats")
+    outDir = str(tmp_path / "out")
+    with LaTeXBuildServer(cvDir, DATA_FILES, workers=2, formatsDir=formatsDir) as buildServer:
+        futures = [buildServer.submit({DATA_FILES[0]: f"recipients {i}", DATA_FILES[1]: f"skills {i}"},
+                                        {"company": f"company_{i}", "location": "boston", "job": "dsp", "timestamp": "20261017"}, outDir)
+                    for i in range(4)]
+        builtPDFs = [future.result(timeout=60) for future in futures]
+    formatDirs = os.listdir(formatsDir)
+    assert len(formatDirs) == 1
+    assert os.path.isfile(os.path.join(formatsDir, formatDirs[0], getFormatName("main.tex") + ".fmt"))
+    for i, pdfs in enumerate(builtPDFs):
+        assert pdfs == [os.path.join(outDir, "out", f"cv_company_{i}_dsp_20261017.pdf")]
+        content = open(pdfs[0]).read()
+        assert content.startswith(f"%&{getFormatName('main.tex')}\n")
+        assert f"recipients {i}skills {i}" in content
+        assert f"TEXFORMATS={os.path.join(formatsDir, formatDirs[0])}{os.pathsep}" in content
+    # Shared template files are not modified
+    assert open(os.path.join(cvDir, "main.tex")).read() == MAIN_TEX
+
+def test_FailedBuildsReturnNoPDFs(cvDir, tmp_path):
+    outDir = str(tmp_path / "out")
+    dataFilesContent = {DATA_FILES[0]: "recipients", DATA_FILES[1]: "skills"}
+    makeVariables = lambda company: {"company": company, "location": "boston", "job": "dsp", "timestamp": "20261017"}
+    startTime = time.monotonic()
+    with LaTeXBuildServer(cvDir, DATA_FILES, workers=1, formatsDir=str(tmp_path / "formats"), usePreambleFormat=False,
+                            buildTimeout=1) as buildServer:
+        assert buildServer.build(dataFilesContent, makeVariables("broken"), outDir) == []
+        # The hung gmake is killed on the build timeout, the worker keeps building
+        assert buildServer.build(dataFilesContent, makeVariables("slow"), outDir) == []
+        assert time.monotonic() - startTime < 3
+        # The task of a dead worker fails and the worker is respawned
+        assert buildServer.build(dataFilesContent, makeVariables("crash"), outDir, timeout=30) == []
+        assert buildServer.build(dataFilesContent, makeVariables("healthy"), outDir, timeout=30) == \
+                [os.path.join(outDir, "out", "cv_healthy_dsp_20261017.pdf")]
+        # A build still running on shutdown does not block it
+        buildServer.submit(dataFilesContent, makeVariables("slow"), outDir)
+    assert time.monotonic() - startTime < 15
+    # The PDFs of the failed and timed out builds are not copied
+    assert os.listdir(os.path.join(outDir, "out")) == ["cv_healthy_dsp_20261017.pdf"]
+
+def test_RebuildCVsOnServer(cvDir, tmp_path):
+    jobs = [Job(company=f"Company {i}", job="DSP Engineer", location="Boston, MA", url="", details="Tasting") for i in range(2)]
+    skillsFile = os.path.join("User", "skills.json")
+    skillScoreMatrix = updatecv.scoreSavedJobs(jobs, skillsFile)
+    buildCache = BuildCache(str(tmp_path / "cache"))
+    with LaTeXBuildServer(cvDir, DATA_FILES, formatsDir=str(tmp_path / "formats"), usePreambleFormat=False) as buildServer:
+        builtPDFs = updatecv.rebuildCVsInParallel(jobs, skillScoreMatrix, cvDir, "12_recipients.tex", "04_skills.tex", skillsFile,
+                                                    1, buildCache, buildServer=buildServer)
+        for pdfs in builtPDFs:
+            os.remove(pdfs[0])
+        cachedPDFs = updatecv.rebuildCVsInParallel(jobs, skillScoreMatrix, cvDir, "12_recipients.tex", "04_skills.tex", skillsFile,
+                                                    1, buildCache, buildServer=buildServer)
+    assert cachedPDFs == builtPDFs
+    for i, pdfs in enumerate(cachedPDFs):
+        assert os.path.basename(pdfs[0]).startswith(f"cv_company_{i}_dsp_engineer_")
+        content = open(pdfs[0]).read()
+        assert rf"\newcommand\positionCompany{{Company {i}}}" in content and "{Tasting/1}" in content
+        assert content.startswith(MAIN_TEX)
+    assert open(os.path.join(cvDir, "data", "12_recipients.tex")).read() == RECIPIENTS_TEMPLATE
@@ -0,0 +1,68 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the LaTeXHandler.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import os, pytest
+
+import updatecv
+from updatecv import LaTeXResumeFields
+from SavedJobsFetchers.IJobsFetcherService import Job
+from Utils.Files import LaTeXHandler
+from Utils.Files.LaTeXHandler import LaTeXCommandsDocument, escapeLatexCharacters
+from Tests.CVBuildHelpers import RECIPIENTS_TEMPLATE
+
+def test_EscapeLatexCharacters():
+    assert escapeLatexCharacters("R&D_50%") == "R\\&D\\_50\\%"
+
+def test_UpdateFieldsInMemoryAndSaveOnce(tmp_path, monkeypatch):
+    recipientsFile = tmp_path / "12_recipients.tex"
+    recipientsFile.write_text(RECIPIENTS_TEMPLATE)
+    writes = []
+    writeFileAtomic = LaTeXHandler.writeFileAtomic
+    monkeypatch.setattr(LaTeXHandler, "writeFileAtomic", lambda path, content: writes.append(path) or writeFileAtomic(path, content))
+    recipients = updatecv.updateCVFiles(Job(company="R&D Labs", job="DSP Engineer", location="Boston, MA", url="",
+                                            letterRecipient="Hiring Team"), str(recipientsFile), None, None)
+    assert writes == [str(recipientsFile)]
+    assert recipients.getField(LaTeXResumeFields.POSITION_COMPANY) == "R\\&D Labs"
+    assert recipientsFile.read_text() == RECIPIENTS_TEMPLATE.replace("{Company}", "{R\\&D Labs}").replace(
+        "{Job}", "{DSP Engineer}").replace("{Location}", "{Boston, MA}").replace("{Recipient}", "{Hiring Team}")
+    assert os.listdir(tmp_path) == ["12_recipients.tex"]
+
+def test_FailedSaveKeepsOriginal(tmp_path, monkeypatch):
+    recipientsFile = tmp_path / "12_recipients.tex"
+    recipientsFile.write_text(RECIPIENTS_TEMPLATE)
+    temporaryFiles = []
+    def failingFsync(fd):
+        # The new content is already in the temporary file when the write fails
+        temporaryFiles.extend(name for name in os.listdir(tmp_path) if name != "12_recipients.tex")
+        raise OSError("No space left on device")
+    monkeypatch.setattr(os, "fsync", failingFsync)
+    with pytest.raises(OSError):
+        updatecv.updateCVFiles(Job(company="R&D Labs", job="DSP Engineer", location="Boston, MA", url=""), str(recipientsFile), None, None)
+    assert len(temporaryFiles) == 1 and recipientsFile.read_text() == RECIPIENTS_TEMPLATE
+    assert os.listdir(tmp_path) == ["12_recipients.tex"]
+
+def test_GetAndUpdateFieldWrappers(tmp_path):
+    recipientsFile = tmp_path / "12_recipients.tex"
+    recipientsFile.write_text(RECIPIENTS_TEMPLATE)
+    updatecv.updateField(LaTeXResumeFields.POSITION_VISA, "1", str(recipientsFile))
+    assert updatecv.getField(LaTeXResumeFields.POSITION_VISA, str(recipientsFile)) == "1"
+    assert LaTeXCommandsDocument(str(recipientsFile)).getField(LaTeXResumeFields.POSITION_NAME) == "Job"
@@ -20,9 +20,9 @@
 # Version 0.1, 2025-03-27 - The initial version
 #
 
-import pytest
+import importlib.util, os, pytest
 
-from SavedJobsFetchers.LinkedInFetcherService import LinkedInFetcherService
+from SavedJobsFetchers.LinkedInFetcherService import LinkedInFetcherService, HtmlParserBackend
 
 @pytest.fixture
 def SetUp():
@@ -41,4 +41,36 @@ def test_CreateLinkedInFetcherServiceObject():
 def test_GetSavedJobs():
     fetcherService = LinkedInFetcherService()
     savedJobs = fetcherService.getSavedJobs()
-    assert type(savedJobs) is list
\ No newline at end of file
+    assert type(savedJobs) is list
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "Fixtures")
+
+def readFixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), "r") as f:
+        return f.read()
+
+def getParserConfigurations() -> list[tuple[HtmlParserBackend, bool]]:
+    parsers = [HtmlParserBackend.HTML_PARSER] + ([HtmlParserBackend.LXML] if importlib.util.find_spec("lxml") else [])
+    return [(parser, useSoupStrainer) for parser in parsers for useSoupStrainer in [False, True]]
+
+@pytest.mark.parametrize("htmlParser, useSoupStrainer", getParserConfigurations())
+def test_ParsePageForSavedJobs(htmlParser, useSoupStrainer):
+    fetcherService = LinkedInFetcherService(username="aaa", password="bbb", cookiesFileDir="cookies.json",
+                                            htmlParser=htmlParser, useSoupStrainer=useSoupStrainer)
+    savedJobs = []
+    fetcherService.parsePageForSavedJobs(savedJobs, readFixture("linkedin_saved_jobs.html"))
+    assert [(job.company, job.job, job.location) for job in savedJobs] == [
+        ("Honey Audio", "DSP Senior Engineer", "Boston, MA"),
+        ("Bee Systems", "Embedded Software Engineer", "Warsaw, Masovian, Poland"),
+        ("Pooh & Friends", "Firmware Engineer", "Remote")]
+    assert savedJobs[0].url == "https://www.linkedin.com/jobs/view/4123456781/?refId=abc&trk=flagship3_saved_jobs"
+
+@pytest.mark.parametrize("htmlParser, useSoupStrainer", getParserConfigurations())
+def test_ParseJobPageDetails(htmlParser, useSoupStrainer):
+    fetcherService = LinkedInFetcherService(username="aaa", password="bbb", cookiesFileDir="cookies.json",
+                                            htmlParser=htmlParser, useSoupStrainer=useSoupStrainer)
+    details = fetcherService.parseJobPageDetails(readFixture("linkedin_job_details.html"))
+    assert "About the job" in details and "Jar opening and food boxes disassembling" in details
+    assert "Primary Navigation" not in details and "Home" not in details
+    assert fetcherService.parseJobPageDetails("<html><body></body></html>") == "No details provided."
@@ -0,0 +1,64 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the LogHandler.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import json, logging, os, pytest
+
+from Utils.Logging.LogHandler import LOGGER_NAME, getLogger, logEvent, setupLogging
+from updatecv import isSkillInJobDescription
+
+@pytest.fixture
+def logFile(tmp_path):
+    path = str(tmp_path / "updatecv.log")
+    yield path
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.propagate = True
+    logger.setLevel(logging.NOTSET)
+
+def test_PerSkillDetailsQuietByDefault(logFile, capsys):
+    setupLogging(logFile=logFile)
+    skill = {"skill": "Tasting", "latex": "Tasting", "area": ["generic", "food"], "alias": ["taste"], "is_case_sensitive": False}
+    assert isSkillInJobDescription(skill, "Tasting food") == 5 + 1 + 1
+    assert capsys.readouterr().out == ""
+    setupLogging(level="DEBUG", logFile=logFile)
+    isSkillInJobDescription(skill, "Tasting food")
+    assert "Checking skill \"Tasting\"" in capsys.readouterr().out
+
+def test_StructuredEventIsSingleJsonLine(logFile, capsys):
+    setupLogging(logFile=logFile)
+    logEvent(getLogger("test"), "job_processed", company="Honey Audio", pdfs=["cv.pdf"])
+    with open(logFile, "r") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert (entry["message"], entry["company"], entry["pdfs"], entry["level"]) == ("job_processed", "Honey Audio", ["cv.pdf"], "INFO")
+    assert capsys.readouterr().out.startswith("job_processed {")
+
+def test_LogFileRotatedBySize(logFile):
+    setupLogging(logFile=logFile, maxSizeMB=0.001, backupCount=2)
+    logger = getLogger("test")
+    for i in range(100):
+        logger.warning("x" * 100)
+    assert sorted(os.listdir(os.path.dirname(logFile))) == ["updatecv.log", "updatecv.log.1", "updatecv.log.2"]
+    assert os.path.getsize(logFile) <= 1100
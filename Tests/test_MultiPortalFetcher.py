@@ -0,0 +1,110 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the MultiPortalFetcher and the async fetcher interface, using fake in-process fetchers.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import argparse, asyncio, time
+
+from SavedJobsFetchers.IJobsFetcherService import IJobsFetcherService, Job
+from SavedJobsFetchers.IAsyncJobsFetcherService import IAsyncJobsFetcherService, SyncJobsFetcherAdapter
+from SavedJobsFetchers.MultiPortalFetcher import fetchAllSavedJobs, mergeSavedJobs
+from updatecv import checkMySavedJobs
+
+class FakeAsyncFetcher(IAsyncJobsFetcherService):
+    def __init__(self, name: str, jobs: list[Job], delay: float = 0, error: Exception = None, timeout: float = None):
+        self.name = name
+        self.jobs = jobs
+        self.delay = delay
+        self.error = error
+        self.timeout = timeout
+
+    async def getSavedJobs(self) -> list[Job]:
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.jobs
+
+class FakeSyncFetcher(IJobsFetcherService):
+    def __init__(self, jobs: list[Job], delay: float = 0):
+        self.jobs = jobs
+        self.delay = delay
+        self.isClosed = False
+
+    def getSavedJobs(self) -> list[Job]:
+        time.sleep(self.delay)
+        return self.jobs
+
+    def close(self):
+        self.isClosed = True
+
+def makeJob(company: str, job: str, location: str, portal: str, details: str = None) -> Job:
+    return Job(company=company, job=job, location=location, url=f"https://{portal}/jobs/view/{abs(hash(job))}/", details=details)
+
+def test_SyncFetchersRunConcurrently():
+    fetchers = [SyncJobsFetcherAdapter(FakeSyncFetcher([makeJob("Company", f"Job {i}", "Boston, MA", "portal")], delay=0.3))
+                for i in range(3)]
+    startTime = time.perf_counter()
+    savedJobs = asyncio.run(fetchAllSavedJobs(fetchers))
+    assert time.perf_counter() - startTime < 0.6
+    assert [job.job for job in savedJobs] == ["Job 0", "Job 1", "Job 2"]
+    assert fetchers[0].name == "FakeSyncFetcher"
+
+def test_PortalTimeoutAndFailureIsolated():
+    fetchers = [
+        FakeAsyncFetcher("slow", [makeJob("Slow", "Job", "Remote", "slow")], delay=5, timeout=0.1),
+        FakeAsyncFetcher("broken", [], error=RuntimeError("Portal is down")),
+        FakeAsyncFetcher("ok", [makeJob("Company", "Job", "Boston, MA", "ok")])
+    ]
+    startTime = time.perf_counter()
+    savedJobs = asyncio.run(fetchAllSavedJobs(fetchers, timeout=10))
+    assert time.perf_counter() - startTime < 1
+    assert [job.company for job in savedJobs] == ["Company"]
+
+def test_SyncFetcherTimeoutBoundsWallClock():
+    slowFetcher = FakeSyncFetcher([makeJob("Slow", "Job", "Remote", "slow")], delay=5)
+    fetchers = [SyncJobsFetcherAdapter(slowFetcher, name="slow", timeout=0.1),
+                SyncJobsFetcherAdapter(FakeSyncFetcher([makeJob("Company", "Job", "Boston, MA", "ok")]), name="ok")]
+    failedPortals = []
+    startTime = time.perf_counter()
+    savedJobs = asyncio.run(fetchAllSavedJobs(fetchers, timeout=10, failedPortals=failedPortals))
+    assert time.perf_counter() - startTime < 1
+    assert [job.company for job in savedJobs] == ["Company"]
+    assert failedPortals == ["slow"] and slowFetcher.isClosed
+
+def test_DuplicatesMerged():
+    linkedInJobs = [makeJob("ACME Corp", "DSP  Engineer", "Boston, MA", "linkedin"),
+                    makeJob("Other", "Engineer", "Remote", "linkedin", details="Other details")]
+    indeedJobs = [makeJob("acme corp", "DSP Engineer ", "boston, ma", "indeed", details="ACME details"),
+                  makeJob("New", "Engineer", "Remote", "indeed")]
+    savedJobs = mergeSavedJobs([linkedInJobs, indeedJobs])
+    assert [job.company for job in savedJobs] == ["ACME Corp", "Other", "New"]
+    # The first portal wins, the missing details are taken from the duplicate
+    assert savedJobs[0].url.startswith("https://linkedin/")
+    assert savedJobs[0].details == "ACME details"
+    # Two saved postings of the same portal are left to the deduplicator
+    assert len(mergeSavedJobs([linkedInJobs + [makeJob("ACME Corp", "DSP Engineer", "Boston, MA", "linkedin")]])) == 3
+
+def test_CheckMySavedJobsFansOut():
+    args = argparse.Namespace(jobs_store="", fetch_timeout=1)
+    fetchers = [FakeAsyncFetcher("LinkedIn", [makeJob("ACME Corp", "DSP Engineer", "Boston, MA", "linkedin")], delay=0.1),
+                FakeAsyncFetcher("Indeed", [makeJob("ACME Corp", "DSP Engineer", "Boston, MA", "indeed")], delay=0.1)]
+    savedJobs = checkMySavedJobs(args, fetchers)
+    assert len(savedJobs) == 1
+    assert savedJobs[0].url.startswith("https://linkedin/")
@@ -0,0 +1,129 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the RunJournal and resumed runs.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import argparse, os, subprocess
+
+import updatecv
+from Utils.Pipeline.RunJournal import *
+from SavedJobsFetchers.IJobsFetcherService import Job
+from Tests.CVBuildHelpers import fakeGmake
+
+def makeJob(i: int) -> Job:
+    return Job(company=f"Company {i}", job="DSP Engineer", location="Boston, MA", url=f"https://example.com/jobs/view/{i}/",
+                details=f"Tasting job number {i}")
+
+def test_JournalResume(tmp_path):
+    journalFile = str(tmp_path / "run_journal.jsonl")
+    pdf = tmp_path / "cv.pdf"
+    pdf.write_text("pdf")
+    with RunJournal().open(journalFile) as journal:
+        for i in range(3):
+            journal.recordFetched(makeJob(i))
+        journal.recordRun(JOURNAL_STAGE_FETCH_COMPLETED)
+        journal.record(makeJob(0), JOURNAL_STAGE_SCORED, skillScores=[1, 0, 5])
+        journal.record(makeJob(0), JOURNAL_STAGE_BUILT, pdfs=[str(pdf)])
+        journal.record(makeJob(1), JOURNAL_STAGE_BUILT, pdfs=[str(tmp_path / "missing.pdf")])
+    # Entry cut by an interrupted run
+    with open(journalFile, "a") as f:
+        f.write('{"time": "2026-10-17T22:00:00", "stage": "bui')
+
+    journal = RunJournal().open(journalFile, resume=True)
+    journal.close()
+    assert journal.isFetchCompleted and not journal.isRunCompleted
+    assert [(job.company, job.details) for job in journal.getFetchedJobs()] == [(f"Company {i}", f"Tasting job number {i}") for i in range(3)]
+    assert journal.getSkillScores(makeJob(0)) == [1, 0, 5] and journal.getSkillScores(makeJob(1)) is None
+    assert journal.getBuiltPDFs(makeJob(0)) == [str(pdf)]
+    assert journal.getBuiltPDFs(makeJob(1)) is None
+    # A new run starts an empty journal
+    with RunJournal().open(journalFile) as journal:
+        assert not journal.isFetchCompleted and journal.getFetchedJobs() == []
+
+def test_JournalKeepsStoredDetailsInJobsStore(tmp_path):
+    from SavedJobsFetchers.JobsStore import JobsStore
+    journalFile = str(tmp_path / "run_journal.jsonl")
+    with JobsStore(str(tmp_path / "jobs_store.sqlite3")) as jobsStore:
+        with RunJournal().open(journalFile) as journal:
+            journal.recordFetched(makeJob(0), jobsStore)
+        assert "Tasting job number 0" not in open(journalFile).read()
+        with RunJournal().open(journalFile, resume=True) as journal:
+            assert [job.details for job in journal.getFetchedJobs(jobsStore)] == ["Tasting job number 0"]
+
+def test_ResumeBuildsOnlyFailedJobs(cvDir, tmp_path, monkeypatch):
+    scoreSavedJobs = updatecv.scoreSavedJobs
+    gmakeRuns = []
+    def failingGmake(args, cwd, **kwargs):
+        gmakeRuns.append(args)
+        result = fakeGmake(args, cwd, **kwargs)
+        if "company=company_1" in args and len(gmakeRuns) <= 3:
+            # The partial PDF of a failed build is not journaled as built
+            return subprocess.CompletedProcess(args, 2, stdout="", stderr="LaTeX Error")
+        return result
+    monkeypatch.setattr(updatecv.subprocess, "run", failingGmake)
+    monkeypatch.setattr(updatecv, "checkMySavedJobs", lambda *args, **kwargs: [makeJob(i) for i in range(3)])
+    monkeypatch.setenv("CV_DIR", cvDir)
+    args = argparse.Namespace(sync=True, stream=False, resume=False, run_journal=str(tmp_path / "run_journal.jsonl"), jobs_store="",
+                                export_csv=None, build_server=False, build_cache="", build_cache_max_size=1, build_cache_max_age=1,
+                                build_jobs=1, force_rebuild=False, dedup_max_distance=3, skills_json=os.path.join("User", "skills.json"),
+                                recipient_file="12_recipients.tex", skills_file="04_skills.tex", skills_per_section=None)
+    assert not updatecv.updateCVs(args)
+    assert len(gmakeRuns) == 3
+
+    # The resumed run neither fetches nor scores again and builds only the failed job
+    def failIfCalled(*args, **kwargs):
+        raise AssertionError("Called by the resumed run.")
+    monkeypatch.setattr(updatecv, "checkMySavedJobs", failIfCalled)
+    monkeypatch.setattr(updatecv, "scoreSavedJobs", failIfCalled)
+    args.resume = True
+    assert updatecv.updateCVs(args)
+    assert len(gmakeRuns) == 4 and "company=company_1" in gmakeRuns[-1]
+    assert os.path.isfile(os.path.join(cvDir, "out", "cv_company_1_dsp_engineer.pdf"))
+
+    # Nothing is left to resume
+    assert updatecv.updateCVs(args)
+    assert len(gmakeRuns) == 4
+
+    # A single job run does not touch the journal of the sync
+    journal = open(args.run_journal).read()
+    monkeypatch.setattr(updatecv, "scoreSavedJobs", scoreSavedJobs)
+    singleJob = makeJob(3)
+    args = argparse.Namespace(**{**vars(args), "sync": False, "resume": False, "company": singleJob.company, "job": singleJob.job,
+                                "location": singleJob.location, "url": singleJob.url, "details": None, "letterAddress": None,
+                                "letterRecipient": None, "isVisaRequired": None})
+    assert updatecv.updateCVs(args)
+    assert open(args.run_journal).read() == journal
+
+def test_ResumeDropsScoresOfChangedSkills(tmp_path):
+    journalFile = str(tmp_path / "run_journal.jsonl")
+    pdf = tmp_path / "cv.pdf"
+    pdf.write_text("pdf")
+    with RunJournal().open(journalFile, skillsDigest="aa01") as journal:
+        journal.recordFetched(makeJob(0))
+        journal.record(makeJob(0), JOURNAL_STAGE_SCORED, skillScores=[1, 0, 5])
+        journal.record(makeJob(0), JOURNAL_STAGE_BUILT, pdfs=[str(pdf)])
+    with RunJournal().open(journalFile, resume=True, skillsDigest="aa01") as journal:
+        assert journal.getSkillScores(makeJob(0)) == [1, 0, 5] and journal.getBuiltPDFs(makeJob(0)) == [str(pdf)]
+    with RunJournal().open(journalFile, resume=True, skillsDigest="bb02") as journal:
+        assert journal.getSkillScores(makeJob(0)) is None and journal.getBuiltPDFs(makeJob(0)) is None
+        assert len(journal.getFetchedJobs()) == 1
+    # The resumed run journaled the new digest
+    with RunJournal().open(journalFile, resume=True, skillsDigest="bb02") as journal:
+        assert journal.skillsDigest == "bb02"
@@ -0,0 +1,111 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the ScoringService.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import http.client, json, os, socket, threading, pytest
+
+from Services.ScoringService import *
+
+SKILLS = {"programmingLanguages": [
+    {"skill": "Python", "latex": "Python", "area": ["scripting"], "alias": ["py3"], "is_case_sensitive": True},
+    {"skill": "C++", "latex": "C\\texttt{++}", "area": ["embedded"], "alias": [], "is_case_sensitive": True},
+    {"skill": "Go", "latex": "Go", "area": ["generic"], "alias": ["golang"], "is_case_sensitive": True}]}
+
+def writeSkills(path, skills: dict, modificationTime: int):
+    path.write_text(json.dumps(skills))
+    # Modification times of quick successive writes may be equal
+    os.utime(path, ns=(modificationTime, modificationTime))
+
+def test_ScoreBatchAndHotReload(tmp_path):
+    skillsFile = tmp_path / "skills.json"
+    writeSkills(skillsFile, SKILLS, 1_000_000_000)
+    service = ScoringService(str(skillsFile))
+    status, response = service.handleRequest("POST", SCORING_PATH_SCORE,
+                                                json.dumps({"descriptions": ["Embedded C++ and Python", "golang"]}).encode())
+    assert status == 200 and len(response["results"]) == 2
+    assert response["results"][0]["sections"]["programmingLanguages"] == [
+        {"skill": "C++", "score": 6}, {"skill": "Python", "score": 5}, {"skill": "Go", "score": 1}]
+    assert "{C\\texttt{++}/1}" in response["results"][0]["latex"]
+    assert response["results"][1]["sections"]["programmingLanguages"][0] == {"skill": "Go", "score": 5}
+    skillsHash = response["skillsHash"]
+
+    # The skills file is not modified, the changed skills are used by the next request
+    writeSkills(skillsFile, {"tools": [{"skill": "Git", "latex": "Git", "area": [], "alias": [], "is_case_sensitive": False}]}, 2_000_000_000)
+    status, response = service.handleRequest("POST", SCORING_PATH_SCORE, json.dumps({"description": "git", "latex": False}).encode())
+    assert status == 200 and response["skillsHash"] != skillsHash
+    assert response["results"] == [{"sections": {"tools": [{"skill": "Git", "score": 5}]}, "highlightedSkills": 1}]
+
+    assert service.handleRequest("POST", SCORING_PATH_SCORE, b"{\"descriptions\": [1]}")[0] == 400
+    assert service.handleRequest("POST", SCORING_PATH_SCORE, json.dumps({"description": "git", "latex": "false"}).encode())[0] == 400
+    assert service.handleRequest("GET", "/unknown")[0] == 404
+    stats = service.getStats()
+    assert (stats["requests"], stats["failedRequests"]) == (5, 3)
+    assert stats["latencyMs"]["p50"] <= stats["latencyMs"]["p95"] <= stats["latencyMs"]["max"]
+
+def test_HttpOverTcpAndUnixSocket(tmp_path):
+    skillsFile = tmp_path / "skills.json"
+    writeSkills(skillsFile, SKILLS, 1_000_000_000)
+    service = ScoringService(str(skillsFile), maxSkillsPerSection=1)
+    socketPath = str(tmp_path / "scoring.sock")
+    for server in [createScoringServer(service, port=0), createScoringServer(service, socketPath=socketPath)]:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        if isinstance(server.server_address, tuple):
+            connection = http.client.HTTPConnection(*server.server_address)
+        else:
+            connection = http.client.HTTPConnection("localhost")
+            connection.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.sock.connect(socketPath)
+        # Several requests over one keep-alive connection
+        for _ in range(2):
+            connection.request("POST", SCORING_PATH_SCORE, json.dumps({"description": "Python"}))
+            response = connection.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read())["results"][0]["sections"]["programmingLanguages"] == [{"skill": "Python", "score": 5}]
+        connection.request("GET", SCORING_PATH_HEALTH)
+        response = connection.getresponse()
+        assert json.loads(response.read())["skills"] == 3
+        connection.close()
+        server.shutdown()
+        server.server_close()
+
+def test_UnexpectedErrorCounted(tmp_path, monkeypatch):
+    skillsFile = tmp_path / "skills.json"
+    writeSkills(skillsFile, SKILLS, 1_000_000_000)
+    service = ScoringService(str(skillsFile))
+    def failingScoreDescriptions(*args, **kwargs):
+        raise KeyError("section")
+    monkeypatch.setattr(service, "scoreDescriptions", failingScoreDescriptions)
+    status, response = service.handleRequest("POST", SCORING_PATH_SCORE, json.dumps({"description": "Python"}).encode())
+    assert status == 500 and "latencyMs" in response
+    assert (service.getStats()["requests"], service.getStats()["failedRequests"]) == (1, 1)
+
+def test_UnixSocketNotReplacedWhileListening(tmp_path):
+    service = ScoringService(str(tmp_path / "skills.json"))
+    socketPath = str(tmp_path / "scoring.sock")
+    # Socket file left behind by a killed service
+    staleSocket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    staleSocket.bind(socketPath)
+    staleSocket.close()
+    with createScoringServer(service, socketPath=socketPath):
+        assert os.stat(socketPath).st_mode & 0o777 == 0o600
+        with pytest.raises(RuntimeError, match="already listening"):
+            createScoringServer(service, socketPath=socketPath)
+        assert os.path.exists(socketPath)
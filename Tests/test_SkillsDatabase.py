@@ -0,0 +1,71 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the SkillsDatabase.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import json, os, pickle, shutil, pytest
+
+from Utils.Skills.SkillsDatabase import SkillsDatabase, SkillsSchemaError, getSkillsDatabase, validateSkills
+
+SKILLS_JSON_FILE = os.path.join(os.path.dirname(__file__), "..", "User", "skills.json")
+
+@pytest.fixture
+def skillsFile(tmp_path):
+    path = str(tmp_path / "skills.json")
+    shutil.copyfile(SKILLS_JSON_FILE, path)
+    return path
+
+def test_ValidateSkillsRejectsInvalidSchema():
+    with pytest.raises(SkillsSchemaError, match="allSkills\\[0\\] shall have the \"alias\" key"):
+        validateSkills({"allSkills": [{"skill": "C", "latex": "C", "area": [], "is_case_sensitive": True}]})
+    with pytest.raises(SkillsSchemaError):
+        validateSkills([])
+
+def test_SnapshotReusedUntilJsonChanges(skillsFile):
+    coldDatabase = SkillsDatabase.load(skillsFile)
+    assert not coldDatabase.isLoadedFromSnapshot and os.path.isfile(SkillsDatabase.getSnapshotPath(skillsFile))
+    warmDatabase = SkillsDatabase.load(skillsFile)
+    assert warmDatabase.isLoadedFromSnapshot
+    assert warmDatabase.matcher.scoreJob("Tasting honey") == coldDatabase.matcher.scoreJob("Tasting honey")
+    with open(skillsFile, "r") as file:
+        skills = json.load(file)
+    skills["allSoftSkills"].append({"skill": "Honey", "latex": "Honey", "area": [], "alias": [], "is_case_sensitive": False})
+    with open(skillsFile, "w") as file:
+        json.dump(skills, file)
+    changedDatabase = SkillsDatabase.load(skillsFile)
+    assert not changedDatabase.isLoadedFromSnapshot and "Honey" in [s["skill"] for s in changedDatabase.skills["allSoftSkills"]]
+
+def test_CorruptedOrOutdatedSnapshotIsRebuilt(skillsFile, monkeypatch):
+    SkillsDatabase.load(skillsFile)
+    snapshotPath = SkillsDatabase.getSnapshotPath(skillsFile)
+    for snapshot in [b"\x80\x05garbage", pickle.dumps(["not", "a", "snapshot"]), pickle.dumps({"database": None})]:
+        with open(snapshotPath, "wb") as file:
+            file.write(snapshot)
+        assert not SkillsDatabase.load(skillsFile).isLoadedFromSnapshot
+    assert SkillsDatabase.load(skillsFile).isLoadedFromSnapshot
+    monkeypatch.setattr("Utils.Skills.SkillsDatabase.computeCodeDigest", lambda: "changed code")
+    assert not SkillsDatabase.load(skillsFile).isLoadedFromSnapshot
+
+def test_GetSkillsDatabaseLoadsOncePerProcess(skillsFile):
+    database = getSkillsDatabase(skillsFile, useSnapshot=False)
+    assert getSkillsDatabase(skillsFile, useSnapshot=False) is database
+    os.utime(skillsFile, ns=(0, 0))
+    assert getSkillsDatabase(skillsFile, useSnapshot=False) is not database
+    assert getSkillsDatabase(skillsFile + ".missing") is None
@@ -0,0 +1,63 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the SkillsMatcher.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import json, os, random
+
+from Utils.Skills.SkillsMatcher import AhoCorasickAutomaton, SkillsMatcher
+from updatecv import isSkillInJobDescription
+
+SKILLS_JSON_FILE = os.path.join(os.path.dirname(__file__), "..", "User", "skills.json")
+
+def test_CountOccurrencesMatchesStrCount():
+    terms = ["aa", "a", "aba", "ab", "b", "bab", "", "abab"]
+    automaton = AhoCorasickAutomaton()
+    termIds = [automaton.addTerm(term) for term in terms]
+    randomGenerator = random.Random(0)
+    for _ in range(200):
+        text = "".join(randomGenerator.choice("ab ") for _ in range(randomGenerator.randint(0, 40)))
+        counts = automaton.countOccurrences(text)
+        assert [counts[termId] for termId in termIds] == [text.count(term) for term in terms]
+
+def test_ScoreSkillsMatchesIsSkillInJobDescription():
+    with open(SKILLS_JSON_FILE, "r") as file:
+        skills = json.load(file)
+    skills["caseSensitiveSkills"] = [
+        {"skill": "C", "latex": "C", "area": ["programming", "generic"], "alias": ["C99", "ANSI C"], "is_case_sensitive": True},
+        {"skill": "Go", "latex": "Go", "area": ["Programming"], "alias": ["Golang"], "is_case_sensitive": True}
+    ]
+    matcher = SkillsMatcher(skills)
+    jobDetails = ("  Tasting and EATING food, Jar opening. C and C99 programming in Go, not go or c. "
+                  "Honey integration testing, unit integration, box BOX sensing Food. ANSI C  ")
+    skillScores = matcher.scoreSkills(jobDetails)
+    for skillSection, sectionSkills in skills.items():
+        assert skillScores[skillSection] == [isSkillInJobDescription(skill, jobDetails) for skill in sectionSkills]
+
+def test_ScoreJobsReturnsJobsBySkillsMatrix():
+    with open(SKILLS_JSON_FILE, "r") as file:
+        skills = json.load(file)
+    matcher = SkillsMatcher(skills)
+    jobDetailsList = ["Tasting and eating.", "Honey unit testing, integration testing.", ""]
+    scoreMatrix = matcher.scoreJobs(jobDetailsList)
+    assert len(scoreMatrix) == len(jobDetailsList)
+    for jobDetails, scores in zip(jobDetailsList, scoreMatrix):
+        assert len(scores) == sum(len(sectionSkills) for sectionSkills in skills.values())
+        assert matcher.splitScores(scores) == matcher.scoreSkills(jobDetails)
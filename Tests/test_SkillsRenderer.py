@@ -0,0 +1,51 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the SkillsRenderer.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import json, logging, os, random
+
+from Utils.Skills.SkillsMatcher import SkillsMatcher
+from Utils.Skills.SkillsRenderer import rankSectionSkills, renderSkillsLatex
+
+SKILLS_JSON_FILE = os.path.join(os.path.dirname(__file__), "..", "User", "skills.json")
+
+def test_TopSkillsMatchFullSortPrefix():
+    randomGenerator = random.Random(0)
+    sectionSkills = [{"skill": str(i), "latex": str(i)} for i in range(50)]
+    sectionScores = [randomGenerator.randint(0, 5) for _ in sectionSkills]
+    rankedSkills = rankSectionSkills(sectionSkills, sectionScores)
+    for maxSkills in [0, 1, 7, 49, 50, 100]:
+        assert rankSectionSkills(sectionSkills, sectionScores, maxSkills) == rankedSkills[:maxSkills]
+
+def test_RenderSkillsLatex(tmp_path):
+    with open(SKILLS_JSON_FILE, "r") as file:
+        matcher = SkillsMatcher(json.load(file))
+    skillsLatex = renderSkillsLatex(matcher, matcher.scoreJob("Ravening and smelling"), maxSkillsPerSection=3)
+    assert skillsLatex.startswith("\\newcommand\\allProgrammingSkills{\n{Smelling/1},\n{Ravening/1},\n{Tasting/1}}\n\n")
+    assert skillsLatex.count("\\newcommand") == len(matcher.sections)
+    assert os.listdir(tmp_path) == []
+
+def test_RenderSkillsLatexLogsSkillScores(caplog):
+    with open(SKILLS_JSON_FILE, "r") as file:
+        matcher = SkillsMatcher(json.load(file))
+    with caplog.at_level(logging.DEBUG):
+        renderSkillsLatex(matcher, matcher.scoreJob("Ravening and smelling"))
+    assert "allProgrammingSkills: Smelling=" in caplog.text and "Ravening=" in caplog.text
@@ -0,0 +1,93 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script guarding the startup of single job runs against heavy imports, based on -X importtime.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import argparse, os, subprocess, sys, pytest
+
+import updatecv
+
+from SavedJobsFetchers.FetcherRegistry import createFetcher, getFetcherClass, getFetcherNames, registerFetcher, FETCHERS_REGISTRY
+from SavedJobsFetchers.IJobsFetcherService import IJobsFetcherService, Job, WebDriver
+from Tests.CVBuildHelpers import fakeGmake
+
+PROJECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+# Dependencies of the portal fetchers, imported only by --sync runs, and the jobs store and skills database, imported only when used
+HEAVY_MODULES = ["selenium", "bs4", "lxml", "requests", "asyncio", "SavedJobsFetchers.LinkedInFetcherService",
+                 "sqlite3", "SavedJobsFetchers.JobsStore", "Utils.Skills.SkillsDatabase"]
+
+def getImportedModules(module: str) -> set[str]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=PROJECT_DIR,
+                            capture_output=True, text=True, check=True)
+    return {line.split("|")[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+
+def test_SingleJobStartupSkipsFetchers():
+    importedModules = getImportedModules("updatecv")
+    assert "updatecv" in importedModules
+    assert [module for module in HEAVY_MODULES if module in importedModules] == []
+    # No output on import
+    result = subprocess.run([sys.executable, "-c", "import updatecv"], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout == ""
+
+def test_SingleJobWithoutDetailsSkipsSkillsDatabase(cvDir, tmp_path, monkeypatch):
+    def failIfCalled(*args, **kwargs):
+        raise AssertionError("Called by a single job run without details.")
+    monkeypatch.setattr(updatecv, "getSkillsMatcher", failIfCalled)
+    monkeypatch.setattr(updatecv, "computeSkillsDigest", failIfCalled)
+    monkeypatch.setattr(updatecv.subprocess, "run", fakeGmake)
+    monkeypatch.setenv("CV_DIR", cvDir)
+    args = argparse.Namespace(sync=False, stream=False, resume=False, run_journal=str(tmp_path / "run_journal.jsonl"), jobs_store="",
+                                export_csv=None, build_server=False, build_cache="", build_jobs=1, force_rebuild=False,
+                                dedup_max_distance=3, skills_json=os.path.join("User", "skills.json"), recipient_file="12_recipients.tex",
+                                skills_file="04_skills.tex", skills_per_section=None, company="Company", job="Job", location="Location",
+                                url="https://example.com/jobs/view/1/", details=None, letterAddress=None, letterRecipient=None,
+                                isVisaRequired=None)
+    assert updatecv.updateCVs(args)
+    assert not os.path.exists(args.run_journal)
+
+class FakeFetcher(IJobsFetcherService):
+    def __init__(self, jobsStore=None):
+        self.jobsStore = jobsStore
+
+    @classmethod
+    def fromArguments(cls, args, jobsStore=None):
+        return cls(jobsStore)
+
+    def getSavedJobs(self) -> list[Job]:
+        return []
+
+def test_FetcherRegistryResolvesLazily(monkeypatch):
+    monkeypatch.setitem(FETCHERS_REGISTRY, "Fake", f"{__name__}:FakeFetcher")
+    assert "Fake" in getFetcherNames()
+    fetcher = createFetcher("Fake", argparse.Namespace(), jobsStore="store")
+    assert isinstance(fetcher, FakeFetcher) and fetcher.jobsStore == "store"
+    with pytest.raises(KeyError):
+        getFetcherClass("Unknown")
+
+def test_RegisterLinkedInFetcher(monkeypatch):
+    monkeypatch.setattr("SavedJobsFetchers.FetcherRegistry.FETCHERS_REGISTRY", {})
+    registerFetcher("LinkedIn", "SavedJobsFetchers.LinkedInFetcherService:LinkedInFetcherService")
+    monkeypatch.setenv("LIN_LOGIN", "user")
+    monkeypatch.setenv("LIN_KEY", "key")
+    args = argparse.Namespace(linkedin_cookies="cookies.json", jobs_store_max_age=24, fetch_concurrency=4, webdriver="chrome",
+                                headless=True, daemon=False)
+    fetcher = createFetcher("LinkedIn", args)
+    assert (fetcher.username, fetcher.cookiesFileDir, fetcher.detailsFetchConcurrency) == ("user", "cookies.json", 4)
+    assert (fetcher.webDriver, fetcher.headless, fetcher.keepSessionAlive) == (WebDriver.WEBDRIVER_CHROME, True, False)
@@ -0,0 +1,68 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the SyncDaemon.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+import argparse, os, threading, time
+
+import updatecv
+from Services.SyncDaemon import *
+
+class FakeFetcher:
+    name = "Fake"
+
+    def __init__(self):
+        self.healthChecks = 0
+        self.isClosed = False
+
+    def checkHealth(self) -> bool:
+        self.healthChecks += 1
+        return True
+
+    def close(self):
+        self.isClosed = True
+
+def test_DaemonRunsTriggeredSyncs(tmp_path):
+    socketPath = str(tmp_path / "updatecv.sock")
+    syncs = []
+    fetcher = FakeFetcher()
+    daemon = SyncDaemon(socketPath, lambda resume: syncs.append(resume) or resume, [fetcher], healthCheckInterval=0.01)
+    daemonThread = threading.Thread(target=daemon.serve)
+    daemonThread.start()
+    while not os.path.exists(socketPath):
+        time.sleep(0.01)
+
+    assert sendDaemonRequest(socketPath, {"command": DAEMON_COMMAND_SYNC})["status"] == DAEMON_STATUS_INCOMPLETE
+    assert sendDaemonRequest(socketPath, {"command": DAEMON_COMMAND_SYNC, "resume": True})["status"] == DAEMON_STATUS_COMPLETED
+    assert syncs == [False, True]
+    status = sendDaemonRequest(socketPath, {"command": DAEMON_COMMAND_STATUS})
+    assert (status["status"], status["syncs"], status["lastSync"]["status"]) == (DAEMON_STATUS_IDLE, 2, DAEMON_STATUS_COMPLETED)
+    assert sendDaemonRequest(socketPath, {"command": "unknown"})["status"] == DAEMON_STATUS_ERROR
+    while fetcher.healthChecks == 0:
+        time.sleep(0.01)
+
+    assert sendDaemonRequest(socketPath, {"command": DAEMON_COMMAND_STOP})["status"] == DAEMON_STATUS_STOPPING
+    daemonThread.join(timeout=10)
+    assert not daemonThread.is_alive()
+    assert fetcher.isClosed and not os.path.exists(socketPath)
+
+def test_TriggerWithoutDaemonRunsLocally(tmp_path):
+    args = argparse.Namespace(daemon_socket=str(tmp_path / "updatecv.sock"), resume=False)
+    assert updatecv.triggerDaemonSync(args) is None
@@ -0,0 +1,50 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Test script for the WebDriver readiness waits.
+#
+# Version 1.0, 2026-10-17 - The initial version
+#
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions
+
+from SavedJobsFetchers.WebDriverWaits import ReadinessWaiter
+
+class FakeBrowser:
+    """Browser stand-in rendering the job details element after a number of polls.
+    """
+    def __init__(self, pollsUntilReady: int):
+        self.pollsUntilReady = pollsUntilReady
+
+    def find_element(self, by, value):
+        self.pollsUntilReady -= 1
+        if by == By.ID and value == "job-details" and self.pollsUntilReady <= 0:
+            return object()
+        raise NoSuchElementException(value)
+
+def test_WaitForReturnsAsSoonAsConditionIsMet():
+    waiter = ReadinessWaiter(FakeBrowser(pollsUntilReady=3), pollFrequency=0.01)
+    assert waiter.waitFor("job details", expected_conditions.presence_of_element_located((By.ID, "job-details")), timeout=5)
+    step, waitTime, isReady = waiter.waitTimes[0]
+    assert step == "job details" and isReady and waitTime < 1
+
+def test_WaitForFallsBackOnTimeout():
+    waiter = ReadinessWaiter(FakeBrowser(pollsUntilReady=1000), pollFrequency=0.01)
+    assert not waiter.waitFor("job details", expected_conditions.presence_of_element_located((By.ID, "job-details")), timeout=0.05)
+    assert waiter.waitTimes[0][2] is False
@@ -20,7 +20,12 @@
 # Version 1.0, 2025-03-27 - The initial version
 #
 
-import os, json
+import os, json, shutil, tempfile
+from contextlib import contextmanager
+
+from Utils.Logging.LogHandler import getLogger
+
+logger = getLogger(__name__)
 
 # Supports Windows, MacOS and OneDrive reserved chatecters
 FILE_SYSTEM_CHARS_TO_ESCAPE = ["<", ">", ":", "\"", "/", "\\", "|", "?", "*", ",", " ", "(", ")", "[", "]", "{", "}", "&", "#", "."]
@@ -31,7 +36,7 @@ def readFile(path: str):
         with open(path, "r") as file:
             fileContent = file.read()
     else:
-        print(f"File {path} does not exists!")
+        logger.warning(f"File {path} does not exists!")
     return fileContent
 
 def readJsonFile(path: str):
@@ -40,13 +45,38 @@ def readJsonFile(path: str):
         with open(path, "r") as file:
             jsonFileContent = json.load(file)
     else:
-        print(f"File {path} does not exists!")
+        logger.warning(f"File {path} does not exists!")
     return jsonFileContent
 
 def writeFile(path: str, content: str):
     with open(path, "w") as file:
         file.write(content)
 
+def writeFileAtomic(path: str, content: str | bytes):
+    """Write the file through a temporary file renamed over the target, so readers never see a truncated file.
+    """
+    with openFileAtomic(path, "wb" if isinstance(content, bytes) else "w") as file:
+        file.write(content)
+
+@contextmanager
+def openFileAtomic(path: str, mode: str = "w", **kwargs):
+    """Open a temporary file for writing, renamed over the target when the block completes, removed if it fails.
+    Allows writing large files incrementally with the same guarantees as writeFileAtomic.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporaryPath = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", dir=directory)
+    try:
+        with os.fdopen(fd, mode, **kwargs) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.isfile(path):
+            shutil.copymode(path, temporaryPath)
+        os.replace(temporaryPath, path)
+    except BaseException:
+        os.remove(temporaryPath)
+        raise
+
 def escapeFileSystemCharacters(text: str):
     newText = text
     for ch in FILE_SYSTEM_CHARS_TO_ESCAPE:
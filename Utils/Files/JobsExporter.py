@@ -0,0 +1,77 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Columnar CSV export of the fetched jobs and their skill scores, for analysis in e.g. pandas or a spreadsheet.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import csv, threading
+from contextlib import ExitStack
+
+from SavedJobsFetchers.IJobsFetcherService import Job
+from SavedJobsFetchers.JobsStore import getJobKey, hashJobDetails
+from Utils.Files.FileHandler import openFileAtomic
+from Utils.Skills.SkillsMatcher import SkillsMatcher
+
+JOBS_CSV_COLUMNS = ["key", "company", "job", "location", "url", "is_visa_required", "details_length", "details_hash",
+                    "total_score", "highlighted_skills"]
+
+class JobsCsvWriter:
+    """Writes one row per job, with one column per skill of the skills matcher, as the jobs are processed.
+    Rows are written incrementally, the file is replaced atomically when the writer is closed. Thread-safe.
+    """
+    def __init__(self, path: str, matcher: SkillsMatcher = None):
+        """Create a writer, use as a context manager.
+
+        Args:
+            path (str): path to the CSV file
+            matcher (SkillsMatcher, optional): skills matcher providing the skill columns. Defaults to None (no skill columns).
+        """
+        self.path = path
+        self.skillColumns = [f"{skillSection}/{compiledSkill.skill['skill']}"
+                                for skillSection, compiledSkills in (matcher.sections.items() if matcher is not None else [])
+                                for compiledSkill in compiledSkills]
+        self.lock = threading.Lock()
+        self.exitStack = ExitStack()
+        self.writer = None
+        self.rowsCount = 0
+
+    def __enter__(self):
+        file = self.exitStack.enter_context(openFileAtomic(self.path, "w", newline="", encoding="utf-8"))
+        self.writer = csv.writer(file)
+        self.writer.writerow(JOBS_CSV_COLUMNS + self.skillColumns)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self.exitStack.__exit__(exc_type, exc_value, traceback)
+
+    def writeJob(self, job: Job, skillScores: list[int] = None):
+        """Write the job row.
+
+        Args:
+            job (Job): job
+            skillScores (list[int], optional): flat skill scores of the job, see SkillsMatcher.scoreJob. Defaults to None (empty scores).
+        """
+        details = job.details
+        row = [getJobKey(job.url) if job.url else "", job.company, job.job, job.location, job.url, job.isVisaRequired,
+                len(details) if details else 0, hashJobDetails(details) if details else "",
+                sum(skillScores) if skillScores else 0, sum(score > 0 for score in skillScores) if skillScores else 0]
+        row += skillScores if skillScores else [""] * len(self.skillColumns)
+        with self.lock:
+            self.writer.writerow(row)
+            self.rowsCount += 1
@@ -20,6 +20,15 @@
 # Version 1.0, 2025-03-27 - The initial version
 #
 
+import re
+from enum import Enum
+from functools import lru_cache
+
+from .FileHandler import readFile, writeFileAtomic
+from Utils.Logging.LogHandler import getLogger
+
+logger = getLogger(__name__)
+
 # Reserved LaTeX characters
 LATEX_CHARS_TO_ESCAPE = ["\\", "%", "$", "{", "_", "#", "&", "}"]
 
@@ -28,3 +37,68 @@ def escapeLatexCharacters(text: str):
     for ch in LATEX_CHARS_TO_ESCAPE:
         newText = newText.replace(ch, "\\" + ch)
     return newText
+
+@lru_cache(maxsize=None)
+def getCommandPattern(command: str) -> re.Pattern:
+    """Compile the pattern of a user-defined LaTeX command with its argument.
+
+    Args:
+        command (str): regex-escaped LaTeX command, e.g. r"\\newcommand\\positionName"
+    """
+    return re.compile(command + "{(.*)}")
+
+class LaTeXCommandsDocument:
+    """LaTeX file with user-defined commands, e.g. 12_recipients.tex.
+    The file is read once, all command updates are applied in memory and written atomically by save().
+    """
+    def __init__(self, path: str, content: str = None):
+        """Load a LaTeX commands document.
+
+        Args:
+            path (str): path to the LaTeX file
+            content (str, optional): file content, read from the path if not given. Defaults to None.
+        """
+        self.path = path
+        self.content = readFile(path) if content is None else content
+        self.isModified = False
+
+    def getField(self, field: Enum) -> str:
+        """Get the argument of the LaTeX command.
+
+        Args:
+            field (Enum): enum member with the regex-escaped LaTeX command as the value
+
+        Returns:
+            str: command argument, empty if the command is not defined
+        """
+        match = getCommandPattern(field.value).search(self.content)
+        return match[1] if match else ""
+
+    def updateField(self, field: Enum, argument: str):
+        """Set the argument of the LaTeX command, escaping reserved LaTeX characters.
+
+        Args:
+            field (Enum): enum member with the regex-escaped LaTeX command as the value
+            argument (str): new command argument
+        """
+        escapedArgument = escapeLatexCharacters(argument)
+        replacement = field.value + "{" + escapedArgument + "}"
+        if argument != escapedArgument:
+            logger.debug(f"LaTeX -> Escaped {argument} -> {escapedArgument}")
+        updatedContent = getCommandPattern(field.value).sub(replacement, self.content)
+        if updatedContent != self.content:
+            self.content = updatedContent
+            self.isModified = True
+
+    def save(self, out_file: str = None):
+        """Write the document if modified or written to another file.
+
+        Args:
+            out_file (str, optional): output path. Defaults to the loaded file.
+        """
+        if out_file is None:
+            if not self.isModified:
+                return
+            out_file = self.path
+        writeFileAtomic(out_file, self.content)
+        self.isModified = False
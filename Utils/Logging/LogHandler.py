@@ -0,0 +1,100 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Logging setup: quiet console output, structured JSON lines in size-capped rotating log files.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import json, logging, logging.handlers, os, sys
+from datetime import datetime, timezone
+
+LOGGER_NAME = "autocv"
+LOG_DEFAULT_LEVEL = "INFO"
+LOG_DEFAULT_MAX_SIZE_MB = 10
+LOG_DEFAULT_BACKUP_COUNT = 5
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+
+def getLogger(name: str) -> logging.Logger:
+    """Get a logger of the application, e.g. getLogger(__name__).
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+def logEvent(logger: logging.Logger, event: str, level: int = logging.INFO, **fields):
+    """Log a structured event, written as a single JSON line to the log file.
+
+    Args:
+        logger (logging.Logger): logger
+        event (str): event name, e.g. "job_processed"
+        level (int, optional): logging level. Defaults to logging.INFO.
+        fields: event fields, shall be JSON serializable
+    """
+    logger.log(level, event, extra={"fields": fields})
+
+class JsonFormatter(logging.Formatter):
+    """Formats every record as a single JSON line.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class ConsoleFormatter(logging.Formatter):
+    """Formats records as plain messages, structured event fields are appended as JSON.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        fields = getattr(record, "fields", None)
+        return f"{message} {json.dumps(fields, default=str)}" if fields else message
+
+def setupLogging(level: str = LOG_DEFAULT_LEVEL, logFile: str = None, maxSizeMB: float = LOG_DEFAULT_MAX_SIZE_MB,
+                    backupCount: int = LOG_DEFAULT_BACKUP_COUNT) -> logging.Logger:
+    """Configure the application logger. Calling it again replaces the previous configuration.
+
+    Args:
+        level (str, optional): minimum logged level, per-skill and per-term details are logged at DEBUG. Defaults to LOG_DEFAULT_LEVEL.
+        logFile (str, optional): path to the JSON lines log file, rotated when it exceeds maxSizeMB. Defaults to None (console only).
+        maxSizeMB (float, optional): maximum log file size. Defaults to LOG_DEFAULT_MAX_SIZE_MB.
+        backupCount (int, optional): number of kept rotated log files. Defaults to LOG_DEFAULT_BACKUP_COUNT.
+
+    Returns:
+        logging.Logger: application root logger
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level.upper())
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    consoleHandler = logging.StreamHandler(sys.stdout)
+    consoleHandler.setFormatter(ConsoleFormatter("%(message)s"))
+    logger.addHandler(consoleHandler)
+    if logFile:
+        if os.path.dirname(logFile):
+            os.makedirs(os.path.dirname(logFile), exist_ok=True)
+        fileHandler = logging.handlers.RotatingFileHandler(logFile, maxBytes=int(maxSizeMB * 1024 * 1024),
+                                                            backupCount=backupCount, encoding="utf-8")
+        fileHandler.setFormatter(JsonFormatter())
+        logger.addHandler(fileHandler)
+    return logger
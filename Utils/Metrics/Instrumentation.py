@@ -0,0 +1,190 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Lightweight per-stage timers, counters, optional cProfile sections and the JSON run report.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import cProfile, json, math, os, pstats, threading, time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# Pipeline stages
+STAGE_WEBDRIVER_SETUP = "webdriver_setup"
+STAGE_LIST_PAGE_LOAD = "list_page_load"
+STAGE_PARSE_SAVED_JOBS = "parse_saved_jobs"
+STAGE_DETAILS_FETCH = "details_fetch"
+STAGE_PARSE_JOB_DETAILS = "parse_job_details"
+STAGE_SCORING = "scoring"
+STAGE_FILE_WRITES = "file_writes"
+STAGE_GMAKE = "gmake"
+STAGE_BUILD_CACHE_RESTORE = "build_cache_restore"
+STAGE_PREAMBLE_FORMAT = "preamble_format"
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile.
+
+    Args:
+        values (list[float]): measured values
+        q (float): percentile in the range 0-100
+
+    Returns:
+        float: percentile value, None for no values
+    """
+    if not values:
+        return None
+    sortedValues = sorted(values)
+    return sortedValues[max(0, math.ceil(q / 100 * len(sortedValues)) - 1)]
+
+class Instrumentation:
+    """Collects stage timings, counters and per-job breakdowns of a run. Thread-safe.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Profilers of the threads which ran a profiled section, None while profiling is disabled
+        self.profilers = None
+        self.threadProfiling = threading.local()
+        self.reset()
+
+    def reset(self):
+        """Start a new run report. The profiler is kept, e.g. the profile of the sync daemon covers all of its syncs.
+        """
+        with self.lock:
+            self.startTime = time.time()
+            self.timings = defaultdict(list)
+            self.counters = Counter()
+            self.jobs = defaultdict(lambda: defaultdict(float))
+            self.sections = defaultdict(list)
+
+    @contextmanager
+    def timer(self, stage: str, job: str = None):
+        """Measure the wall-clock time of the block.
+
+        Args:
+            stage (str): stage name, e.g. STAGE_GMAKE
+            job (str, optional): job the time is attributed to in the per-job breakdown. Defaults to None.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, job)
+
+    def record(self, stage: str, seconds: float, job: str = None):
+        """Record a stage time measured by the caller.
+
+        Args:
+            stage (str): stage name
+            seconds (float): measured time
+            job (str, optional): job the time is attributed to. Defaults to None.
+        """
+        with self.lock:
+            self.timings[stage].append(seconds)
+            if job is not None:
+                self.jobs[job][stage] += seconds
+
+    def count(self, name: str, increment: int = 1):
+        with self.lock:
+            self.counters[name] += increment
+
+    def addToReport(self, section: str, entry: dict):
+        """Add an entry to a list section of the run report, e.g. the collapsed duplicate jobs.
+        """
+        with self.lock:
+            self.sections[section].append(entry)
+
+    def enableProfiling(self):
+        self.profilers = []
+
+    @contextmanager
+    def profiled(self):
+        """Run the block under cProfile if profiling is enabled. Nested sections are merged into the outer one.
+        Every thread has its own profiler, the profiles of all threads are merged by dumpProfile().
+        """
+        if self.profilers is None:
+            yield
+            return
+        threadProfiling = self.threadProfiling
+        if getattr(threadProfiling, "profiler", None) is None:
+            threadProfiling.profiler = cProfile.Profile()
+            threadProfiling.depth = 0
+            with self.lock:
+                self.profilers.append(threadProfiling.profiler)
+        isOutermost = threadProfiling.depth == 0
+        if isOutermost:
+            try:
+                threadProfiling.profiler.enable()
+            except ValueError:
+                # Python 3.12+ allows a single active profiler per process, the section of this thread is not profiled
+                isOutermost = False
+        threadProfiling.depth += 1
+        try:
+            yield
+        finally:
+            threadProfiling.depth -= 1
+            if isOutermost:
+                threadProfiling.profiler.disable()
+
+    def dumpProfile(self, path: str):
+        """Write the profiles of all threads merged into one stats file.
+        """
+        with self.lock:
+            profilers = list(self.profilers or [])
+        stats = None
+        for profiler in profilers:
+            profiler.create_stats()
+            if not profiler.stats:
+                continue
+            if stats is None:
+                stats = pstats.Stats(profiler)
+            else:
+                stats.add(profiler)
+        if stats is not None:
+            stats.dump_stats(path)
+
+    def buildReport(self) -> dict:
+        """Build the run report.
+
+        Returns:
+            dict: per-stage count, total, p50, p95 and max times in seconds, counters, per-job stage times and the added sections
+        """
+        with self.lock:
+            return {
+                "started": datetime.fromtimestamp(self.startTime, timezone.utc).isoformat(timespec="seconds"),
+                "durationSeconds": round(time.time() - self.startTime, 3),
+                "stages": {stage: {
+                    "count": len(values),
+                    "totalSeconds": round(sum(values), 6),
+                    "p50Seconds": round(percentile(values, 50), 6),
+                    "p95Seconds": round(percentile(values, 95), 6),
+                    "maxSeconds": round(max(values), 6)
+                } for stage, values in self.timings.items()},
+                "counters": dict(self.counters),
+                "jobs": {job: {stage: round(seconds, 6) for stage, seconds in stages.items()} for job, stages in self.jobs.items()},
+                **{section: list(entries) for section, entries in self.sections.items()}
+            }
+
+    def writeReport(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.buildReport(), f, indent=4)
+
+# Instrumentation of the current run, shared by all modules
+instrumentation = Instrumentation()
@@ -0,0 +1,135 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Detection of duplicate and near-duplicate saved jobs, built only once.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import hashlib, re
+from collections import defaultdict
+
+from SavedJobsFetchers.IJobsFetcherService import Job
+from Utils.Files.FileHandler import escapeFileSystemCharacters
+from Utils.Logging.LogHandler import getLogger
+
+logger = getLogger(__name__)
+
+# Maximum Hamming distance between the SimHashes of near-duplicate job details, -1 disables near-duplicate detection
+DEDUP_DEFAULT_MAX_DISTANCE = 3
+SIMHASH_BITS = 64
+# Single words keep the SimHashes of short job descriptions close after small edits
+SIMHASH_SHINGLE_SIZE = 1
+# The SimHash is split into DEDUP_MAX_SUPPORTED_DISTANCE + 1 bands, near-duplicates share at least one band
+DEDUP_MAX_SUPPORTED_DISTANCE = 7
+# Shorter details, e.g. the placeholder of a job without details, are matched on the exact key only
+DEDUP_MIN_DETAILS_WORDS = 20
+DUPLICATE_REASON_EXACT = "exact"
+DUPLICATE_REASON_NEAR = "near"
+WORD_PATTERN = re.compile(r"\w+")
+
+def getJobOutputKey(job: Job) -> tuple[str, str, str]:
+    """Get the normalized company, job and location, the same as used in the names of the built PDFs.
+    """
+    return tuple(escapeFileSystemCharacters((field or "").lower()) for field in (job.company, job.job, job.location))
+
+def computeSimHash(text: str) -> int:
+    """Compute the 64-bit SimHash of the word shingles of a text.
+
+    Args:
+        text (str): text, e.g. job details
+
+    Returns:
+        int: SimHash, similar texts differ in a few bits
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    shingles = [" ".join(words[i:i + SIMHASH_SHINGLE_SIZE]) for i in range(max(1, len(words) - SIMHASH_SHINGLE_SIZE + 1))]
+    shingleHashes = [f"{int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=SIMHASH_BITS // 8).digest(), 'big'):0{SIMHASH_BITS}b}"
+                        for shingle in shingles]
+    # A bit is set if it is set in the majority of the shingle hashes, counted column by column
+    return int("".join("1" if column.count("1") * 2 > len(shingles) else "0" for column in zip(*shingleHashes)), 2)
+
+class JobsDeduplicator:
+    """Finds jobs already seen, either with the same normalized company, job and location,
+    or at the same company with near-identical details, e.g. reposted roles.
+    """
+    def __init__(self, maxDistance: int = DEDUP_DEFAULT_MAX_DISTANCE):
+        """Create a deduplicator.
+
+        Args:
+            maxDistance (int, optional): maximum Hamming distance of near-duplicate SimHashes, -1 disables near-duplicates.
+                                        Defaults to DEDUP_DEFAULT_MAX_DISTANCE.
+        """
+        if maxDistance > DEDUP_MAX_SUPPORTED_DISTANCE:
+            raise ValueError(f"Maximum near-duplicate distance is {DEDUP_MAX_SUPPORTED_DISTANCE}, got {maxDistance}.")
+        self.maxDistance = maxDistance
+        self.bandBits = SIMHASH_BITS // (DEDUP_MAX_SUPPORTED_DISTANCE + 1)
+        self.jobsByKey = {}
+        # (company, band index, band value) -> [(SimHash, job)]
+        self.bands = defaultdict(list)
+
+    def getBands(self, simHash: int) -> list[tuple[int, int]]:
+        bandMask = (1 << self.bandBits) - 1
+        return [(band, simHash >> (band * self.bandBits) & bandMask) for band in range(DEDUP_MAX_SUPPORTED_DISTANCE + 1)]
+
+    def findDuplicate(self, job: Job) -> tuple[Job, str]:
+        """Find the first seen job the given job duplicates, register the job as seen otherwise.
+
+        Args:
+            job (Job): job
+
+        Returns:
+            tuple[Job, str]: duplicated job and DUPLICATE_REASON_EXACT or DUPLICATE_REASON_NEAR, None for a new job
+        """
+        key = getJobOutputKey(job)
+        if key in self.jobsByKey:
+            return self.jobsByKey[key], DUPLICATE_REASON_EXACT
+        simHash = computeSimHash(job.details) if self.maxDistance >= 0 and job.details \
+                    and len(WORD_PATTERN.findall(job.details)) >= DEDUP_MIN_DETAILS_WORDS else None
+        if simHash is not None:
+            company = key[0]
+            for band in self.getBands(simHash):
+                for candidateHash, candidate in self.bands[(company, *band)]:
+                    if (simHash ^ candidateHash).bit_count() <= self.maxDistance:
+                        return candidate, DUPLICATE_REASON_NEAR
+        self.jobsByKey[key] = job
+        if simHash is not None:
+            for band in self.getBands(simHash):
+                self.bands[(key[0], *band)].append((simHash, job))
+        return None
+
+def deduplicateJobs(jobs: list[Job], maxDistance: int = DEDUP_DEFAULT_MAX_DISTANCE) -> tuple[list[Job], list[tuple[Job, Job, str]]]:
+    """Split the jobs into unique jobs and duplicates.
+
+    Args:
+        jobs (list[Job]): jobs
+        maxDistance (int, optional): see JobsDeduplicator. Defaults to DEDUP_DEFAULT_MAX_DISTANCE.
+
+    Returns:
+        tuple[list[Job], list[tuple[Job, Job, str]]]: unique jobs, and (duplicate, duplicated job, reason) of the collapsed jobs
+    """
+    deduplicator = JobsDeduplicator(maxDistance)
+    uniqueJobs = []
+    collapsedJobs = []
+    for job in jobs:
+        duplicate = deduplicator.findDuplicate(job)
+        if duplicate is None:
+            uniqueJobs.append(job)
+        else:
+            logger.info(f"Skipping {job.job} at {job.company}, {duplicate[1]} duplicate of {duplicate[0].job} at {duplicate[0].company}.")
+            collapsedJobs.append((job, *duplicate))
+    return uniqueJobs, collapsedJobs
@@ -0,0 +1,143 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Streaming producer/consumer pipeline processing the jobs while the job portals are still being fetched.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import queue, threading, time
+from typing import Callable, Iterable
+
+from SavedJobsFetchers.IJobsFetcherService import Job
+from Utils.Pipeline.JobsDeduplicator import JobsDeduplicator, DEDUP_DEFAULT_MAX_DISTANCE
+from Utils.Logging.LogHandler import getLogger
+
+logger = getLogger(__name__)
+
+# Jobs waiting in the queue per consumer, producers block when the queue is full
+PIPELINE_QUEUE_SIZE_PER_CONSUMER = 2
+# Queue item stopping a consumer
+PIPELINE_STOP = None
+# Interval in seconds at which a producer blocked on a full queue checks whether it timed out
+PIPELINE_PUT_POLL_INTERVAL = 0.5
+
+class JobsPipeline:
+    """Bounded queue between the job producers, e.g. fetchers yielding jobs as soon as their details are parsed,
+    and the consumers scoring the jobs and building the CVs.
+    A failure or a timeout of a producer or a failure of a single job is logged and does not stop the pipeline.
+    """
+    def __init__(self, processJob: Callable[[Job], object], consumers: int = 1, queueSize: int = None,
+                    dedupMaxDistance: int = DEDUP_DEFAULT_MAX_DISTANCE):
+        """Create a pipeline.
+
+        Args:
+            processJob (Callable[[Job], object]): function processing one job, called concurrently by the consumers
+            consumers (int, optional): number of consumer threads. Defaults to 1.
+            queueSize (int, optional): maximum number of queued jobs. Defaults to PIPELINE_QUEUE_SIZE_PER_CONSUMER per consumer.
+            dedupMaxDistance (int, optional): near-duplicate distance of the skipped jobs, see JobsDeduplicator. Defaults to DEDUP_DEFAULT_MAX_DISTANCE.
+        """
+        self.processJob = processJob
+        self.consumers = max(1, consumers)
+        self.jobsQueue = queue.Queue(maxsize=queueSize or PIPELINE_QUEUE_SIZE_PER_CONSUMER * self.consumers)
+        self.lock = threading.Lock()
+        self.deduplicator = JobsDeduplicator(dedupMaxDistance)
+        self.collapsedJobs = []
+        self.results = []
+        self.failedJobs = []
+        self.failedProducers = []
+        self.timedOutProducers = set()
+
+    def produce(self, name: str, jobs: Iterable[Job]):
+        try:
+            for job in jobs:
+                with self.lock:
+                    duplicate = self.deduplicator.findDuplicate(job)
+                    if duplicate is not None:
+                        self.collapsedJobs.append((job, *duplicate))
+                if duplicate is not None:
+                    logger.info(f"Skipping {job.job} at {job.company} from {name}, {duplicate[1]} duplicate of {duplicate[0].job} at {duplicate[0].company}.")
+                    continue
+                # Blocks while the consumers are busy
+                if not self.putJob(name, job):
+                    return
+        except Exception as e:
+            logger.exception(f"Fetching saved jobs from {name} failed: {e}")
+            with self.lock:
+                self.failedProducers.append(name)
+
+    def putJob(self, name: str, job: Job) -> bool:
+        """Queue the job unless its producer timed out.
+
+        Returns:
+            bool: True if the job was queued
+        """
+        while name not in self.timedOutProducers:
+            try:
+                self.jobsQueue.put(job, timeout=PIPELINE_PUT_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        logger.warning(f"Dropping {job.job} at {job.company} from {name}, fetched after the timeout.")
+        return False
+
+    def consume(self):
+        while True:
+            job = self.jobsQueue.get()
+            if job is PIPELINE_STOP:
+                return
+            try:
+                result = self.processJob(job)
+                with self.lock:
+                    self.results.append((job, result))
+            except Exception as e:
+                logger.exception(f"Failed to process {job.job} at {job.company}: {e}")
+                with self.lock:
+                    self.failedJobs.append(job)
+
+    def run(self, producers: dict[str, Iterable[Job]], timeouts: dict[str, float] = None) -> list[tuple[Job, object]]:
+        """Run the producers and the consumers until all jobs are processed.
+
+        Args:
+            producers (dict[str, Iterable[Job]]): name -> iterable of jobs, each iterated in its own thread
+            timeouts (dict[str, float], optional): name -> maximum time in seconds to wait for all jobs of the producer.
+                A producer still running after its timeout is counted as failed and its later jobs are dropped. Defaults to None (no timeouts).
+
+        Returns:
+            list[tuple[Job, object]]: processed jobs and their results, in the completion order
+        """
+        consumerThreads = [threading.Thread(target=self.consume, name=f"pipeline-consumer-{i}", daemon=True)
+                            for i in range(self.consumers)]
+        producerThreads = [threading.Thread(target=self.produce, args=(name, jobs), name=f"pipeline-producer-{name}", daemon=True)
+                            for name, jobs in producers.items()]
+        start = time.monotonic()
+        for thread in consumerThreads + producerThreads:
+            thread.start()
+        for name, thread in zip(producers, producerThreads):
+            timeout = (timeouts or {}).get(name)
+            thread.join(None if timeout is None else max(0, start + timeout - time.monotonic()))
+            if thread.is_alive():
+                # A stalled producer cannot be interrupted, its daemon thread is abandoned
+                logger.error(f"Fetching saved jobs from {name} timed out after {timeout} s.")
+                with self.lock:
+                    self.timedOutProducers.add(name)
+                    self.failedProducers.append(name)
+        for _ in consumerThreads:
+            self.jobsQueue.put(PIPELINE_STOP)
+        for thread in consumerThreads:
+            thread.join()
+        return self.results
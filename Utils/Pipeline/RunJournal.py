@@ -0,0 +1,232 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Durable per-run journal of the job stages, used to resume a failed run with only the unfinished jobs.
+# Every stage completed for a job (fetched, scored, rendered, built) is appended as a JSON line, synced to disk once per stage.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import hashlib, json, os, threading
+from datetime import datetime
+
+from SavedJobsFetchers.IJobsFetcherService import Job
+from Utils.Pipeline.JobsDeduplicator import getJobOutputKey
+from Utils.Logging.LogHandler import getLogger
+
+logger = getLogger(__name__)
+
+# Job stages, in the processing order
+JOURNAL_STAGE_FETCHED = "fetched"
+JOURNAL_STAGE_SCORED = "scored"
+JOURNAL_STAGE_RENDERED = "rendered"
+JOURNAL_STAGE_BUILT = "built"
+# Run stages
+JOURNAL_STAGE_RUN_STARTED = "run_started"
+JOURNAL_STAGE_RUN_RESUMED = "run_resumed"
+JOURNAL_STAGE_FETCH_COMPLETED = "fetch_completed"
+JOURNAL_STAGE_RUN_COMPLETED = "run_completed"
+JOURNAL_JOB_FIELDS = ["company", "job", "location", "url", "details", "letterAddress", "letterRecipient", "isVisaRequired"]
+
+def getJournalJobKey(job: Job) -> str:
+    return "/".join(getJobOutputKey(job))
+
+def computeSkillsDigest(skills_json_file: str) -> str:
+    """Hash the skills database, the skill scores and CVs of a resumed run are stale once it changes.
+    """
+    with open(skills_json_file, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+class RunJournal:
+    """Journal of the current run, kept as JSON lines. Until the journal is opened the stages are tracked in memory only.
+    Fields of the fetched jobs are only kept in memory when loaded from the journal of a resumed run.
+    The details of the jobs kept in the jobs store are journaled as the store key only.
+    """
+    def __init__(self):
+        self.file = None
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.jobs = {}
+        self.runStages = set()
+        self.skillsDigest = None
+
+    def open(self, path: str, resume: bool = False, skillsDigest: str = None) -> "RunJournal":
+        """Open the journal. Use as a context manager.
+
+        Args:
+            path (str): path to the JSON lines journal file
+            resume (bool, optional): load the journal of the previous run and continue it, start a new journal otherwise. Defaults to False.
+            skillsDigest (str, optional): digest of the skills database used by this run, see computeSkillsDigest. Defaults to None.
+
+        Returns:
+            RunJournal: opened journal
+        """
+        self.reset()
+        if resume and os.path.isfile(path):
+            self.load(path)
+            if skillsDigest is not None and self.skillsDigest is not None and skillsDigest != self.skillsDigest:
+                self.dropScoredStages()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.file = open(path, "a" if resume else "w", encoding="utf-8")
+        self.recordRun(JOURNAL_STAGE_RUN_RESUMED if resume else JOURNAL_STAGE_RUN_STARTED,
+                        **({"skillsDigest": skillsDigest} if skillsDigest is not None else {}))
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def load(self, path: str):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Last line of an interrupted run
+                    logger.warning(f"Skipping an incomplete run journal entry in {path}.")
+                    continue
+                self.apply(entry, withFields=True)
+        logger.info(f"Loaded the run journal with {len(self.jobs)} job(s), {sum(JOURNAL_STAGE_BUILT in state['stages'] for state in self.jobs.values())} built.")
+
+    def dropScoredStages(self):
+        """Forget the skill scores and built PDFs of the journaled jobs, only their fetched fields are kept.
+        """
+        logger.warning("The skills database changed since the journaled run, the resumed jobs are scored and built again.")
+        for state in self.jobs.values():
+            state["stages"] &= {JOURNAL_STAGE_FETCHED}
+            state.pop("skillScores", None)
+            state.pop("pdfs", None)
+
+    def apply(self, entry: dict, withFields: bool = False):
+        if "job" not in entry:
+            self.runStages.add(entry["stage"])
+            if "skillsDigest" in entry:
+                self.skillsDigest = entry["skillsDigest"]
+            return
+        state = self.jobs.setdefault(entry["job"], {"stages": set()})
+        state["stages"].add(entry["stage"])
+        for name in ("fields", "storeKey", "skillScores", "pdfs") if withFields else ("skillScores", "pdfs"):
+            if name in entry:
+                state[name] = entry[name]
+
+    def write(self, entry: dict, sync: bool = True):
+        with self.lock:
+            self.apply(entry)
+            if self.file is None:
+                return
+            self.file.write(json.dumps(entry) + "\n")
+            self.file.flush()
+            if sync:
+                os.fsync(self.file.fileno())
+
+    def sync(self):
+        """Sync the entries written without syncing to disk, e.g. at the end of a stage.
+        """
+        with self.lock:
+            if self.file is not None:
+                os.fsync(self.file.fileno())
+
+    def recordRun(self, stage: str, **data):
+        self.write({"time": datetime.now().isoformat(timespec="seconds"), "stage": stage, **data})
+
+    def record(self, job: Job, stage: str, sync: bool = True, **data):
+        """Record a completed job stage.
+
+        Args:
+            job (Job): processed job
+            stage (str): completed stage, e.g. JOURNAL_STAGE_BUILT
+            sync (bool, optional): sync the entry to disk, otherwise call sync() at the end of the stage. Defaults to True.
+            data: stage results, fields of the fetched job, skillScores of the scored job or pdfs of the built job
+        """
+        self.write({"time": datetime.now().isoformat(timespec="seconds"), "stage": stage, "job": getJournalJobKey(job), **data}, sync)
+
+    def recordFetched(self, job: Job, jobsStore: "JobsStore" = None, sync: bool = True):
+        """Record a fetched job. Its details are journaled only if there is no jobs store to keep them.
+
+        Args:
+            job (Job): fetched job
+            jobsStore (JobsStore, optional): store of the fetched jobs, the job is stored unless its details are already served by the store. Defaults to None.
+            sync (bool, optional): sync the entry to disk, otherwise call sync() at the end of the stage. Defaults to True.
+        """
+        if self.file is None:
+            self.record(job, JOURNAL_STAGE_FETCHED, sync)
+            return
+        fields = {name: getattr(job, name) for name in JOURNAL_JOB_FIELDS if name != "details"}
+        if jobsStore is None or not job.details:
+            self.record(job, JOURNAL_STAGE_FETCHED, sync, fields={**fields, "details": job.details})
+            return
+        from SavedJobsFetchers.JobsStore import getJobKey
+        if job.detailsLoader is None:
+            jobsStore.put(job)
+        self.record(job, JOURNAL_STAGE_FETCHED, sync, fields=fields, storeKey=getJobKey(job.url))
+
+    @property
+    def isFetchCompleted(self) -> bool:
+        return JOURNAL_STAGE_FETCH_COMPLETED in self.runStages
+
+    @property
+    def isRunCompleted(self) -> bool:
+        return JOURNAL_STAGE_RUN_COMPLETED in self.runStages
+
+    def getFetchedJobs(self, jobsStore: "JobsStore" = None) -> list[Job]:
+        """Get the jobs fetched by the journaled run, in the fetch order.
+
+        Args:
+            jobsStore (JobsStore, optional): store serving the details of the jobs journaled with a store key. Defaults to None.
+
+        Returns:
+            list[Job]: fetched jobs
+        """
+        fetchedJobs = []
+        for state in self.jobs.values():
+            if "fields" not in state:
+                continue
+            job = Job(**state["fields"])
+            if "storeKey" in state and (jobsStore is None or not jobsStore.loadDetails(job)):
+                logger.warning(f"Details of {job.job} at {job.company} are not in the jobs store, the CV is built without them.")
+            fetchedJobs.append(job)
+        return fetchedJobs
+
+    def getSkillScores(self, job: Job) -> list[int]:
+        state = self.jobs.get(getJournalJobKey(job))
+        return state.get("skillScores") if state is not None else None
+
+    def getBuiltPDFs(self, job: Job) -> list[str]:
+        """Get the PDFs of a job built by the journaled run.
+
+        Returns:
+            list[str]: paths of the PDF files, None if the job was not built or any of its PDFs is missing
+        """
+        state = self.jobs.get(getJournalJobKey(job))
+        if state is None or JOURNAL_STAGE_BUILT not in state["stages"] or not state.get("pdfs"):
+            return None
+        return state["pdfs"] if all(os.path.isfile(pdf) for pdf in state["pdfs"]) else None
+
+# Journal of the current run
+runJournal = RunJournal()
@@ -0,0 +1,187 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Validated and compiled skills database, loaded once per process.
+# The compiled form is persisted next to the skills JSON file and reused while the JSON file is unchanged.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import gc, hashlib, json, os, pickle, threading, time
+
+from Utils.Files.FileHandler import writeFileAtomic
+from . import SkillsMatcher as SkillsMatcherModule
+from .SkillsMatcher import SkillsMatcher
+from Utils.Logging.LogHandler import getLogger
+
+logger = getLogger(__name__)
+
+SKILLS_SNAPSHOT_SUFFIX = ".compiled"
+SKILLS_SNAPSHOT_VERSION = 1
+SKILL_REQUIRED_KEYS = {"skill": str, "latex": str, "area": list, "alias": list, "is_case_sensitive": bool}
+
+def computeCodeDigest() -> str:
+    """Hash the source of the pickled classes, a snapshot written by another code version is never loaded.
+    """
+    digest = hashlib.sha256()
+    for sourceFile in (SkillsMatcherModule.__file__, __file__):
+        with open(sourceFile, "rb") as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+    return digest.hexdigest()
+
+class SkillsSchemaError(ValueError):
+    """Raised when the skills JSON file does not follow the format described in User/README.md.
+    """
+    pass
+
+def validateSkills(skills) -> None:
+    """Validate the skills JSON content.
+
+    Args:
+        skills: parsed skills JSON content
+
+    Raises:
+        SkillsSchemaError: on the first schema violation
+    """
+    if not isinstance(skills, dict):
+        raise SkillsSchemaError("Skills JSON shall be an object mapping skill section names to lists of skills.")
+    for skillSection, sectionSkills in skills.items():
+        if not isinstance(sectionSkills, list):
+            raise SkillsSchemaError(f"Skill section \"{skillSection}\" shall be a list of skills.")
+        for index, skill in enumerate(sectionSkills):
+            if not isinstance(skill, dict):
+                raise SkillsSchemaError(f"Skill {skillSection}[{index}] shall be an object.")
+            for key, keyType in SKILL_REQUIRED_KEYS.items():
+                if not isinstance(skill.get(key), keyType):
+                    raise SkillsSchemaError(f"Skill {skillSection}[{index}] shall have the \"{key}\" key of the {keyType.__name__} type.")
+            for key in ["area", "alias"]:
+                if not all(isinstance(term, str) for term in skill[key]):
+                    raise SkillsSchemaError(f"Skill {skillSection}[{index}] \"{key}\" shall be a list of strings.")
+
+class SkillsDatabase:
+    """Skills from the skills JSON file with the compiled term index and the section ordering.
+    """
+    def __init__(self, skills: dict, sourceModificationTime: int = None, sourceHash: str = None):
+        """Validate and compile the skills.
+
+        Args:
+            skills (dict): skills JSON content
+            sourceModificationTime (int, optional): modification time of the skills JSON file in ns. Defaults to None.
+            sourceHash (str, optional): SHA-256 of the skills JSON file. Defaults to None.
+        """
+        validateSkills(skills)
+        self.skills = skills
+        self.sections = list(skills)
+        self.matcher = SkillsMatcher(skills)
+        self.sourceModificationTime = sourceModificationTime
+        self.sourceHash = sourceHash
+        self.loadTime = None
+        self.isLoadedFromSnapshot = False
+
+    @staticmethod
+    def getSnapshotPath(path: str) -> str:
+        return path + SKILLS_SNAPSHOT_SUFFIX
+
+    @classmethod
+    def load(cls, path: str, useSnapshot: bool = True) -> "SkillsDatabase":
+        """Load the skills database, from the compiled snapshot if the JSON file has not changed.
+
+        Args:
+            path (str): path to the skills JSON file
+            useSnapshot (bool, optional): read and write the compiled snapshot. Defaults to True.
+
+        Returns:
+            SkillsDatabase: loaded database
+        """
+        start = time.perf_counter()
+        modificationTime = os.stat(path).st_mtime_ns
+        with open(path, "rb") as file:
+            content = file.read()
+        sourceHash = hashlib.sha256(content).hexdigest()
+        database = cls.loadSnapshot(path, modificationTime, sourceHash) if useSnapshot else None
+        if database is None:
+            database = cls(json.loads(content), modificationTime, sourceHash)
+            if useSnapshot:
+                database.saveSnapshot(path)
+        database.loadTime = time.perf_counter() - start
+        return database
+
+    @classmethod
+    def loadSnapshot(cls, path: str, modificationTime: int, sourceHash: str) -> "SkillsDatabase":
+        """Load the compiled snapshot of the skills JSON file.
+
+        Returns:
+            SkillsDatabase: loaded database, None if the snapshot is missing, stale or unreadable
+        """
+        snapshotPath = cls.getSnapshotPath(path)
+        if not os.path.isfile(snapshotPath):
+            return None
+        # The snapshot contains many small objects, garbage collection passes would dominate the unpickling time
+        isGcEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(snapshotPath, "rb") as file:
+                snapshot = pickle.load(file)
+            if (not isinstance(snapshot, dict) or snapshot.get("version") != SKILLS_SNAPSHOT_VERSION
+                    or snapshot.get("codeDigest") != computeCodeDigest() or snapshot.get("modificationTime") != modificationTime
+                    or snapshot.get("sourceHash") != sourceHash or not isinstance(snapshot.get("database"), cls)):
+                return None
+        except Exception as e:
+            # Any corrupted or incompatible snapshot is rebuilt from the JSON file
+            logger.warning(f"Failed to load the compiled skills snapshot {snapshotPath}, rebuilding it: {e!r}")
+            return None
+        finally:
+            if isGcEnabled:
+                gc.enable()
+        database = snapshot["database"]
+        database.isLoadedFromSnapshot = True
+        return database
+
+    def saveSnapshot(self, path: str):
+        snapshot = {"version": SKILLS_SNAPSHOT_VERSION, "codeDigest": computeCodeDigest(), "modificationTime": self.sourceModificationTime,
+                    "sourceHash": self.sourceHash, "database": self}
+        try:
+            writeFileAtomic(self.getSnapshotPath(path), pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError as e:
+            logger.warning(f"Failed to save the compiled skills snapshot: {e}")
+
+# Skills databases loaded in this process, by the skills JSON file path
+skillsDatabases = {}
+skillsDatabasesLock = threading.Lock()
+
+def getSkillsDatabase(path: str, useSnapshot: bool = True) -> SkillsDatabase:
+    """Get the skills database loaded once per process, reloaded only if the skills JSON file has been modified.
+
+    Args:
+        path (str): path to the skills JSON file
+        useSnapshot (bool, optional): read and write the compiled snapshot. Defaults to True.
+
+    Returns:
+        SkillsDatabase: loaded database, None if the file does not exist
+    """
+    if not os.path.isfile(path):
+        logger.warning(f"File {path} does not exists!")
+        return None
+    key = os.path.abspath(path)
+    with skillsDatabasesLock:
+        database = skillsDatabases.get(key)
+        if database is None or database.sourceModificationTime != os.stat(path).st_mtime_ns:
+            database = SkillsDatabase.load(path, useSnapshot)
+            skillsDatabases[key] = database
+            logger.info(f"Loaded skills database {path} in {database.loadTime * 1000:.2f} ms "
+                  f"({'compiled snapshot' if database.isLoadedFromSnapshot else 'parsed and compiled'}).")
+        return database
@@ -0,0 +1,263 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Compiled skills matcher based on the Aho-Corasick automaton.
+# Scores every skill, alias and area from skills.json in a single pass over the job description.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+from collections import deque
+from typing import Iterable
+
+SCORE_MULTIPLIER_SKILL_MENTIONED = 5
+SCORE_MULTIPLIER_SKILL_ALIAS_MENTIONED = 4
+SCORE_MULTIPLIER_SKILL_AREA_MENTIONED = 1
+
+SKILL_AREA_GENERIC = "generic"
+
+class AhoCorasickAutomaton:
+    """Multi-pattern string matcher.
+    Counts occurrences of every added term exactly like str.count() does, i.e. non-overlapping and left to right.
+    """
+    def __init__(self):
+        self.terms = []
+        self.termIds = {}
+        self.transitions = [{}]
+        self.failures = [0]
+        self.outputs = [[]]
+        self.isBuilt = False
+
+    def addTerm(self, term: str) -> int:
+        """Add a term to the automaton. Adding the same term twice returns the same id.
+
+        Args:
+            term (str): term to search for
+
+        Returns:
+            int: term id, used as an index of the countOccurrences() result
+        """
+        if term in self.termIds:
+            return self.termIds[term]
+        termId = len(self.terms)
+        self.terms.append(term)
+        self.termIds[term] = termId
+        self.isBuilt = False
+        return termId
+
+    def build(self):
+        """Build the trie and the failure links for all added terms.
+        """
+        self.transitions = [{}]
+        self.failures = [0]
+        self.outputs = [[]]
+        for termId, term in enumerate(self.terms):
+            if not term:
+                # Empty terms are handled separately in countOccurrences()
+                continue
+            state = 0
+            for ch in term:
+                nextState = self.transitions[state].get(ch)
+                if nextState is None:
+                    nextState = len(self.transitions)
+                    self.transitions.append({})
+                    self.failures.append(0)
+                    self.outputs.append([])
+                    self.transitions[state][ch] = nextState
+                state = nextState
+            self.outputs[state].append((termId, len(term)))
+        # Breadth-first traversal to set failure links and merge outputs of suffix states
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nextState in self.transitions[state].items():
+                queue.append(nextState)
+                failure = self.failures[state]
+                while failure and ch not in self.transitions[failure]:
+                    failure = self.failures[failure]
+                failure = self.transitions[failure].get(ch, 0)
+                self.failures[nextState] = failure if failure != nextState else 0
+                self.outputs[nextState] = self.outputs[nextState] + self.outputs[self.failures[nextState]]
+        self.isBuilt = True
+
+    def countOccurrences(self, text: str) -> list[int]:
+        """Count non-overlapping occurrences of all terms in a single pass over the text.
+
+        Args:
+            text (str): text to search in
+
+        Returns:
+            list[int]: number of occurrences indexed by the term id
+        """
+        if not self.isBuilt:
+            self.build()
+        counts = [0] * len(self.terms)
+        # Position right after the last counted occurrence of each term, as str.count() skips overlaps
+        nextAllowedStart = [0] * len(self.terms)
+        transitions = self.transitions
+        failures = self.failures
+        outputs = self.outputs
+        state = 0
+        for position, ch in enumerate(text):
+            while state and ch not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(ch, 0)
+            for termId, termLength in outputs[state]:
+                start = position - termLength + 1
+                if start >= nextAllowedStart[termId]:
+                    counts[termId] += 1
+                    nextAllowedStart[termId] = position + 1
+        for termId, term in enumerate(self.terms):
+            if not term:
+                counts[termId] = len(text) + 1
+        return counts
+
+class CompiledSkill:
+    """Skill from skills.json with its terms resolved to the automaton term ids.
+    """
+    def __init__(self, skill: dict, skillTermId: int, aliasTermIds: list[int], areaTermIds: list[int], isCaseSensitive: bool):
+        self.skill = skill
+        self.skillTermId = skillTermId
+        self.aliasTermIds = aliasTermIds
+        self.areaTermIds = areaTermIds
+        self.isCaseSensitive = isCaseSensitive
+        self.isGeneric = SKILL_AREA_GENERIC in skill["area"]
+
+class SkillsMatcher:
+    """Skills matcher compiled once per skills.json content.
+    Case-sensitive terms are searched in the original job description, case-insensitive ones (including all areas)
+    in the lowercased and stripped description, the same way isSkillInJobDescription() does.
+
+    Scores are computed as a sparse term-frequency vector multiplied by a sparse terms x skills weight matrix
+    built from the SCORE_MULTIPLIER_* constants, so a batch of jobs yields a jobs x skills score matrix.
+    Skills are indexed in the skills.json order, section by section.
+    """
+    def __init__(self, skills: dict):
+        """Compile the skills matcher.
+
+        Args:
+            skills (dict): skills.json content, the skill section name mapped to the list of skills
+        """
+        self.caseSensitiveAutomaton = AhoCorasickAutomaton()
+        self.caseInsensitiveAutomaton = AhoCorasickAutomaton()
+        self.sections = {}
+        self.sectionSlices = {}
+        skillIndex = 0
+        for skillSection, sectionSkills in skills.items():
+            compiledSkills = []
+            for skill in sectionSkills:
+                isCaseSensitive = bool(skill["is_case_sensitive"])
+                automaton = self.caseSensitiveAutomaton if isCaseSensitive else self.caseInsensitiveAutomaton
+                normalize = (lambda term: term) if isCaseSensitive else (lambda term: term.lower())
+                compiledSkills.append(CompiledSkill(
+                    skill=skill,
+                    skillTermId=automaton.addTerm(normalize(skill["skill"])),
+                    aliasTermIds=[automaton.addTerm(normalize(alias)) for alias in skill["alias"]],
+                    areaTermIds=[self.caseInsensitiveAutomaton.addTerm(area.lower())
+                                    for area in skill["area"] if area != SKILL_AREA_GENERIC],
+                    isCaseSensitive=isCaseSensitive))
+            self.sections[skillSection] = compiledSkills
+            self.sectionSlices[skillSection] = slice(skillIndex, skillIndex + len(compiledSkills))
+            skillIndex += len(compiledSkills)
+        self.skillsCount = skillIndex
+        self.caseSensitiveAutomaton.build()
+        self.caseInsensitiveAutomaton.build()
+        self.buildWeights()
+
+    def buildWeights(self):
+        """Build the sparse weight matrix columns, i.e. (skill index, weight) pairs for every term id,
+        and the base score vector of the generic skills.
+        """
+        self.caseSensitiveWeights = [[] for _ in self.caseSensitiveAutomaton.terms]
+        self.caseInsensitiveWeights = [[] for _ in self.caseInsensitiveAutomaton.terms]
+        self.baseScores = [0] * self.skillsCount
+        for skillSection, compiledSkills in self.sections.items():
+            for skillIndex, compiledSkill in enumerate(compiledSkills, start=self.sectionSlices[skillSection].start):
+                weights = self.caseSensitiveWeights if compiledSkill.isCaseSensitive else self.caseInsensitiveWeights
+                weights[compiledSkill.skillTermId].append((skillIndex, SCORE_MULTIPLIER_SKILL_MENTIONED))
+                for termId in compiledSkill.aliasTermIds:
+                    weights[termId].append((skillIndex, SCORE_MULTIPLIER_SKILL_ALIAS_MENTIONED))
+                for termId in compiledSkill.areaTermIds:
+                    self.caseInsensitiveWeights[termId].append((skillIndex, SCORE_MULTIPLIER_SKILL_AREA_MENTIONED))
+                if compiledSkill.isGeneric:
+                    self.baseScores[skillIndex] = SCORE_MULTIPLIER_SKILL_AREA_MENTIONED
+
+    def countTerms(self, jobDetails: str) -> tuple[list[int], list[int]]:
+        """Count all terms in the job description.
+
+        Args:
+            jobDetails (str): job description
+
+        Returns:
+            tuple[list[int], list[int]]: case-sensitive and case-insensitive term counts
+        """
+        caseSensitiveCounts = self.caseSensitiveAutomaton.countOccurrences(jobDetails) \
+            if self.caseSensitiveAutomaton.terms else []
+        caseInsensitiveCounts = self.caseInsensitiveAutomaton.countOccurrences(jobDetails.lower().strip()) \
+            if self.caseInsensitiveAutomaton.terms else []
+        return caseSensitiveCounts, caseInsensitiveCounts
+
+    def scoreJob(self, jobDetails: str) -> list[int]:
+        """Score all skills against the job description.
+
+        Args:
+            jobDetails (str): job description
+
+        Returns:
+            list[int]: skill scores indexed by the skill index
+        """
+        scores = list(self.baseScores)
+        for termCounts, weights in zip(self.countTerms(jobDetails), (self.caseSensitiveWeights, self.caseInsensitiveWeights)):
+            # Sparse term frequencies times the sparse weight matrix
+            for termId, termCount in enumerate(termCounts):
+                if termCount:
+                    for skillIndex, weight in weights[termId]:
+                        scores[skillIndex] += termCount * weight
+        return scores
+
+    def scoreJobs(self, jobDetailsList: Iterable[str]) -> list[list[int]]:
+        """Score all skills against a batch of job descriptions.
+
+        Args:
+            jobDetailsList (Iterable[str]): job descriptions, e.g. a generator loading one description at a time
+
+        Returns:
+            list[list[int]]: jobs x skills score matrix
+        """
+        return [self.scoreJob(jobDetails) for jobDetails in jobDetailsList]
+
+    def splitScores(self, scores: list[int]) -> dict[str, list[int]]:
+        """Split a score matrix row into skill sections.
+
+        Args:
+            scores (list[int]): skill scores indexed by the skill index
+
+        Returns:
+            dict[str, list[int]]: skill section name mapped to the skill scores, in the skills.json order
+        """
+        return {skillSection: scores[sectionSlice] for skillSection, sectionSlice in self.sectionSlices.items()}
+
+    def scoreSkills(self, jobDetails: str) -> dict[str, list[int]]:
+        """Score all skills against the job description.
+
+        Args:
+            jobDetails (str): job description
+
+        Returns:
+            dict[str, list[int]]: skill section name mapped to the skill scores, in the skills.json order
+        """
+        return self.splitScores(self.scoreJob(jobDetails))
@@ -0,0 +1,71 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Renderer of the skills LaTeX file (04_skills.tex) from the skill scores.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import heapq, logging
+
+from .SkillsMatcher import SkillsMatcher
+from Utils.Logging.LogHandler import getLogger
+
+logger = getLogger(__name__)
+
+def rankSectionSkills(sectionSkills: list[dict], sectionScores: list[int], maxSkills: int = None) -> list[tuple[dict, int]]:
+    """Order the section skills by score, highest first, keeping the skills.json order of equal scores.
+
+    Args:
+        sectionSkills (list[dict]): skills of the section
+        sectionScores (list[int]): skill scores
+        maxSkills (int, optional): return only the top maxSkills skills. Defaults to None (all skills).
+
+    Returns:
+        list[tuple[dict, int]]: ranked (skill, score) pairs
+    """
+    scoredSkills = zip(sectionSkills, sectionScores)
+    if maxSkills is not None and maxSkills < len(sectionSkills):
+        # Partial sort, nlargest() is stable like sorted()
+        return heapq.nlargest(maxSkills, scoredSkills, key=lambda scoredSkill: scoredSkill[1])
+    return sorted(scoredSkills, key=lambda scoredSkill: scoredSkill[1], reverse=True)
+
+def renderSkillLatex(skill: dict, score: int) -> str:
+    # Mentioned skills are highlighted with the "/1" suffix
+    return "{" + (skill["latex"] + "/1" if score > 0 else skill["latex"]) + "}"
+
+def renderSkillsLatex(matcher: SkillsMatcher, skillScores: list[int], maxSkillsPerSection: int = None) -> str:
+    """Render the skills LaTeX file content. Does not touch any file.
+
+    Args:
+        matcher (SkillsMatcher): compiled skills
+        skillScores (list[int]): skill scores indexed by the skill index, e.g. a SkillsMatcher.scoreJobs() matrix row
+        maxSkillsPerSection (int, optional): maximum number of skills in a section. Defaults to None (all skills).
+
+    Returns:
+        str: skills LaTeX file content
+    """
+    buffer = []
+    for skillSection, sectionScores in matcher.splitScores(skillScores).items():
+        sectionSkills = [compiledSkill.skill for compiledSkill in matcher.sections[skillSection]]
+        rankedSkills = rankSectionSkills(sectionSkills, sectionScores, maxSkillsPerSection)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{skillSection}: " + ", ".join(f"{skill['skill']}={score}" for skill, score in rankedSkills if score > 0))
+        buffer.append("\\newcommand\\" + skillSection + "{\n")
+        buffer.append(",\n".join(renderSkillLatex(skill, score) for skill, score in rankedSkills))
+        buffer.append("}\n\n")
+    return "".join(buffer)
@@ -0,0 +1,93 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Deterministic generators of synthetic skills libraries, job descriptions and job data for the benchmarks,
+# and access to the recorded LinkedIn HTML fixtures.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import json, os, random
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "..", "Tests", "Fixtures")
+LINKEDIN_SAVED_JOBS_FIXTURE = "linkedin_saved_jobs.html"
+LINKEDIN_JOB_DETAILS_FIXTURE = "linkedin_job_details.html"
+
+# Benchmark sizes, the full range is enabled with the BENCH_FULL=1 environment variable
+BENCH_FULL = os.getenv("BENCH_FULL", "0") == "1"
+SKILLS_COUNTS = [10, 100, 1000, 10000] if BENCH_FULL else [10, 100]
+DESCRIPTION_SIZES_KB = [1, 10, 100] if BENCH_FULL else [1, 10]
+HTML_PAGE_SIZES_KB = [64, 1024, 4096] if BENCH_FULL else [64]
+
+WORDS = ["embedded", "signal", "processing", "Python", "C++", "team", "design", "testing", "Linux", "real-time",
+         "firmware", "audio", "DSP", "cloud", "experience", "requirements", "communication", "C", "Go", "SQL"]
+# Words with characters reserved in LaTeX and file system names, as found in company names, titles and locations
+SPECIAL_WORDS = ["R&D", "C#", "100%", "$120k", "{remote}", "snake_case", "Boston, MA", "Sr./Lead", "(Hybrid)", "A|B", "v2.0"]
+
+def generateSkills(skillsCount: int, randomGenerator: random.Random) -> dict:
+    """Generate a skills library in the skills.json format.
+
+    Args:
+        skillsCount (int): number of skills, spread over 8 sections
+        randomGenerator (random.Random): seeded generator
+
+    Returns:
+        dict: section -> list of skills
+    """
+    skills = {}
+    for skillIndex in range(skillsCount):
+        skillSection = f"benchmarkSection{skillIndex % 8}"
+        skillName = f"{randomGenerator.choice(WORDS)} {randomGenerator.choice(WORDS)} {skillIndex}"
+        skills.setdefault(skillSection, []).append({
+            "skill": skillName,
+            "latex": skillName.replace(" ", "~"),
+            "area": randomGenerator.sample(WORDS, 2) + (["generic"] if skillIndex % 5 == 0 else []),
+            "alias": [f"{randomGenerator.choice(WORDS)}-{skillIndex}"],
+            "is_case_sensitive": skillIndex % 3 == 0
+        })
+    return skills
+
+def writeSkillsFile(path: str, skillsCount: int, seed: int = 0) -> dict:
+    """Generate a skills library and save it as a skills.json file.
+
+    Returns:
+        dict: generated skills
+    """
+    skills = generateSkills(skillsCount, random.Random(seed))
+    with open(path, "w") as file:
+        json.dump(skills, file)
+    return skills
+
+def generateJobDescription(sizeInBytes: int, randomGenerator: random.Random, words: list[str] = WORDS) -> str:
+    """Generate a job description of about sizeInBytes characters.
+    """
+    descriptionWords = []
+    size = 0
+    while size < sizeInBytes:
+        word = randomGenerator.choice(words)
+        descriptionWords.append(word)
+        size += len(word) + 1
+    return " ".join(descriptionWords)
+
+def generateJobFields(jobsCount: int, randomGenerator: random.Random) -> list[str]:
+    """Generate company, job and location like strings containing reserved LaTeX and file system characters.
+    """
+    return [generateJobDescription(40, randomGenerator, WORDS + SPECIAL_WORDS) for _ in range(jobsCount)]
+
+def loadFixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), "r") as file:
+        return file.read()
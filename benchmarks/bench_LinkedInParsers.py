@@ -0,0 +1,108 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Benchmark of the LinkedIn HTML parser backends over the saved HTML fixtures.
+# Reports parse time and peak memory per page for every backend, with and without the SoupStrainer.
+# The Python heap peak is traced by tracemalloc, which misses the C allocations of lxml, hence the peak RSS growth
+# is reported as well. Every measurement runs in a fresh process, as the peak RSS of a process never decreases.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+# Example usage:
+#   python -m benchmarks.bench_LinkedInParsers [--page_mb=3] [--repeat=3]
+#
+
+import argparse, os, resource, sys, timeit, tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from SavedJobsFetchers.LinkedInFetcherService import LinkedInFetcherService, HtmlParserBackend, getDefaultHtmlParserBackend
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "..", "Tests", "Fixtures")
+# Markup unrelated to the parsed subtrees, similar to the navigation, scripts and code blocks of real LinkedIn pages
+NOISE_BLOCK = ("<div class=\"scaffold-layout__aside\"><section class=\"artdeco-card\"><ul class=\"feed\">"
+               + "".join(f"<li class=\"feed-item t-14 t-normal\"><a href=\"/feed/{i}\">Post {i}</a><span>Liked by someone</span></li>"
+                         for i in range(20))
+               + "</ul></section><code style=\"display: none\">{\"data\":{\"entityUrn\":\"urn:li:fsd_profile:ABC\",\"$type\":\"com.linkedin\"}}</code></div>\n")
+
+def inflatePage(htmlPage: str, sizeInBytes: int) -> str:
+    """Insert noise markup before the main content to reach the requested page size.
+    """
+    mainIndex = htmlPage.index("<main")
+    noise = NOISE_BLOCK * max(0, (sizeInBytes - len(htmlPage)) // len(NOISE_BLOCK))
+    return htmlPage[:mainIndex] + noise + htmlPage[mainIndex:]
+
+def getPeakRSS() -> int:
+    # ru_maxrss is in bytes on macOS and in kB on Linux
+    peakRSS = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peakRSS if sys.platform == "darwin" else peakRSS * 1024
+
+def measure(htmlParser: HtmlParserBackend, useSoupStrainer: bool, method: str, page: str, repeat: int) -> tuple[float, int, int]:
+    """Measure a parse of the page, called in a fresh process.
+
+    Returns:
+        tuple[float, int, int]: parse time in seconds, Python heap peak and peak RSS growth in bytes
+    """
+    fetcherService = LinkedInFetcherService(username="", password="", cookiesFileDir="",
+                                            htmlParser=htmlParser, useSoupStrainer=useSoupStrainer)
+    parse = (lambda: fetcherService.parsePageForSavedJobs([], page)) if method == "parsePageForSavedJobs" \
+        else (lambda: fetcherService.parseJobPageDetails(page))
+    # The first parse is not traced, the traces of tracemalloc would add to the RSS
+    baselineRSS = getPeakRSS()
+    parse()
+    peakRSSGrowth = getPeakRSS() - baselineRSS
+    tracemalloc.start()
+    parse()
+    _, peakMemory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    parseTime = min(timeit.repeat(parse, number=1, repeat=repeat))
+    return parseTime, peakMemory, peakRSSGrowth
+
+def measureInFreshProcess(*args) -> tuple[float, int, int]:
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(measure, *args).result()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page_mb", type=float, default=3, help="Size of the inflated HTML pages in MB.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed repetitions.")
+    args = parser.parse_args()
+
+    pageSize = int(args.page_mb * 1024 * 1024)
+    with open(os.path.join(FIXTURES_DIR, "linkedin_saved_jobs.html"), "r") as f:
+        savedJobsPage = inflatePage(f.read(), pageSize)
+    with open(os.path.join(FIXTURES_DIR, "linkedin_job_details.html"), "r") as f:
+        jobDetailsPage = inflatePage(f.read(), pageSize)
+
+    parsers = [HtmlParserBackend.HTML_PARSER]
+    if getDefaultHtmlParserBackend() == HtmlParserBackend.LXML:
+        parsers.append(HtmlParserBackend.LXML)
+    print(f"Page size: {len(savedJobsPage) / 1024 / 1024:.2f} MB")
+    print("Py peak: Python heap peak traced by tracemalloc, without the C allocations of lxml. RSS peak: growth of the peak RSS.")
+    print(f"{'Parser':<12} {'Strainer':<9} {'Saved jobs [ms]':>16} {'Py peak [MB]':>13} {'RSS peak [MB]':>14}"
+          f" {'Job details [ms]':>17} {'Py peak [MB]':>13} {'RSS peak [MB]':>14}")
+    for htmlParser in parsers:
+        for useSoupStrainer in [False, True]:
+            savedJobsTime, savedJobsPeak, savedJobsRSS = measureInFreshProcess(htmlParser, useSoupStrainer, "parsePageForSavedJobs",
+                                                                                savedJobsPage, args.repeat)
+            jobDetailsTime, jobDetailsPeak, jobDetailsRSS = measureInFreshProcess(htmlParser, useSoupStrainer, "parseJobPageDetails",
+                                                                                    jobDetailsPage, args.repeat)
+            print(f"{htmlParser.value:<12} {str(useSoupStrainer):<9} {savedJobsTime * 1000:16.1f} {savedJobsPeak / 1024 / 1024:13.1f}"
+                  f" {savedJobsRSS / 1024 / 1024:14.1f} {jobDetailsTime * 1000:17.1f} {jobDetailsPeak / 1024 / 1024:13.1f}"
+                  f" {jobDetailsRSS / 1024 / 1024:14.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Benchmark of the cold and warm SkillsDatabase load times.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+# Example usage:
+#   python -m benchmarks.bench_SkillsDatabase [--skills=5000]
+#
+
+import argparse, json, os, random, tempfile, time
+
+from benchmarks.Generators import generateSkills
+from Utils.Skills.SkillsDatabase import SkillsDatabase
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skills", type=int, default=5000, help="Number of generated skills.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        skillsFile = os.path.join(directory, "skills.json")
+        with open(skillsFile, "w") as file:
+            json.dump(generateSkills(args.skills, random.Random(0)), file)
+        start = time.perf_counter()
+        with open(skillsFile, "r") as file:
+            json.load(file)
+        jsonTime = time.perf_counter() - start
+        coldDatabase = SkillsDatabase.load(skillsFile)
+        warmDatabase = SkillsDatabase.load(skillsFile)
+        assert warmDatabase.isLoadedFromSnapshot
+        print(f"Skills: {args.skills}, skills JSON: {os.path.getsize(skillsFile) / 1024:.0f} KB")
+        print(f"JSON parsing only:                 {jsonTime * 1000:10.2f} ms")
+        print(f"Cold load (parse, validate, compile): {coldDatabase.loadTime * 1000:7.2f} ms")
+        print(f"Warm load (compiled snapshot):     {warmDatabase.loadTime * 1000:10.2f} ms")
+
+if __name__ == "__main__":
+    main()
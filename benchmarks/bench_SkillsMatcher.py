@@ -0,0 +1,61 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Benchmark comparing the compiled SkillsMatcher with the per-skill isSkillInJobDescription loop.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+# Example usage:
+#   python -m benchmarks.bench_SkillsMatcher [--skills=400] [--description_kb=20] [--repeat=5]
+#
+
+import argparse, contextlib, os, random, timeit
+
+from benchmarks.Generators import generateSkills, generateJobDescription
+from Utils.Skills.SkillsMatcher import SkillsMatcher
+from updatecv import isSkillInJobDescription
+
+def scoreWithLoop(skills: dict, jobDetails: str) -> dict[str, list[int]]:
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return {skillSection: [isSkillInJobDescription(skill, jobDetails) for skill in sectionSkills]
+                for skillSection, sectionSkills in skills.items()}
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skills", type=int, default=400, help="Number of generated skills.")
+    parser.add_argument("--description_kb", type=int, default=20, help="Size of the generated job description in KB.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions.")
+    args = parser.parse_args()
+
+    randomGenerator = random.Random(0)
+    skills = generateSkills(args.skills, randomGenerator)
+    jobDetails = generateJobDescription(args.description_kb * 1024, randomGenerator)
+
+    compileTime = timeit.timeit(lambda: SkillsMatcher(skills), number=1)
+    matcher = SkillsMatcher(skills)
+    assert matcher.scoreSkills(jobDetails) == scoreWithLoop(skills, jobDetails), "Scores differ!"
+
+    loopTime = min(timeit.repeat(lambda: scoreWithLoop(skills, jobDetails), number=1, repeat=args.repeat))
+    matcherTime = min(timeit.repeat(lambda: matcher.scoreSkills(jobDetails), number=1, repeat=args.repeat))
+    print(f"Skills: {args.skills}, job description: {len(jobDetails)} B")
+    print(f"SkillsMatcher compile time:     {compileTime * 1000:10.2f} ms (once per skills.json)")
+    print(f"isSkillInJobDescription loop:   {loopTime * 1000:10.2f} ms per job")
+    print(f"SkillsMatcher.scoreSkills:      {matcherTime * 1000:10.2f} ms per job")
+    print(f"Speedup: {loopTime / matcherTime:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Startup time benchmark of the updatecv CLI, based on the -X importtime interpreter option.
+# Reports the cumulative import time of updatecv, the slowest imported modules and fails if the budget is exceeded.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+# Example usage:
+#   python -m benchmarks.bench_Startup [--repeat=5] [--top=10] [--budget_ms=150]
+#
+
+import argparse, os, re, statistics, subprocess, sys
+
+PROJECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+# import time: self [us] | cumulative [us] | indented module name
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+def measureImportTimes(module: str = "updatecv") -> dict[str, tuple[int, int]]:
+    """Import the module in a fresh interpreter.
+
+    Args:
+        module (str, optional): imported module. Defaults to "updatecv".
+
+    Returns:
+        dict[str, tuple[int, int]]: imported module -> self and cumulative import times in microseconds
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=PROJECT_DIR,
+                            capture_output=True, text=True, check=True)
+    importTimes = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:
+            importTimes[match[4]] = (int(match[1]), int(match[2]))
+    return importTimes
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="updatecv", help="Imported module.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measured interpreter starts.")
+    parser.add_argument("--top", type=int, default=10, help="Number of the slowest modules to list.")
+    parser.add_argument("--budget_ms", type=float, default=None, help="Fail if the median import time exceeds the budget.")
+    args = parser.parse_args()
+
+    runs = [measureImportTimes(args.module) for _ in range(args.repeat)]
+    medianTime = statistics.median(run[args.module][1] for run in runs) / 1000
+    print(f"{args.module} import time: {medianTime:.1f} ms (median of {args.repeat})")
+    print(f"{'Module':<60} {'Self [ms]':>10}")
+    lastRun = runs[-1]
+    for module, (selfTime, _) in sorted(lastRun.items(), key=lambda item: item[1][0], reverse=True)[:args.top]:
+        print(f"{module:<60} {selfTime / 1000:10.2f}")
+    if args.budget_ms is not None and medianTime > args.budget_ms:
+        print(f"Import time exceeds the budget of {args.budget_ms} ms!")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
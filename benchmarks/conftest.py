@@ -0,0 +1,85 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Benchmark fixtures. Uses pytest-benchmark if installed, a minimal timing fixture with the same call interface otherwise.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import importlib.util, logging, statistics, time, pytest
+
+from Utils.Logging.LogHandler import LOGGER_NAME
+
+# Fallback benchmark settings
+BENCH_FALLBACK_MAX_ROUNDS = 20
+BENCH_FALLBACK_MAX_TIME = 1.0
+
+@pytest.fixture(autouse=True)
+def quietLogging():
+    """Keep per-skill debug logging out of the measurements.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    level = logger.level
+    logger.setLevel(logging.WARNING)
+    yield
+    logger.setLevel(level)
+
+if importlib.util.find_spec("pytest_benchmark") is None:
+    fallbackResults = {}
+
+    class FallbackBenchmark:
+        """Subset of the pytest-benchmark fixture interface: benchmark(function, *args) and benchmark.pedantic(...).
+        """
+        def __init__(self, name: str):
+            self.name = name
+
+        def __call__(self, function, *args, **kwargs):
+            times = []
+            result = None
+            while len(times) < BENCH_FALLBACK_MAX_ROUNDS and sum(times) < BENCH_FALLBACK_MAX_TIME:
+                start = time.perf_counter()
+                result = function(*args, **kwargs)
+                times.append(time.perf_counter() - start)
+            fallbackResults[self.name] = times
+            return result
+
+        def pedantic(self, target, args: tuple = (), kwargs: dict = None, setup=None, rounds: int = 1, iterations: int = 1,
+                        warmup_rounds: int = 0):
+            times = []
+            result = None
+            for round in range(warmup_rounds + rounds):
+                if setup is not None:
+                    setup()
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    result = target(*args, **(kwargs or {}))
+                if round >= warmup_rounds:
+                    times.append((time.perf_counter() - start) / iterations)
+            fallbackResults[self.name] = times
+            return result
+
+    @pytest.fixture
+    def benchmark(request):
+        return FallbackBenchmark(request.node.name)
+
+    def pytest_terminal_summary(terminalreporter):
+        if not fallbackResults:
+            return
+        terminalreporter.section("benchmarks (pytest-benchmark not installed, fallback timer)")
+        terminalreporter.write_line(f"{'Name':<70} {'Min [ms]':>10} {'Mean [ms]':>10} {'Rounds':>7}")
+        for name, times in fallbackResults.items():
+            terminalreporter.write_line(f"{name:<70} {min(times) * 1000:10.3f} {statistics.mean(times) * 1000:10.3f} {len(times):7}")
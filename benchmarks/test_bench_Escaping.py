@@ -0,0 +1,39 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Benchmarks of the LaTeX and file system escaping of the job fields.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import random, pytest
+
+from benchmarks.Generators import BENCH_FULL, generateJobFields
+from Utils.Files.FileHandler import escapeFileSystemCharacters
+from Utils.Files.LaTeXHandler import escapeLatexCharacters
+
+@pytest.fixture(scope="module")
+def jobFields():
+    return generateJobFields(10000 if BENCH_FULL else 1000, random.Random(0))
+
+def test_bench_escapeLatexCharacters(benchmark, jobFields):
+    escapedFields = benchmark(lambda: [escapeLatexCharacters(field) for field in jobFields])
+    assert all(escapedField.count("\\&") == field.count("&") for field, escapedField in zip(jobFields, escapedFields))
+
+def test_bench_escapeFileSystemCharacters(benchmark, jobFields):
+    escapedFields = benchmark(lambda: [escapeFileSystemCharacters(field) for field in jobFields])
+    assert all(" " not in field and "/" not in field for field in escapedFields)
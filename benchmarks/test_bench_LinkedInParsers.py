@@ -0,0 +1,49 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Benchmarks of the LinkedIn saved jobs and job details parsers over the recorded HTML fixtures.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+
+import pytest
+
+from benchmarks.Generators import HTML_PAGE_SIZES_KB, LINKEDIN_SAVED_JOBS_FIXTURE, LINKEDIN_JOB_DETAILS_FIXTURE, loadFixture
+from benchmarks.bench_LinkedInParsers import inflatePage
+from SavedJobsFetchers.LinkedInFetcherService import LinkedInFetcherService, LINKEDIN_NO_JOB_DETAILS
+
+@pytest.fixture(scope="module")
+def fetcherService():
+    return LinkedInFetcherService(username="", password="", cookiesFileDir="")
+
+@pytest.fixture(scope="module", params=HTML_PAGE_SIZES_KB, ids=lambda sizeKB: f"{sizeKB}KB")
+def pageSize(request):
+    return request.param * 1024
+
+def test_bench_parsePageForSavedJobs(benchmark, fetcherService, pageSize):
+    htmlPage = inflatePage(loadFixture(LINKEDIN_SAVED_JOBS_FIXTURE), pageSize)
+    def parseSavedJobs() -> list:
+        savedJobs = []
+        fetcherService.parsePageForSavedJobs(savedJobs, htmlPage)
+        return savedJobs
+    savedJobs = benchmark(parseSavedJobs)
+    assert len(savedJobs) == 3
+
+def test_bench_parseJobPageDetails(benchmark, fetcherService, pageSize):
+    htmlPage = inflatePage(loadFixture(LINKEDIN_JOB_DETAILS_FIXTURE), pageSize)
+    details = benchmark(fetcherService.parseJobPageDetails, htmlPage)
+    assert details != LINKEDIN_NO_JOB_DETAILS
@@ -0,0 +1,51 @@
+# Auto CV Updater - automatize your CV modifications
+# Copyright (C) 2025  Mariusz Matusiak <mariusz.m.matusiak@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Benchmarks of the skills scoring and the skills LaTeX file update over synthetic skills libraries and job descriptions.
+#
+# Version 1.0, 2026-10-17 - The initial version.
+#
+# Example usage:
+#   python -m pytest benchmarks [BENCH_FULL=1 for 10-10k skills and 1-100 KB descriptions]
+#
+
+import os, random, pytest
+
+from benchmarks.Generators import SKILLS_COUNTS, DESCRIPTION_SIZES_KB, generateJobDescription, writeSkillsFile
+from updatecv import isSkillInJobDescription, updateJobSkills
+
+@pytest.fixture(scope="module", params=SKILLS_COUNTS, ids=lambda skillsCount: f"{skillsCount}skills")
+def skillsLibrary(request, tmp_path_factory):
+    skillsFile = str(tmp_path_factory.mktemp("skills") / "skills.json")
+    skills = writeSkillsFile(skillsFile, request.param)
+    return skillsFile, skills
+
+@pytest.fixture(scope="module", params=DESCRIPTION_SIZES_KB, ids=lambda sizeKB: f"{sizeKB}KB")
+def jobDescription(request):
+    return generateJobDescription(request.param * 1024, random.Random(request.param))
+
+def test_bench_isSkillInJobDescription(benchmark, skillsLibrary, jobDescription):
+    _, skills = skillsLibrary
+    allSkills = [skill for sectionSkills in skills.values() for skill in sectionSkills]
+    scores = benchmark(lambda: [isSkillInJobDescription(skill, jobDescription) for skill in allSkills])
+    assert len(scores) == len(allSkills)
+
+def test_bench_updateJobSkills(benchmark, skillsLibrary, jobDescription, tmp_path):
+    skillsFile, skills = skillsLibrary
+    skillsLatexFile = str(tmp_path / "04_skills.tex")
+    benchmark(updateJobSkills, jobDescription, skillsFile, skillsLatexFile)
+    assert os.path.getsize(skillsLatexFile) > 0
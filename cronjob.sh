@@ -21,6 +21,7 @@
 # 0 22 * * * /path/to/the/cloned/auto_cv_repo/cronjob.sh
 #
 # Version 1.0, 2025-03-27 - The initial version, contains CLI and LinkedIn support. 
+# Version 1.1, 2026-10-17 - The second run resumes the failed run only, syncs are triggered in the sync daemon if running.
 #
 
 echo "==== Auto CV Updater job started ===="
@@ -28,16 +29,25 @@ echo "==== Auto CV Updater job started ===="
 # Provide the path to your Python executable here:
 alias python="/opt/homebrew/bin/python3.11"
 timestamp=`date "+%Y%m%d_%H%M%S"`
-auto_cv_updater_dir=$(dirname $0)
+auto_cv_updater_dir=$(cd "$(dirname "$0")" && pwd)
 # A default path for logs
 logfile="${auto_cv_updater_dir}/Logs/updatecv_log_${timestamp}.txt"
 # Define extra arguments for updatecv.py, e.g. -s to sync with pages
-extra_arguments="-s -env=${auto_cv_updater_dir}/user_cfg.env -sj=${auto_cv_updater_dir}/User/skills_user.json -lc=${auto_cv_updater_dir}/User/linkedin_cookies_user.json"
+# Structured JSON lines logs go to a size-capped, rotated log file, the console output only contains INFO messages
+# The run journal, the jobs store and the build cache are kept in the repository, cron runs in another working directory
+# With -tg the sync runs in the sync daemon (updatecv.py --daemon) if it is listening on the -ds socket, locally otherwise
+extra_arguments="-s -env=${auto_cv_updater_dir}/user_cfg.env -sj=${auto_cv_updater_dir}/User/skills_user.json -lc=${auto_cv_updater_dir}/User/linkedin_cookies_user.json -lf=${auto_cv_updater_dir}/Logs/updatecv.log -tg -ds=${auto_cv_updater_dir}/.cache/updatecv.sock -rj=${auto_cv_updater_dir}/.cache/run_journal.jsonl -js=${auto_cv_updater_dir}/.cache/jobs_store.sqlite3 -bc=${auto_cv_updater_dir}/.cache/builds"
 
 echo "Executing python ${auto_cv_updater_dir}/updatecv.py ${extra_arguments}..." 2>&1 | tee ${logfile}
-python ${auto_cv_updater_dir}/updatecv.py ${extra_arguments} 2>&1 | tee -a ${logfile}
+# The exit status is kept in a file, as the pipe returns the status of tee
+status_file="${auto_cv_updater_dir}/Logs/.updatecv_status"
+{ python ${auto_cv_updater_dir}/updatecv.py ${extra_arguments} 2>&1; echo $? > ${status_file}; } | tee -a ${logfile}
 # If above execution fails try for the second time (safari webdriver error: https://github.com/SeleniumHQ/selenium/issues/15160)
-echo Trying for the second time... | tee -a ${logfile}
-python ${auto_cv_updater_dir}/updatecv.py ${extra_arguments} 2>&1 | tee -a ${logfile}
+# The retry resumes the run from its journal, only the jobs not fetched or built yet are processed
+if [ "$(cat ${status_file})" != "0" ]; then
+    echo Trying for the second time... | tee -a ${logfile}
+    python ${auto_cv_updater_dir}/updatecv.py ${extra_arguments} --resume 2>&1 | tee -a ${logfile}
+fi
+rm -f ${status_file}
 
 echo "==== Auto CV Updater job finished ===="
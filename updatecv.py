@@ -24,18 +24,27 @@
 #   py -3 updatecv.py [-c=CompanyName] [-j=DSP Senior Engineer] [-l=Boston, MA] [-v=y] [-p=embedded] [-s]
 #
 
-import os, argparse, re, subprocess, time
+import os, sys, argparse, logging, subprocess, time
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from dotenv import load_dotenv
-from SavedJobsFetchers.LinkedInFetcherService import LinkedInFetcherService
+# Portal fetchers and their dependencies, the jobs store (sqlite3) and the skills database (pickle) are imported only when used
 from SavedJobsFetchers.IJobsFetcherService import *
+from SavedJobsFetchers.FetcherRegistry import createFetcher, getFetcherNames, FETCHERS_DEFAULT, FETCH_DEFAULT_TIMEOUT_SECONDS
 from Utils.Files.FileHandler import *
 from Utils.Files.LaTeXHandler import *
+from Utils.Skills.SkillsMatcher import *
+from Utils.Skills.SkillsRenderer import renderSkillsLatex
+from Utils.Logging.LogHandler import *
+from CVBuilders.BuildWorkspace import BuildWorkspace, snapshotPDFs, findBuiltPDFs
+from CVBuilders.BuildCache import *
+from Utils.Pipeline.JobsDeduplicator import deduplicateJobs, DEDUP_DEFAULT_MAX_DISTANCE
+from Utils.Pipeline.RunJournal import *
+from Utils.Metrics.Instrumentation import *
 
-SCORE_MULTIPLIER_SKILL_MENTIONED = 5
-SCORE_MULTIPLIER_SKILL_ALIAS_MENTIONED = 4
-SCORE_MULTIPLIER_SKILL_AREA_MENTIONED = 1
+logger = getLogger("updatecv")
 
 class LaTeXResumeFields(Enum):
     """Enum class of user-defined LaTeX commands to provide job-specific information.
@@ -63,97 +72,388 @@ def main():
     parser.add_argument("-env", "--environment", help="Specify the path to the user .env file.", required=False, default=".env")
     parser.add_argument("-rf",  "--recipient_file", help="Specify the name of the LaTeX CV recipient file in the CV-Templates/data/ directory to be used.", required=False, default="12_recipients.tex")
     parser.add_argument("-sf",  "--skills_file", help="Specify the name of the LaTeX CV skills file in the CV-Templates/data/ directory to be used.", required=False, default="04_skills.tex")
+    parser.add_argument("-sps", "--skills_per_section", help="Specify the maximum number of the highest scored skills in each section.", required=False, type=int, default=None)
     parser.add_argument("-sj",  "--skills_json", help="Specify the path to the JSON skills file to be used.", required=False, default=os.path.join("User", "skills.json"))
+    parser.add_argument("-fp",  "--fetcher", dest="fetchers", help="Specify the job portal(s) to sync the saved jobs from. Defaults to LinkedIn.", required=False, action="append", choices=getFetcherNames())
     parser.add_argument("-lc",  "--linkedin_cookies", help="Specify the path to the JSON file with LinkedIn authentication cookies.", required=False, default=os.path.join("User", "linkedin_cookies.json"))
+    parser.add_argument("-js",  "--jobs_store", help="Specify the path to the SQLite store of fetched jobs. Use an empty value to fetch all job details on every sync.", required=False, default=os.path.join(".cache", "jobs_store.sqlite3"))
+    parser.add_argument("-jsa", "--jobs_store_max_age", help="Specify the age in hours after which stored job details are fetched again.", required=False, type=float, default=JOBS_STORE_DEFAULT_MAX_AGE_HOURS)
+    parser.add_argument("-fc",  "--fetch_concurrency", help="Specify the number of concurrent HTTP sessions fetching job details. Defaults to 1 (WebDriver only).", required=False, type=int, default=1)
+    parser.add_argument("-ft",  "--fetch_timeout", help="Specify the maximum time in seconds to wait for the saved jobs of each job portal.", required=False, type=float, default=FETCH_DEFAULT_TIMEOUT_SECONDS)
+    parser.add_argument("-bc",  "--build_cache", help="Specify the build cache directory. Use an empty value to disable the cache.", required=False, default=os.path.join(".cache", "builds"))
+    parser.add_argument("-bcs", "--build_cache_max_size", help="Specify the maximum size of the build cache in MB.", required=False, type=int, default=BUILD_CACHE_DEFAULT_MAX_SIZE_MB)
+    parser.add_argument("-bca", "--build_cache_max_age", help="Specify the maximum age of unused build cache entries in days.", required=False, type=int, default=BUILD_CACHE_DEFAULT_MAX_AGE_DAYS)
+    parser.add_argument("-fr",  "--force-rebuild", dest="force_rebuild", help="Rebuild all CVs, ignoring the build cache.", required=False, action="store_true")
+    parser.add_argument("-ll",  "--log_level", help="Specify the logging level, DEBUG includes the skill scores of each rendered CV.", required=False, default=LOG_DEFAULT_LEVEL, choices=LOG_LEVELS, type=str.upper)
+    parser.add_argument("-lf",  "--log_file", help="Specify the path to the JSON lines log file, rotated by size.", required=False, default=None)
+    parser.add_argument("-lfs", "--log_file_max_size", help="Specify the maximum size of the log file in MB before rotation.", required=False, type=float, default=LOG_DEFAULT_MAX_SIZE_MB)
+    parser.add_argument("-pr",  "--profile", help="Profile the parsing and scoring hot paths with cProfile and write the stats to the given file.", required=False, nargs="?", const="updatecv.prof", default=None)
+    parser.add_argument("-rp",  "--run_report", help="Specify the path to the JSON run report with per-stage and per-job timings.", required=False, default=None)
+    parser.add_argument("-dd",  "--dedup_max_distance", help="Specify the maximum SimHash distance of the details of near-duplicate jobs at the same company, built only once. Use -1 to skip only the exact duplicates.", required=False, type=int, default=DEDUP_DEFAULT_MAX_DISTANCE)
+    parser.add_argument("-ec",  "--export_csv", help="Specify the path to the CSV file with the fetched jobs and their skill scores, one column per skill.", required=False, default=None)
+    parser.add_argument("-rj",  "--run_journal", help="Specify the path to the JSON lines journal of the completed job stages. Use an empty value to disable the journal.", required=False, default=os.path.join(".cache", "run_journal.jsonl"))
+    parser.add_argument("-rs",  "--resume", help="Resume the last run from its journal, only the jobs not built yet are processed.", required=False, action="store_true")
+    parser.add_argument("-wd",  "--webdriver", help="Specify the browser driven by the WebDriver.", required=False, default="safari", choices=WEBDRIVER_NAMES)
+    parser.add_argument("-hl",  "--headless", help="Run the browser without a window, e.g. on a Linux server. Not supported by Safari.", required=False, action="store_true")
+    parser.add_argument("-dm",  "--daemon", help="Run as a sync daemon keeping the authenticated browser session and the skills index between the syncs triggered over its Unix socket.", required=False, action="store_true")
+    parser.add_argument("-tg",  "--trigger", help="Trigger a sync in the running sync daemon, run it locally if no daemon is listening.", required=False, action="store_true")
+    parser.add_argument("-ds",  "--daemon_socket", help="Specify the path to the Unix socket of the sync daemon.", required=False, default=os.path.join(".cache", "updatecv.sock"))
+    parser.add_argument("-dhi", "--daemon_health_interval", help="Specify the time in seconds between the health checks of the daemon browser sessions.", required=False, type=float, default=300)
+    parser.add_argument("-st",  "--stream", help="Build the CVs while the saved jobs are still being fetched, use with -s.", required=False, action="store_true")
+    parser.add_argument("-bj",  "--build_jobs", help="Specify the number of CVs built in parallel, each in its own workspace. Defaults to 1 (serial build in CV_DIR).", required=False, type=int, default=1)
+    parser.add_argument("-bs",  "--build_server", help="Build the CVs on resident LaTeX workers sharing a precompiled preamble, -bj sets the number of workers.", required=False, action="store_true")
     args = parser.parse_args()
+    setupLogging(args.log_level, args.log_file, args.log_file_max_size)
     load_dotenv(args.environment)
+    if args.profile:
+        instrumentation.enableProfiling()
+    isCompleted = False
+    try:
+        if args.daemon:
+            isCompleted = runSyncDaemon(args)
+        else:
+            isCompleted = triggerDaemonSync(args) if args.trigger else None
+            if isCompleted is None:
+                isCompleted = updateCVs(args)
+    finally:
+        if args.profile:
+            instrumentation.dumpProfile(args.profile)
+            logger.info(f"Profile written to {args.profile}.")
+        if args.run_report:
+            instrumentation.writeReport(args.run_report)
+            logger.info(f"Run report written to {args.run_report}.")
+    if not isCompleted:
+        # Lets cronjob.sh retry the run with --resume
+        sys.exit(1)
 
+def updateCVs(args, fetchers: list["IAsyncJobsFetcherService"]=None, jobsStore: "JobsStore"=None) -> bool:
+    """Update and build the CVs of the saved jobs or of the job given by the arguments.
+
+    Args:
+        args: parsed command line arguments
+        fetchers (list[IAsyncJobsFetcherService], optional): portal fetchers kept between the runs. Defaults to the fetchers configured by the arguments.
+        jobsStore (JobsStore, optional): jobs store kept open between the runs. Defaults to the jobs store opened by the arguments.
+
+    Returns:
+        bool: True if all jobs were fetched and built
+    """
     cv_dir = os.path.join(os.getenv("CV_DIR"))
     recipients_latex_file = os.path.join(cv_dir, "data", args.recipient_file)
     skills_latex_file = os.path.join(cv_dir, "data", args.skills_file)
     skills_json_file = args.skills_json
+    buildCache = BuildCache(args.build_cache, args.build_cache_max_size, args.build_cache_max_age) if args.build_cache else None
+
+    with ExitStack() as resources:
+        # Only the syncs are journaled, a single job run must not replace the journal of an interrupted sync
+        if args.run_journal and args.sync:
+            resources.enter_context(runJournal.open(args.run_journal, args.resume, computeSkillsDigest(skills_json_file)))
+        else:
+            runJournal.reset()
+        if args.resume and runJournal.isRunCompleted:
+            logger.info("The last run was completed, nothing to resume.")
+            return True
+        # The jobs store stays open for the whole run, it serves the details of the jobs not kept in memory
+        if jobsStore is None and args.sync and args.jobs_store:
+            from SavedJobsFetchers.JobsStore import JobsStore
+            jobsStore = resources.enter_context(JobsStore(args.jobs_store))
+        jobsCsvWriter = None
+        if args.export_csv:
+            from Utils.Files.JobsExporter import JobsCsvWriter
+            jobsCsvWriter = resources.enter_context(JobsCsvWriter(args.export_csv, getSkillsMatcher(skills_json_file)))
+        buildServer = None
+        if args.build_server:
+            from CVBuilders.LaTeXBuildServer import LaTeXBuildServer
+            buildServer = resources.enter_context(LaTeXBuildServer(
+                cv_dir, [os.path.join("data", args.recipient_file), os.path.join("data", args.skills_file)], workers=args.build_jobs))
+        isResumedFetch = args.resume and runJournal.isFetchCompleted
+        if args.sync and args.stream and not isResumedFetch:
+            streamMySavedJobs(args, cv_dir, buildCache, fetchers, jobsStore, jobsCsvWriter, buildServer)
+            return runJournal.isRunCompleted
+        failedPortals = []
+        if isResumedFetch:
+            savedJobs = runJournal.getFetchedJobs(jobsStore)
+            logger.info(f"Resuming the last run with its {len(savedJobs)} fetched job(s).")
+        elif args.sync:
+            savedJobs = checkMySavedJobs(args, fetchers, jobsStore, failedPortals)
+        else:
+            savedJobs = [
+                Job(
+                    company=args.company, 
+                    job=args.job,
+                    location=args.location,
+                    url=args.url,
+                    details=args.details,
+                    letterAddress=args.letterAddress, 
+                    letterRecipient=args.letterRecipient, 
+                    isVisaRequired=args.isVisaRequired)
+            ]
+        if not isResumedFetch:
+            for job in savedJobs:
+                runJournal.recordFetched(job, jobsStore, sync=False)
+            runJournal.sync()
+            if not failedPortals:
+                runJournal.recordRun(JOURNAL_STAGE_FETCH_COMPLETED)
+        savedJobs, collapsedJobs = deduplicateJobs(savedJobs, args.dedup_max_distance)
+        skillScoreMatrix = scoreJournaledJobs(savedJobs, skills_json_file)
+        if jobsCsvWriter is not None:
+            for job, skillScores in zip(savedJobs, skillScoreMatrix):
+                jobsCsvWriter.writeJob(job, skillScores)
+        # PDFs built by the resumed run are reused
+        builtPDFs = [runJournal.getBuiltPDFs(job) for job in savedJobs]
+        pendingJobs = [(i, job, skillScores) for i, (job, skillScores, pdfs) in enumerate(zip(savedJobs, skillScoreMatrix, builtPDFs))
+                        if pdfs is None]
+        if len(pendingJobs) < len(savedJobs):
+            logger.info(f"Skipping {len(savedJobs) - len(pendingJobs)} job(s) built by the last run.")
+        pendingIndices, pendingSavedJobs, pendingSkillScoreMatrix = zip(*pendingJobs) if pendingJobs else ((), (), ())
+        if args.build_jobs > 1 or buildServer is not None:
+            pendingPDFs = rebuildCVsInParallel(pendingSavedJobs, pendingSkillScoreMatrix, cv_dir, args.recipient_file, args.skills_file,
+                                                skills_json_file, max(1, args.build_jobs), buildCache, args.force_rebuild,
+                                                args.skills_per_section, buildServer)
+        else:
+            pendingPDFs = [rebuildCV(job, skillScores, cv_dir, recipients_latex_file, skills_latex_file, skills_json_file, buildCache,
+                                        args.force_rebuild, args.skills_per_section)
+                            for job, skillScores in zip(pendingSavedJobs, pendingSkillScoreMatrix)]
+        for i, pdfs in zip(pendingIndices, pendingPDFs):
+            builtPDFs[i] = pdfs
+        reportCollapsedJobs(collapsedJobs, list(zip(savedJobs, builtPDFs)))
+        return completeRun(builtPDFs)
+
+def runSyncDaemon(args) -> bool:
+    """Run the sync daemon until it is stopped. The fetchers, the jobs store and the skills index stay warm between the syncs.
+
+    Returns:
+        bool: True when stopped
+    """
+    from Services.SyncDaemon import SyncDaemon
+    from SavedJobsFetchers.JobsStore import JobsStore
+    from Utils.Skills.SkillsDatabase import getSkillsDatabase
+    args.sync = True
+    with ExitStack() as resources:
+        jobsStore = resources.enter_context(JobsStore(args.jobs_store)) if args.jobs_store else None
+        fetchers = getConfiguredFetchers(args, jobsStore)
+        getSkillsDatabase(args.skills_json)
+
+        def runSync(resume: bool) -> bool:
+            # Every sync gets its own run report
+            instrumentation.reset()
+            try:
+                return updateCVs(argparse.Namespace(**{**vars(args), "resume": resume}), fetchers, jobsStore)
+            finally:
+                if args.run_report:
+                    instrumentation.writeReport(args.run_report)
+
+        SyncDaemon(args.daemon_socket, runSync, fetchers, args.daemon_health_interval).serve()
+    return True
+
+def triggerDaemonSync(args) -> bool:
+    """Request a sync from the sync daemon and wait for it to finish.
+
+    Returns:
+        bool: True if the sync was completed, None if no daemon is listening
+    """
+    from Services.SyncDaemon import sendDaemonRequest, DAEMON_COMMAND_SYNC, DAEMON_STATUS_COMPLETED
+    try:
+        response = sendDaemonRequest(args.daemon_socket, {"command": DAEMON_COMMAND_SYNC, "resume": args.resume})
+    except OSError:
+        logger.info(f"No sync daemon listening on {args.daemon_socket}, running the sync locally.")
+        return None
+    logger.info(f"Sync daemon finished the sync with the {response['status']} status"
+                + (f": {response['error']}" if "error" in response else "."))
+    return response["status"] == DAEMON_STATUS_COMPLETED
+
+def rebuildCV(job: Job, skillScores: list[int], cv_dir: str, recipients_latex_file: str, skills_latex_file: str, skills_json_file: str,
+                buildCache: BuildCache=None, forceRebuild: bool=False, maxSkillsPerSection: int=None) -> list[str]:
+    startTime = time.perf_counter()
+    logger.info(f"===== Updating CV for {job.job} at {job.company} in {job.location}. =====")
+    # Offloaded details are read from the jobs store on access, only when they are logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Details: {job.details}\n\n{job.url}")
+    recipients = updateCVFiles(job, recipients_latex_file, skills_latex_file, skills_json_file, skillScores, maxSkillsPerSection)
+    logger.info("Rebuilding CVs...")
+    builtPDFs = rebuildCVs(cv_dir, recipients_latex_file, skills_latex_file, buildCache, forceRebuild, recipients=recipients,
+                            jobLabel=job.label)
+    logJobProcessed(job, skillScores, builtPDFs, time.perf_counter() - startTime)
+    return builtPDFs
+
+def checkMySavedJobs(args, fetchers: list["IAsyncJobsFetcherService"]=None, jobsStore: "JobsStore"=None,
+                        failedPortals: list[str]=None) -> list[Job]:
+    """Fetch the saved jobs from all configured job portals concurrently.
+
+    Args:
+        args: parsed command line arguments
+        fetchers (list[IAsyncJobsFetcherService], optional): portal fetchers. Defaults to the fetchers configured by the arguments.
+        jobsStore (JobsStore, optional): store of the fetched jobs used by the configured fetchers. Defaults to None.
+        failedPortals (list[str], optional): names of the failed or timed out portals are appended to it. Defaults to None.
+
+    Returns:
+        list[Job]: saved jobs of all portals, without duplicates
+    """
+    if fetchers is None:
+        fetchers = getConfiguredFetchers(args, jobsStore)
+    logger.info(f"Getting My Saved Jobs from {', '.join(fetcher.name for fetcher in fetchers)}...")
+    import asyncio
+    from SavedJobsFetchers.MultiPortalFetcher import fetchAllSavedJobs
+    return asyncio.run(fetchAllSavedJobs(fetchers, args.fetch_timeout, failedPortals))
+
+def streamMySavedJobs(args, cv_dir: str, buildCache: BuildCache=None, fetchers: list["IAsyncJobsFetcherService"]=None,
+                        jobsStore: "JobsStore"=None, jobsCsvWriter: "JobsCsvWriter"=None,
+                        buildServer: "LaTeXBuildServer"=None) -> list[tuple[Job, list[str]]]:
+    """Score the saved jobs and build their CVs while the job portals are still being fetched.
+    Every fetcher yields the jobs as soon as their details are parsed, the jobs are passed to the builds through a bounded queue.
+
+    Args:
+        args: parsed command line arguments
+        cv_dir (str): path to the CV Templates directory
+        buildCache (BuildCache, optional): cache of the built PDFs. Defaults to None.
+        fetchers (list[IAsyncJobsFetcherService], optional): portal fetchers. Defaults to the fetchers configured by the arguments.
+        jobsStore (JobsStore, optional): store of the fetched jobs used by the configured fetchers. Defaults to None.
+        jobsCsvWriter (JobsCsvWriter, optional): export of the jobs and their skill scores. Defaults to None.
+        buildServer (LaTeXBuildServer, optional): warm build server used instead of gmake runs in CV_DIR. Defaults to None.
+
+    Returns:
+        list[tuple[Job, list[str]]]: processed jobs and the paths of their PDF files, in the completion order
+    """
+    if fetchers is None:
+        fetchers = getConfiguredFetchers(args, jobsStore)
+    logger.info(f"Streaming My Saved Jobs from {', '.join(fetcher.name for fetcher in fetchers)}...")
+
+    def processJob(job: Job) -> list[str]:
+        builtPDFs = runJournal.getBuiltPDFs(job)
+        if builtPDFs is not None:
+            logger.info(f"Skipping {job.job} at {job.company}, built by the last run.")
+            return builtPDFs
+        runJournal.recordFetched(job, jobsStore)
+        skillScores = scoreJournaledJobs([job], args.skills_json)[0]
+        if jobsCsvWriter is not None:
+            jobsCsvWriter.writeJob(job, skillScores)
+        if buildServer is not None:
+            return rebuildCVOnServer(job, skillScores, buildServer, cv_dir, args.recipient_file, args.skills_file, args.skills_json,
+                                        buildCache, args.force_rebuild, args.skills_per_section)
+        if args.build_jobs > 1:
+            return rebuildCVInWorkspace(job, skillScores, cv_dir, args.recipient_file, args.skills_file, args.skills_json,
+                                        buildCache, args.force_rebuild, args.skills_per_section)
+        return rebuildCV(job, skillScores, cv_dir, os.path.join(cv_dir, "data", args.recipient_file),
+                            os.path.join(cv_dir, "data", args.skills_file), args.skills_json, buildCache, args.force_rebuild,
+                            args.skills_per_section)
+
+    from Utils.Pipeline.JobsPipeline import JobsPipeline
+    pipeline = JobsPipeline(processJob, consumers=args.build_jobs, dedupMaxDistance=args.dedup_max_distance)
+    results = pipeline.run({fetcher.name: fetcher.iterSavedJobs() for fetcher in fetchers},
+                            {fetcher.name: fetcher.timeout if fetcher.timeout is not None else args.fetch_timeout for fetcher in fetchers})
+    reportCollapsedJobs(pipeline.collapsedJobs, results)
+    if not pipeline.failedProducers:
+        runJournal.recordRun(JOURNAL_STAGE_FETCH_COMPLETED)
+    completeRun([pdfs for _, pdfs in results] + [[] for _ in pipeline.failedJobs])
+    return results
+
+def getConfiguredFetchers(args, jobsStore: "JobsStore"=None) -> list["IAsyncJobsFetcherService"]:
+    from SavedJobsFetchers.IAsyncJobsFetcherService import SyncJobsFetcherAdapter
+    return [SyncJobsFetcherAdapter(createFetcher(name, args, jobsStore), name=name) for name in args.fetchers or FETCHERS_DEFAULT]
+
+def scoreSavedJobs(savedJobs: list[Job], skills_json_file: str) -> list[list[int]]:
+    """Score all skills for all jobs at once.
+
+    Args:
+        savedJobs (list[Job]): jobs to score
+        skills_json_file (str): path to the JSON skills file
+
+    Returns:
+        list[list[int]]: jobs x skills score matrix, None rows for jobs without details
+    """
+    # Details of the offloaded jobs are loaded one at a time
+    hasDetails = [bool(job.details) for job in savedJobs]
+    # Jobs without details, e.g. a single job run without -d, do not need the skills database
+    matcher = getSkillsMatcher(skills_json_file) if any(hasDetails) else None
+    if matcher is None:
+        return [None] * len(savedJobs)
+    with instrumentation.timer(STAGE_SCORING), instrumentation.profiled():
+        scoreRows = iter(matcher.scoreJobs(job.details for job, jobHasDetails in zip(savedJobs, hasDetails) if jobHasDetails))
+        return [next(scoreRows) if jobHasDetails else None for jobHasDetails in hasDetails]
+
+def scoreJournaledJobs(savedJobs: list[Job], skills_json_file: str) -> list[list[int]]:
+    """Score the saved jobs, reusing the skill scores recorded by the resumed run.
 
-    if args.sync:
-        savedJobs = checkMySavedJobs(args)
+    Returns:
+        list[list[int]]: jobs x skills score matrix
+    """
+    skillScoreMatrix = [runJournal.getSkillScores(job) for job in savedJobs]
+    unscoredJobs = [job for job, skillScores in zip(savedJobs, skillScoreMatrix) if skillScores is None]
+    scores = iter(scoreSavedJobs(unscoredJobs, skills_json_file) if unscoredJobs else [])
+    for i, skillScores in enumerate(skillScoreMatrix):
+        if skillScores is None:
+            skillScoreMatrix[i] = next(scores)
+            runJournal.record(savedJobs[i], JOURNAL_STAGE_SCORED, sync=False, skillScores=skillScoreMatrix[i])
+    runJournal.sync()
+    return skillScoreMatrix
+
+def completeRun(builtPDFs: list[list[str]]) -> bool:
+    """Mark the run as completed in the run journal if all jobs were fetched and built.
+
+    Args:
+        builtPDFs (list[list[str]]): paths of the PDF files built for each job
+
+    Returns:
+        bool: True if the run was completed
+    """
+    isCompleted = runJournal.isFetchCompleted and all(builtPDFs)
+    if isCompleted:
+        runJournal.recordRun(JOURNAL_STAGE_RUN_COMPLETED)
     else:
-        savedJobs = [
-            Job(
-                company=args.company, 
-                job=args.job,
-                location=args.location,
-                url=args.url,
-                details=args.details,
-                letterAddress=args.letterAddress, 
-                letterRecipient=args.letterRecipient, 
-                isVisaRequired=args.isVisaRequired)
-        ]
-    for job in savedJobs:
-        print(f"===== Updating CV for {job.job} at {job.company} in {job.location}. =====\nDetails: {job.details}\n\n{job.url}")
-        updateCVFiles(job, recipients_latex_file, skills_latex_file, skills_json_file)
-        print("Rebuilding CVs...")
-        time.sleep(3)
-        rebuildCVs(cv_dir, recipients_latex_file)
-
-def checkMySavedJobs(args) -> list[Job]:
-    savedJobs = []
-    print("Getting My Saved Jobs from LinkedIn...\n")
-    fetcherService = LinkedInFetcherService(
-        username=os.getenv("LIN_LOGIN"),
-        password=os.getenv("LIN_KEY"),
-        cookiesFileDir=args.linkedin_cookies)
-    savedJobs.extend(fetcherService.getSavedJobs())
-    # TODO Add other services if needed like Indeed, pracuj.pl, etc.
-    return savedJobs
-
-def updateCVFiles(job: Job, recipients_latex_file: str, skills_latex_file: str, skills_json_file: str):
+        logger.warning(f"Run not completed, {sum(not pdfs for pdfs in builtPDFs)} job(s) not built"
+                        + ("." if runJournal.isFetchCompleted else " and not all saved jobs fetched.") + " Use --resume to retry.")
+    return isCompleted
+
+def updateCVFiles(job: Job, recipients_latex_file: str, skills_latex_file: str, skills_json_file: str, skillScores: list[int]=None,
+                    maxSkillsPerSection: int=None) -> LaTeXCommandsDocument:
+    with instrumentation.timer(STAGE_FILE_WRITES, job.label):
+        recipients = writeCVFiles(job, recipients_latex_file, skills_latex_file, skills_json_file, skillScores, maxSkillsPerSection)
+    runJournal.record(job, JOURNAL_STAGE_RENDERED)
+    return recipients
+
+def writeCVFiles(job: Job, recipients_latex_file: str, skills_latex_file: str, skills_json_file: str, skillScores: list[int]=None,
+                    maxSkillsPerSection: int=None) -> LaTeXCommandsDocument:
+    recipients = LaTeXCommandsDocument(recipients_latex_file)
+    updateRecipientFields(job, recipients)
+    # Single atomic write of all recipient fields
+    recipients.save()
+
+    if job.details:
+        logger.debug("LaTeX -> Highlighting skills according to the job details.")
+        updateJobSkills(job.details, skills_json_file, skills_latex_file, skillScores, maxSkillsPerSection)
+    return recipients
+
+def updateRecipientFields(job: Job, recipients: LaTeXCommandsDocument):
     if job.company:
-        print(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_COMPANY.value} to {job.company}.")
-        updateField(LaTeXResumeFields.POSITION_COMPANY, job.company, recipients_latex_file)
+        logger.debug(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_COMPANY.value} to {job.company}.")
+        recipients.updateField(LaTeXResumeFields.POSITION_COMPANY, job.company)
 
     if job.job:
-        print(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_NAME.value} to {job.job}.")
-        updateField(LaTeXResumeFields.POSITION_NAME, job.job, recipients_latex_file)
+        logger.debug(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_NAME.value} to {job.job}.")
+        recipients.updateField(LaTeXResumeFields.POSITION_NAME, job.job)
 
     if job.location:
-        print(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_LOCATION.value} to {job.location}.")
-        updateField(LaTeXResumeFields.POSITION_LOCATION, job.location, recipients_latex_file)
+        logger.debug(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_LOCATION.value} to {job.location}.")
+        recipients.updateField(LaTeXResumeFields.POSITION_LOCATION, job.location)
 
     if job.isVisaRequired:
-        print(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_VISA.value} to {job.isVisaRequired}.")
-        updateField(LaTeXResumeFields.POSITION_VISA, job.isVisaRequired, recipients_latex_file)
+        logger.debug(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_VISA.value} to {job.isVisaRequired}.")
+        recipients.updateField(LaTeXResumeFields.POSITION_VISA, job.isVisaRequired)
 
     if job.letterRecipient:
-        print(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_LETTER_RECIPIENT.value} to {job.letterRecipient}.")
-        updateField(LaTeXResumeFields.POSITION_LETTER_RECIPIENT, job.letterRecipient, recipients_latex_file)
+        logger.debug(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_LETTER_RECIPIENT.value} to {job.letterRecipient}.")
+        recipients.updateField(LaTeXResumeFields.POSITION_LETTER_RECIPIENT, job.letterRecipient)
 
     if job.letterAddress:
-        print(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_LETTER_ADDRESS.value} to {job.letterAddress}.")
-        updateField(LaTeXResumeFields.POSITION_LETTER_ADDRESS, job.letterAddress, recipients_latex_file)
-
-    if job.details:
-        print("LaTeX -> Highlighting skills according to the job details.")
-        updateJobSkills(job.details, skills_json_file, skills_latex_file)
+        logger.debug(f"LaTeX -> Seting {LaTeXResumeFields.POSITION_LETTER_ADDRESS.value} to {job.letterAddress}.")
+        recipients.updateField(LaTeXResumeFields.POSITION_LETTER_ADDRESS, job.letterAddress)
 
 def getField(field: LaTeXResumeFields, latex_file: str):
-    result = ""
-    fileContent = readFile(latex_file)
-    pattern = re.compile(field.value + "{(.*)}")
-    match = pattern.search(fileContent)
-    if match:
-        result = match[1]
-    return result
+    return LaTeXCommandsDocument(latex_file).getField(field)
 
 def updateField(field: LaTeXResumeFields, argument: str, in_file: str, out_file: str=None):
-    fileContent = readFile(in_file)
-    escapedArgument = escapeLatexCharacters(argument)
-    replacement = field.value + "{" + escapedArgument + "}"
-    if argument != escapedArgument:
-        print(f"LaTeX -> Escaped {argument} -> {escapedArgument}")
-    pattern = re.compile(field.value + "{.*}")
-    updatedContent = pattern.sub(replacement, fileContent)
-    if out_file is None:
-        out_file = in_file
-    writeFile(out_file, updatedContent)
+    document = LaTeXCommandsDocument(in_file)
+    document.updateField(field, argument)
+    document.save(in_file if out_file is None else out_file)
 
 def isSkillInJobDescription(skill: dict, jobDetails: str) -> int:
     skillMentionedScore = 0
@@ -162,19 +462,24 @@ def isSkillInJobDescription(skill: dict, jobDetails: str) -> int:
     skillOnlyMentioned = 0
     incrementBy = 0
     jobDetailsLS = jobDetails.lower().strip()
+    isDebugEnabled = logger.isEnabledFor(logging.DEBUG)
     # Can return immediately if marked as generic
-    print(f"--- Checking skill \"{skill['skill']}\" ---")
+    if isDebugEnabled:
+        logger.debug(f"--- Checking skill \"{skill['skill']}\" ---")
     if "generic" in skill["area"]:
-        print(f"\tMarked as the generic skill, adding +1 to score.")
+        if isDebugEnabled:
+            logger.debug(f"\tMarked as the generic skill, adding +1 to score.")
         skillAreasMentioned += 1
     # Primary - precise skill match including small and capital letters
     incrementBy = jobDetails.count(skill["skill"]) if skill["is_case_sensitive"] else jobDetailsLS.count(skill["skill"].lower())
-    print(f"\t\"{skill['skill']}\" mentioned {incrementBy} times.")
+    if isDebugEnabled:
+        logger.debug(f"\t\"{skill['skill']}\" mentioned {incrementBy} times.")
     skillOnlyMentioned += incrementBy
     # Secondary - precise alias match including small and capital letters
     for alias in skill["alias"]:
         incrementBy = jobDetails.count(alias) if skill["is_case_sensitive"] else jobDetailsLS.count(alias.lower())
-        print(f"\tAlias \"{alias}\" mentioned {incrementBy} times.")
+        if isDebugEnabled:
+            logger.debug(f"\tAlias \"{alias}\" mentioned {incrementBy} times.")
         skillAliasMentioned += incrementBy
     # Tertiary - non-precise area match ignoring small and capital letters
     for area in skill["area"]:
@@ -182,55 +487,219 @@ def isSkillInJobDescription(skill: dict, jobDetails: str) -> int:
         if area == "generic":
             continue
         incrementBy = jobDetailsLS.count(area.lower())
-        print(f"\tArea \"{area}\" mentioned {incrementBy} times.")
+        if isDebugEnabled:
+            logger.debug(f"\tArea \"{area}\" mentioned {incrementBy} times.")
         skillAreasMentioned += incrementBy
     skillMentionedScore = (skillOnlyMentioned * SCORE_MULTIPLIER_SKILL_MENTIONED +
                             skillAliasMentioned * SCORE_MULTIPLIER_SKILL_ALIAS_MENTIONED + 
                             skillAreasMentioned * SCORE_MULTIPLIER_SKILL_AREA_MENTIONED)
-    print(f"\tScore: {skillMentionedScore}.\n" + ("-" * 66))
+    if isDebugEnabled:
+        logger.debug(f"\tScore: {skillMentionedScore}.\n" + ("-" * 66))
     return skillMentionedScore
 
-def updateJobSkills(jobDetails: str, skills_json_file: str, skills_latex_file: str):
-    skills = readJsonFile(skills_json_file)
-    if skills is None:
+def getSkillsMatcher(skills_json_file: str) -> SkillsMatcher:
+    from Utils.Skills.SkillsDatabase import getSkillsDatabase
+    skillsDatabase = getSkillsDatabase(skills_json_file)
+    return skillsDatabase.matcher if skillsDatabase is not None else None
+
+def updateJobSkills(jobDetails: str, skills_json_file: str, skills_latex_file: str, skillScores: list[int]=None,
+                    maxSkillsPerSection: int=None):
+    matcher = getSkillsMatcher(skills_json_file)
+    if matcher is None:
         # Nothing to do, return
         return
     else:
-        # Erase file content
-        f = open(skills_latex_file, "w")
-        f.close()
-        for skillSection in skills.keys():
-            print(f"Updating section {skillSection}...")
-            skillDictList = []
-            # skillSection = skills[section.value]
-            for skill in skills[skillSection]:
-                skillMentioned = isSkillInJobDescription(skill, jobDetails)
-                skillLatex = skill["latex"] + "/1" if skillMentioned > 0 else skill["latex"]
-                skillLatex = "{" + skillLatex + "}"
-                skillDictList.append({"latex": skillLatex, "score": skillMentioned})
-            sortedSkillDictList = sorted(skillDictList, key=lambda x: x["score"], reverse=True)
-            sortedSkillList = [x["latex"] for x in sortedSkillDictList]
-            with open(skills_latex_file, "a") as file:
-                file.write("\\newcommand\\" + skillSection + "{\n")
-                file.write(",\n".join(sortedSkillList))
-                file.write("}\n\n")
-
-def rebuildCVs(cv_dir : str, recipient_file: str) -> None:
-    companyName = getField(LaTeXResumeFields.POSITION_COMPANY, recipient_file)
-    companyNameLC = escapeFileSystemCharacters(companyName.lower())
-    locationName = getField(LaTeXResumeFields.POSITION_LOCATION, recipient_file)
-    locationNameLC = escapeFileSystemCharacters(locationName.lower())
-    jobName = getField(LaTeXResumeFields.POSITION_NAME, recipient_file)
-    jobNameLC = escapeFileSystemCharacters(jobName.lower())
-    date = datetime.now().strftime("%Y%m%d")
-    cmd = ['gmake', 'all', 
-           f'company={companyNameLC}',
-           f'location={locationNameLC}', 
-           f'job={jobNameLC}',
-           f'timestamp={date}'
-    ]
-    print("Running gmake command in the LaTeX CV directory...")
-    subprocess.run(args=cmd, cwd=cv_dir)
+        # Reuse the precomputed score matrix row if provided
+        if skillScores is None:
+            skillScores = matcher.scoreJob(jobDetails)
+        logger.debug(f"Updating sections {', '.join(matcher.sections)}...")
+        writeFileAtomic(skills_latex_file, renderSkillsLatex(matcher, skillScores, maxSkillsPerSection))
+
+def rebuildCVs(cv_dir : str, recipient_file: str, skills_file: str=None, buildCache: BuildCache=None, forceRebuild: bool=False,
+                template_dir: str=None, recipients: LaTeXCommandsDocument=None, jobLabel: str=None) -> list[str]:
+    # Serve the fields from the already parsed recipients document if provided
+    if recipients is None:
+        recipients = LaTeXCommandsDocument(recipient_file)
+    makeVariables = getMakeVariables(recipients)
+    date = makeVariables["timestamp"]
+    cmd = ['gmake', 'all'] + [f'{name}={value}' for name, value in makeVariables.items()]
+    cacheKey = None
+    if buildCache is not None:
+        # Template sources are hashed in template_dir, e.g. the original CV_DIR of a build workspace copy
+        dataFiles = [recipient_file] + ([skills_file] if skills_file else [])
+        templateDigest = buildCache.getTemplateDigest(template_dir or cv_dir,
+                                                        [os.path.relpath(file, cv_dir) for file in dataFiles])
+        cacheKey = buildCache.computeKey(templateDigest, [recipients.content] + [readFile(file) for file in dataFiles[1:]],
+                                            getCacheKeyVariables(makeVariables))
+        if not forceRebuild:
+            with instrumentation.timer(STAGE_BUILD_CACHE_RESTORE, jobLabel):
+                restoredPDFs = buildCache.restore(cacheKey, cv_dir, date)
+            if restoredPDFs:
+                logger.info(f"Build cache hit, reused {len(restoredPDFs)} PDF file(s) without running gmake.")
+                instrumentation.count("build_cache_hits")
+                return restoredPDFs
+    pdfsBefore = snapshotPDFs(cv_dir)
+    logger.info("Running gmake command in the LaTeX CV directory...")
+    # LaTeX output is verbose, keep it at DEBUG unless the build fails
+    with instrumentation.timer(STAGE_GMAKE, jobLabel):
+        result = subprocess.run(args=cmd, cwd=cv_dir, capture_output=True, text=True)
+    instrumentation.count("gmake_runs")
+    logger.debug(result.stdout)
+    if result.returncode != 0:
+        # PDFs left behind by a failed build may be partial, never cache nor report them
+        logger.error(f"gmake failed with the exit code {result.returncode}:\n{result.stdout[-2000:]}{result.stderr[-2000:]}")
+        return []
+    builtPDFs = findBuiltPDFs(cv_dir, pdfsBefore)
+    if cacheKey is not None:
+        buildCache.store(cacheKey, cv_dir, builtPDFs, date)
+    return builtPDFs
+
+def getMakeVariables(recipients: LaTeXCommandsDocument) -> dict[str, str]:
+    return {
+        "company": escapeFileSystemCharacters(recipients.getField(LaTeXResumeFields.POSITION_COMPANY).lower()),
+        "location": escapeFileSystemCharacters(recipients.getField(LaTeXResumeFields.POSITION_LOCATION).lower()),
+        "job": escapeFileSystemCharacters(recipients.getField(LaTeXResumeFields.POSITION_NAME).lower()),
+        "timestamp": datetime.now().strftime("%Y%m%d")
+    }
+
+def getCacheKeyVariables(makeVariables: dict[str, str]) -> dict[str, str]:
+    # The timestamp only names the PDF files, cached PDFs are renamed on restore
+    return {name: value for name, value in makeVariables.items() if name != "timestamp"}
+
+def rebuildCVOnServer(job: Job, skillScores: list[int], buildServer: "LaTeXBuildServer", cv_dir: str, recipient_file: str,
+                        skills_file: str, skills_json_file: str, buildCache: BuildCache=None, forceRebuild: bool=False,
+                        maxSkillsPerSection: int=None) -> list[str]:
+    """Build the CV of the job on the warm LaTeX build server. The data files are rendered in memory and sent to a resident worker,
+    the CV_DIR files are not modified, the built PDFs are copied to CV_DIR.
+
+    Args:
+        job (Job): job to build the CV for
+        skillScores (list[int]): skill scores of the job, scored again if None
+        buildServer (LaTeXBuildServer): running build server
+        cv_dir (str): path to the CV Templates directory
+        recipient_file (str): name of the LaTeX recipient file in the data directory
+        skills_file (str): name of the LaTeX skills file in the data directory
+        skills_json_file (str): path to the JSON skills file
+        buildCache (BuildCache, optional): cache of the built PDFs. Defaults to None.
+        forceRebuild (bool, optional): rebuild the CV, ignoring cache hits. Defaults to False.
+        maxSkillsPerSection (int, optional): maximum number of skills in a skills section. Defaults to None (all skills).
+
+    Returns:
+        list[str]: paths of the built PDF files
+    """
+    startTime = time.perf_counter()
+    logger.info(f"===== Building CV for {job.job} at {job.company} in {job.location} on the build server. =====")
+    recipientsPath = os.path.join("data", recipient_file)
+    skillsPath = os.path.join("data", skills_file)
+    with instrumentation.timer(STAGE_FILE_WRITES, job.label):
+        recipients = LaTeXCommandsDocument(os.path.join(cv_dir, recipientsPath))
+        updateRecipientFields(job, recipients)
+        matcher = getSkillsMatcher(skills_json_file) if job.details else None
+        if matcher is not None:
+            logger.debug("LaTeX -> Highlighting skills according to the job details.")
+            if skillScores is None:
+                skillScores = matcher.scoreJob(job.details)
+            skillsContent = renderSkillsLatex(matcher, skillScores, maxSkillsPerSection)
+        else:
+            skillsContent = readFile(os.path.join(cv_dir, skillsPath))
+    runJournal.record(job, JOURNAL_STAGE_RENDERED)
+    makeVariables = getMakeVariables(recipients)
+    cacheKey = None
+    if buildCache is not None:
+        templateDigest = buildCache.getTemplateDigest(cv_dir, [recipientsPath, skillsPath])
+        cacheKey = buildCache.computeKey(templateDigest, [recipients.content, skillsContent], getCacheKeyVariables(makeVariables))
+        if not forceRebuild:
+            with instrumentation.timer(STAGE_BUILD_CACHE_RESTORE, job.label):
+                builtPDFs = buildCache.restore(cacheKey, cv_dir, makeVariables["timestamp"])
+            if builtPDFs:
+                logger.info(f"Build cache hit, reused {len(builtPDFs)} PDF file(s) without running gmake.")
+                instrumentation.count("build_cache_hits")
+                logJobProcessed(job, skillScores, builtPDFs, time.perf_counter() - startTime)
+                return builtPDFs
+    with instrumentation.timer(STAGE_GMAKE, job.label):
+        builtPDFs = buildServer.build({recipientsPath: recipients.content, skillsPath: skillsContent}, makeVariables, cv_dir)
+    instrumentation.count("gmake_runs")
+    if cacheKey is not None and builtPDFs:
+        buildCache.store(cacheKey, cv_dir, builtPDFs, makeVariables["timestamp"])
+    logJobProcessed(job, skillScores, builtPDFs, time.perf_counter() - startTime)
+    return builtPDFs
+
+def reportCollapsedJobs(collapsedJobs: list[tuple[Job, Job, str]], builtJobs: list[tuple[Job, list[str]]]):
+    """Add the duplicate jobs and the PDFs of the jobs they reuse to the run report.
+
+    Args:
+        collapsedJobs (list[tuple[Job, Job, str]]): (duplicate, duplicated job, reason) of the jobs not built
+        builtJobs (list[tuple[Job, list[str]]]): built jobs and their PDF files
+    """
+    builtPDFsByJob = {id(job): pdfs for job, pdfs in builtJobs}
+    for job, duplicatedJob, reason in collapsedJobs:
+        reusedPDFs = [os.path.basename(pdf) for pdf in builtPDFsByJob.get(id(duplicatedJob)) or []]
+        instrumentation.addToReport("collapsedJobs", {"job": job.label, "url": job.url, "duplicateOf": duplicatedJob.label,
+                                                        "duplicateOfUrl": duplicatedJob.url, "reason": reason, "pdfs": reusedPDFs})
+    instrumentation.count("jobs_collapsed", len(collapsedJobs))
+
+def logJobProcessed(job: Job, skillScores: list[int], builtPDFs: list[str], duration: float):
+    if builtPDFs:
+        runJournal.record(job, JOURNAL_STAGE_BUILT, pdfs=[os.path.abspath(pdf) for pdf in builtPDFs])
+    logEvent(logger, "job_processed", company=job.company, job=job.job, location=job.location, url=job.url,
+                highlightedSkills=sum(score > 0 for score in skillScores) if skillScores else 0,
+                pdfs=[os.path.basename(pdf) for pdf in builtPDFs or []], durationSeconds=round(duration, 3))
+
+def rebuildCVInWorkspace(job: Job, skillScores: list[int], cv_dir: str, recipient_file: str, skills_file: str, skills_json_file: str,
+                            buildCache: BuildCache=None, forceRebuild: bool=False, maxSkillsPerSection: int=None) -> list[str]:
+    startTime = time.perf_counter()
+    with BuildWorkspace(cv_dir) as workspace:
+        logger.info(f"===== Building CV for {job.job} at {job.company} in {job.location} in {workspace.root}. =====")
+        workspaceRecipientsFile = workspace.path("data", recipient_file)
+        workspaceSkillsFile = workspace.path("data", skills_file)
+        recipients = updateCVFiles(job, workspaceRecipientsFile, workspaceSkillsFile, skills_json_file, skillScores, maxSkillsPerSection)
+        isBuilt = rebuildCVs(workspace.root, workspaceRecipientsFile, workspaceSkillsFile, buildCache, forceRebuild,
+                                template_dir=cv_dir, recipients=recipients, jobLabel=job.label)
+        builtPDFs = workspace.collectPDFs() if isBuilt else []
+    logJobProcessed(job, skillScores, builtPDFs, time.perf_counter() - startTime)
+    return builtPDFs
+
+def rebuildCVsInParallel(savedJobs: list[Job], skillScoreMatrix: list[list[int]], cv_dir: str,
+                            recipient_file: str, skills_file: str, skills_json_file: str, buildJobs: int,
+                            buildCache: BuildCache=None, forceRebuild: bool=False, maxSkillsPerSection: int=None,
+                            buildServer: "LaTeXBuildServer"=None) -> list[list[str]]:
+    """Build CVs for all jobs in parallel, each job in its own copy of the CV Templates directory or on the build server.
+    The shared CV_DIR files are not modified, the built PDFs are copied back to CV_DIR.
+
+    Args:
+        savedJobs (list[Job]): jobs to build CVs for
+        skillScoreMatrix (list[list[int]]): jobs x skills score matrix
+        cv_dir (str): path to the CV Templates directory
+        recipient_file (str): name of the LaTeX recipient file in the data directory
+        skills_file (str): name of the LaTeX skills file in the data directory
+        skills_json_file (str): path to the JSON skills file
+        buildJobs (int): number of parallel gmake invocations
+        buildCache (BuildCache, optional): cache of the built PDFs. Defaults to None.
+        forceRebuild (bool, optional): rebuild all CVs, ignoring cache hits. Defaults to False.
+        maxSkillsPerSection (int, optional): maximum number of skills in a skills section. Defaults to None (all skills).
+        buildServer (LaTeXBuildServer, optional): warm build server used instead of the workspaces. Defaults to None.
+
+    Returns:
+        list[list[str]]: paths of the PDF files built for each job
+    """
+    builtPDFs = []
+    # Workers only wait for the gmake processes, hence threads are enough to keep the processes running in parallel
+    with ThreadPoolExecutor(max_workers=buildJobs) as executor:
+        if buildServer is not None:
+            futures = [executor.submit(rebuildCVOnServer, job, skillScores, buildServer, cv_dir, recipient_file, skills_file,
+                                        skills_json_file, buildCache, forceRebuild, maxSkillsPerSection)
+                        for job, skillScores in zip(savedJobs, skillScoreMatrix)]
+        else:
+            futures = [executor.submit(rebuildCVInWorkspace, job, skillScores, cv_dir, recipient_file, skills_file, skills_json_file,
+                                        buildCache, forceRebuild, maxSkillsPerSection)
+                        for job, skillScores in zip(savedJobs, skillScoreMatrix)]
+        for job, future in zip(savedJobs, futures):
+            try:
+                builtPDFs.append(future.result())
+            except Exception as e:
+                logger.exception(f"Failed to build CV for {job.job} at {job.company}: {e}")
+                builtPDFs.append([])
+    return builtPDFs
 
 if __name__ == "__main__":
     main()
\ No newline at end of file